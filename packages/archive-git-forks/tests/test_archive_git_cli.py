@@ -31,6 +31,7 @@ class TestFetchCommand:
             {"name": "repo1", "clone_url": "https://github.com/testuser/repo1.git"},
             {"name": "repo2", "clone_url": "https://github.com/testuser/repo2.git"},
         ]
+        mock_archiver.export_repos.side_effect = lambda repos, filename: len(list(repos))
 
         # Run command
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -85,6 +86,7 @@ class TestProcessCommand:
             mock_archiver = MagicMock()
             mock_archiver_class.return_value = mock_archiver
             mock_archiver.load_selected_repos.return_value = repos_data
+            mock_archiver.count_repos.return_value = len(repos_data)
             mock_archiver.process_repos.return_value = {
                 "successful": ["repo1", "repo2"],
                 "failed": [],
@@ -103,6 +105,25 @@ class TestProcessCommand:
             assert "✓ repo1" in result.output
             assert "✓ repo2" in result.output
 
+    @patch("hildie.hildie_archive_git_forks.main.get_github_username", return_value="testuser")
+    @patch("hildie.hildie_archive_git_forks.main.ArchiveForks")
+    def test_process_falls_back_to_legacy_flat_file(
+        self, mock_archiver_class, _username, tmp_path, monkeypatch
+    ):
+        """Test that a forked_repos.json from an older fetch is still found."""
+        mock_archiver = mock_archiver_class.return_value
+        mock_archiver.load_selected_repos.return_value = [{"name": "repo1", "clone_url": "u"}]
+        mock_archiver.count_repos.return_value = 1
+        mock_archiver.process_repos.return_value = {"successful": ["repo1"], "failed": []}
+
+        monkeypatch.chdir(tmp_path)
+        Path("forked_repos.json").write_text('[{"name": "repo1", "clone_url": "u"}]')
+        result = self.runner.invoke(cli, ["process"], env={"GITHUB_TOKEN": "token123"})
+
+        assert result.exit_code == 0, result.output
+        mock_archiver.load_selected_repos.assert_called_once_with("forked_repos.json")
+        assert "Processing 1 selected repositories from forked_repos.json" in result.output
+
     def test_process_command_missing_file(self):
         """Test process command with missing repos file."""
         result = self.runner.invoke(
@@ -114,6 +135,79 @@ class TestProcessCommand:
         assert result.exit_code != 0
 
 
+class TestDeleteCommand:
+    """Test the delete command."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+
+    @patch("hildie.hildie_archive_git_forks.main.get_github_username", return_value="testuser")
+    @patch("hildie.hildie_archive_git_forks.main.ArchiveForks")
+    def test_delete_falls_back_to_legacy_flat_file(
+        self, mock_archiver_class, _username, tmp_path, monkeypatch
+    ):
+        """Test that delete also reads a forked_repos.json from an older fetch."""
+        mock_archiver = mock_archiver_class.return_value
+        mock_archiver.load_repos.return_value = iter([])
+
+        monkeypatch.chdir(tmp_path)
+        Path("forked_repos.json").write_text("[]")
+        result = self.runner.invoke(cli, ["delete"], env={"GITHUB_TOKEN": "token123"})
+
+        assert "No repos to delete" in result.output
+        mock_archiver.load_repos.assert_called_once_with("forked_repos.json")
+
+    @patch("hildie.hildie_archive_git_forks.main.get_github_username", return_value="testuser")
+    @patch("hildie.hildie_archive_git_forks.main.ArchiveForks")
+    def test_delete_plan_only_deletes_live_repos(self, mock_archiver_class, _username):
+        """Test that --plan skips repos that are already gone."""
+        repos = [{"name": "live"}, {"name": "gone"}]
+        mock_archiver = mock_archiver_class.return_value
+        mock_archiver.load_repos.side_effect = lambda f: iter(repos)
+        mock_archiver.plan_deletes.return_value = {
+            "live": ["live"],
+            "gone": ["gone"],
+            "failed": [],
+            "unarchived": [],
+        }
+        mock_archiver.delete_repos.side_effect = lambda r, journal, workers: {
+            "deleted": [repo["name"] for repo in r],
+            "already_gone": [],
+            "failed": [],
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            args = ["delete", "--force", "--plan", "--workers", "3"]
+            args += ["--journal-file", str(Path(tmpdir) / "journal.jsonl")]
+            result = self.runner.invoke(cli, args, env={"GITHUB_TOKEN": "token123"})
+
+        assert result.exit_code == 0, result.output
+        assert "Plan: 1 live, 1 already gone" in result.output
+        assert "✓ live deleted" in result.output
+        assert "✓ gone deleted" not in result.output
+        assert mock_archiver.delete_repos.call_args.kwargs["workers"] == 3
+
+    @patch("hildie.hildie_archive_git_forks.main.get_github_username", return_value="testuser")
+    @patch("hildie.hildie_archive_git_forks.main.ArchiveForks")
+    def test_delete_dry_run_deletes_nothing(self, mock_archiver_class, _username):
+        """Test that --dry-run prints the plan and stops."""
+        mock_archiver = mock_archiver_class.return_value
+        mock_archiver.load_repos.side_effect = lambda f: iter([{"name": "live"}])
+        mock_archiver.plan_deletes.return_value = {
+            "live": ["live"],
+            "gone": [],
+            "failed": [],
+            "unarchived": ["live"],
+        }
+
+        result = self.runner.invoke(cli, ["delete", "--dry-run"], env={"GITHUB_TOKEN": "token123"})
+
+        assert result.exit_code == 0, result.output
+        assert "live has no local archive" in result.output
+        mock_archiver.delete_repos.assert_not_called()
+
+
 class TestCleanupCommand:
     """Test the cleanup command."""
 
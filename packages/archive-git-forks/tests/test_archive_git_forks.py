@@ -1,6 +1,108 @@
 """Example tests for archive-git-forks."""
 
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from hildie.hildie_archive_git_forks.archiver import ArchiveForks
+
 
 def test_example():
     """Example test."""
     assert True
+
+
+def make_page(repos, next_url=None):
+    """Build a repos listing response with an optional Link: rel="next"."""
+    response = MagicMock()
+    response.json.return_value = repos
+    response.links = {"next": {"url": next_url}} if next_url else {}
+    return response
+
+
+class TestStreaming:
+    """Test streaming fetch, export and load."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "repos.jsonl"
+        self.manager = ArchiveForks("testuser", "token")
+        self.manager.scheduler = MagicMock()
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_fetch_follows_link_header_and_trims(self):
+        """Test that fetch pages via Link headers and yields trimmed forks only."""
+        self.manager.scheduler.get.side_effect = [
+            make_page(
+                [
+                    {"name": "a", "clone_url": "u/a", "updated_at": "2", "fork": True, "x": 1},
+                    {"name": "own", "clone_url": "u/own", "fork": False},
+                ],
+                next_url="https://api.github.com/page2",
+            ),
+            make_page([{"name": "b", "clone_url": "u/b", "updated_at": "1", "fork": True}]),
+        ]
+
+        repos = self.manager.fetch_forked_repos()
+        assert self.manager.scheduler.get.call_count == 0
+        assert next(repos) == {"name": "a", "clone_url": "u/a", "updated_at": "2"}
+        assert self.manager.scheduler.get.call_count == 1
+
+        assert list(repos) == [{"name": "b", "clone_url": "u/b", "updated_at": "1"}]
+        assert self.manager.scheduler.get.call_args[0][0] == "https://api.github.com/page2"
+
+    def test_export_writes_json_lines(self):
+        """Test that export writes one record per line and returns the count."""
+        repos = ({"name": f"r{i}", "clone_url": f"u/r{i}"} for i in range(3))
+
+        count = self.manager.export_repos(repos, str(self.path))
+
+        lines = self.path.read_text().splitlines()
+        assert count == 3
+        assert [json.loads(line)["name"] for line in lines] == ["r0", "r1", "r2"]
+
+    def test_load_round_trip_is_lazy(self):
+        """Test that load yields records one at a time."""
+        self.manager.export_repos([{"name": "r0", "clone_url": "u"}] * 5, str(self.path))
+
+        repos = self.manager.load_repos(str(self.path))
+
+        assert next(repos)["name"] == "r0"
+        assert len(list(repos)) == 4
+
+    def test_load_skips_blank_lines(self):
+        """Test that blank lines left by hand editing are ignored."""
+        self.path.write_text(
+            '\n{"name": "a", "clone_url": "u"}\n\n{"name": "b", "clone_url": "u"}\n'
+        )
+
+        assert [r["name"] for r in self.manager.load_repos(str(self.path))] == ["a", "b"]
+
+    def test_load_legacy_json_array(self):
+        """Test that files in the old JSON array format still load."""
+        self.path.write_text(json.dumps([{"name": "a", "clone_url": "u"}], indent=2))
+
+        assert [r["name"] for r in self.manager.load_repos(str(self.path))] == ["a"]
+
+    def test_count_without_decoding(self):
+        """Test that counting skips blank lines and never decodes a record."""
+        self.path.write_text('\n{"name": "a"}\n\nnot json\n{"name": "b"}')
+        assert self.manager.count_repos(str(self.path)) == 3
+
+        self.path.write_text(json.dumps([{"name": "a"}, {"name": "b"}], indent=2))
+        assert self.manager.count_repos(str(self.path)) == 2
+
+        self.path.write_text("")
+        assert self.manager.count_repos(str(self.path)) == 0
+
+    def test_load_missing_file_raises_immediately(self):
+        """Test that a missing file raises before iteration starts."""
+        with pytest.raises(FileNotFoundError, match="No such file"):
+            self.manager.load_repos(str(self.path))
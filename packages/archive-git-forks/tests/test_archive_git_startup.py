@@ -0,0 +1,43 @@
+"""Import regression tests for the archive-git-forks entry point."""
+
+ENTRY_POINT = "hildie.hildie_archive_git_forks.main"
+
+# Only needed by commands that talk to GitHub or verify archives
+LAZY_MODULES = {"requests", "urllib3", "ssl", "multiprocessing", "numpy"}
+
+# The entry point's import time, relative to click's, which it cannot avoid.
+# It is about 2x; importing requests eagerly pushed it past 6x.
+MAX_CLICK_RATIO = 4
+
+
+class TestStartup:
+    """Test that the CLI defers its network and process pool dependencies."""
+
+    def test_heavy_modules_not_imported(self, modules_after):
+        """Test that importing the entry point leaves requests, ssl and friends alone."""
+        loaded = modules_after(f"import {ENTRY_POINT}")
+        assert not loaded & LAZY_MODULES, sorted(loaded & LAZY_MODULES)
+
+    def test_help_does_not_import_requests(self, modules_after):
+        """Test that a command that never reaches GitHub does not load requests."""
+        loaded = modules_after(
+            "from hildie.hildie_archive_git_forks.main import cli\n"
+            "cli(['--help'], standalone_mode=False)"
+        )
+        assert "requests" not in loaded
+
+    def test_requests_loaded_with_archive_forks(self, modules_after):
+        """Test that requests is imported once an ArchiveForks is built."""
+        loaded = modules_after(
+            "from hildie.hildie_archive_git_forks.archiver import ArchiveForks\n"
+            "ArchiveForks('u', 't', 'work', 'archive')"
+        )
+        assert "requests" in loaded
+        assert "multiprocessing" not in loaded
+
+    def test_import_time_relative_to_click(self, import_times):
+        """Test that -X importtime keeps the entry point within a multiple of click."""
+        # Best of three, to ride out a cold disk cache or a busy machine
+        runs = [import_times(ENTRY_POINT) for _ in range(3)]
+        ratio = min(times[ENTRY_POINT] / times["click"] for times in runs)
+        assert ratio < MAX_CLICK_RATIO, f"import took {ratio:.1f}x click's"
@@ -0,0 +1,114 @@
+"""Tests for the local GitHub stand-in and the throughput benchmarks."""
+
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+import requests
+
+from hildie.hildie_archive_git_forks.archiver import ArchiveForks
+from hildie.hildie_archive_git_forks.testing import FakeGitHub, format_benchmarks, run_benchmarks
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+class TestFakeGitHub:
+    """Test ArchiveForks end to end against FakeGitHub."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.fake = FakeGitHub(self.root / "remote").start()
+        self.fake.add_repos(3)
+        self.fake.add_repo("own-project", fork=False)
+        self.manager = ArchiveForks(
+            self.fake.username,
+            "token",
+            self.root / "work",
+            self.root / "archive",
+            api_url=self.fake.url,
+        )
+        self.manager.setup_directories()
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.fake.stop()
+        self.tmpdir.cleanup()
+
+    def test_listing_paginates_with_link_header(self):
+        """Test that the listing pages and advertises rel="next"."""
+        url = f"{self.fake.url}/users/{self.fake.username}/repos?per_page=2"
+
+        first = requests.get(url, timeout=5)
+        second = requests.get(first.links["next"]["url"], timeout=5)
+
+        assert len(first.json()) == 2
+        assert len(second.json()) == 2
+        assert "next" not in second.links
+
+    def test_fetch_process_delete_cycle(self):
+        """Test the full fetch, process and delete cycle offline."""
+        repos = list(self.manager.fetch_forked_repos())
+        assert [r["name"] for r in repos] == ["fork-0000", "fork-0001", "fork-0002"]
+
+        results = self.manager.process_repos(repos)
+        assert results["successful"] == ["fork-0000", "fork-0001", "fork-0002"]
+        assert all(self.fake.repos[r["name"]]["private"] for r in repos)
+        with zipfile.ZipFile(self.manager.archive_path("fork-0000")) as archive:
+            assert "file_0000.txt" in archive.namelist()
+
+        results = self.manager.delete_repos(repos)
+        assert results["deleted"] == ["fork-0000", "fork-0001", "fork-0002"]
+        assert [r["name"] for r in self.fake.live_repos()] == ["own-project"]
+
+    def test_plan_and_concurrent_delete(self):
+        """Test that plan_deletes sorts repos and 404s are reported separately."""
+        repos = list(self.manager.fetch_forked_repos())
+        self.manager.archive_repo(self.root / "remote" / "fork-0000.git", "fork-0000")
+        self.manager.delete_repo("fork-0001")
+
+        plan = self.manager.plan_deletes(repos + [{"name": "never-existed"}], workers=4)
+        assert plan["live"] == ["fork-0000", "fork-0002"]
+        assert plan["gone"] == ["fork-0001", "never-existed"]
+        assert plan["unarchived"] == ["fork-0002"]
+
+        results = self.manager.delete_repos(repos, workers=4)
+        assert results["deleted"] == ["fork-0000", "fork-0002"]
+        assert results["already_gone"] == ["fork-0001"]
+        assert results["failed"] == []
+
+    def test_rate_limit_is_waited_out(self):
+        """Test that the scheduler waits for the window reset instead of failing."""
+        self.fake.rate_limit = 1
+        self.fake.rate_window = 0.2
+
+        self.manager.make_private("fork-0000")
+        self.manager.make_private("fork-0001")
+
+        assert self.fake.repos["fork-0001"]["private"]
+
+
+class TestBenchmarks:
+    """Smoke test the benchmark suite."""
+
+    def test_run_benchmarks(self):
+        """Test that every operation reports a repos/minute figure."""
+        rows = run_benchmarks(repo_count=3, concurrency=(1, 2), latency=0.0)
+
+        assert [(r["operation"], r["concurrency"]) for r in rows] == [
+            ("fetch", 1),
+            ("process", 1),
+            ("process", 2),
+            ("delete", 1),
+            ("delete", 2),
+        ]
+        assert all(r["repos"] == 3 and r["repos_per_minute"] > 0 for r in rows)
+
+        table = format_benchmarks(rows).splitlines()
+        assert table[0].split() == ["operation", "concurrency", "repos", "seconds", "repos/min"]
+        assert [line.split()[:3] for line in table[1:]] == [
+            [r["operation"], str(r["concurrency"]), "3"] for r in rows
+        ]
@@ -0,0 +1,140 @@
+"""Tests for the archive-git-forks stage journal."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hildie.hildie_archive_git_forks.archiver import ArchiveForks
+from hildie.hildie_archive_git_forks.journal import ARCHIVED, CLONED, DELETED, PRIVATISED, Journal
+
+
+class TestJournal:
+    """Test journal persistence."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "journal.jsonl"
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_record_and_reload(self):
+        """Test that recorded stages survive a reload."""
+        journal = Journal(str(self.path))
+        journal.record("repo1", CLONED)
+        journal.record("repo1", ARCHIVED)
+
+        reloaded = Journal(str(self.path))
+        assert reloaded.completed("repo1") == {CLONED, ARCHIVED}
+        assert reloaded.completed("repo2") == set()
+
+    def test_without_resume_ignores_entries(self):
+        """Test that a fresh journal ignores earlier entries but keeps them on disk."""
+        Journal(str(self.path)).record("repo1", CLONED)
+
+        fresh = Journal(str(self.path), resume=False)
+        assert fresh.completed("repo1") == set()
+        assert Journal(str(self.path)).is_done("repo1", CLONED)
+
+    def test_torn_line_ignored(self):
+        """Test that a partial trailing line from a crash is skipped."""
+        Journal(str(self.path)).record("repo1", CLONED)
+        with open(self.path, "a") as f:
+            f.write('{"name": "repo1", "sta')
+
+        assert Journal(str(self.path)).completed("repo1") == {CLONED}
+
+    def test_unknown_stage_rejected(self):
+        """Test that unknown stages raise ValueError."""
+        journal = Journal(str(self.path))
+        with pytest.raises(ValueError, match="Unknown stage: bogus"):
+            journal.record("repo1", "bogus")
+
+
+class TestResume:
+    """Test that process_repos and delete_repos skip journaled stages."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = Path(self.tmpdir.name)
+        self.manager = ArchiveForks("testuser", "token", root / "work", root / "archive")
+        self.manager.setup_directories()
+        self.journal = Journal(str(root / "journal.jsonl"))
+        self.repos = [{"name": "repo1", "clone_url": "https://github.com/testuser/repo1.git"}]
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_process_records_stages(self):
+        """Test that each completed stage is journaled."""
+        with (
+            patch.object(self.manager, "clone_repo"),
+            patch.object(self.manager, "archive_repo"),
+            patch.object(self.manager, "make_private"),
+        ):
+            results = self.manager.process_repos(self.repos, journal=self.journal)
+
+        assert results["successful"] == ["repo1"]
+        assert self.journal.completed("repo1") == {CLONED, ARCHIVED, PRIVATISED}
+
+    def test_process_skips_finished_stages(self):
+        """Test that archived and privatised repos are not redone."""
+        self.manager.archive_path("repo1").write_bytes(b"zip")
+        for stage in (CLONED, ARCHIVED, PRIVATISED):
+            self.journal.record("repo1", stage)
+
+        with (
+            patch.object(self.manager, "clone_repo") as clone,
+            patch.object(self.manager, "archive_repo") as archive,
+            patch.object(self.manager, "make_private") as make_private,
+        ):
+            results = self.manager.process_repos(self.repos, journal=self.journal)
+
+        assert results["successful"] == ["repo1"]
+        clone.assert_not_called()
+        archive.assert_not_called()
+        make_private.assert_not_called()
+
+    def test_process_resumes_after_clone(self):
+        """Test that a repo cloned before the crash is archived without re-cloning."""
+        (self.manager.work_dir / "repo1").mkdir()
+        self.journal.record("repo1", CLONED)
+
+        with (
+            patch.object(self.manager, "clone_repo") as clone,
+            patch.object(self.manager, "archive_repo") as archive,
+            patch.object(self.manager, "make_private"),
+        ):
+            self.manager.process_repos(self.repos, journal=self.journal)
+
+        clone.assert_not_called()
+        archive.assert_called_once()
+
+    def test_process_reclones_when_clone_missing(self):
+        """Test that a journaled clone is redone if its directory is gone."""
+        self.journal.record("repo1", CLONED)
+
+        with (
+            patch.object(self.manager, "clone_repo") as clone,
+            patch.object(self.manager, "archive_repo"),
+            patch.object(self.manager, "make_private"),
+        ):
+            self.manager.process_repos(self.repos, journal=self.journal)
+
+        clone.assert_called_once()
+
+    def test_delete_skips_deleted(self):
+        """Test that journaled deletes are not reissued."""
+        self.journal.record("repo1", DELETED)
+
+        with patch.object(self.manager, "delete_repo") as delete_repo:
+            results = self.manager.delete_repos(self.repos, journal=self.journal)
+
+        delete_repo.assert_not_called()
+        assert results["deleted"] == ["repo1"]
@@ -0,0 +1,148 @@
+"""Tests for the staged clone/archive/API pipeline."""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from hildie.hildie_archive_git_forks.archiver import ArchiveForks
+from hildie.hildie_archive_git_forks.pipeline import Pipeline
+
+
+class TestPipeline:
+    """Test the generic pipeline."""
+
+    def test_items_pass_through_all_stages(self):
+        """Test that every item is transformed by each stage in turn."""
+        pipeline = Pipeline([("double", lambda x: x * 2, 3), ("inc", lambda x: x + 1, 2)])
+
+        outputs, errors = pipeline.run(range(20))
+
+        assert sorted(outputs) == [x * 2 + 1 for x in range(20)]
+        assert errors == []
+
+    def test_errors_drop_item(self):
+        """Test that a failing item is reported and not passed on."""
+
+        def check(x):
+            if x == 3:
+                raise RuntimeError("bad")
+            return x
+
+        pipeline = Pipeline([("check", check, 2), ("noop", lambda x: x, 1)])
+
+        outputs, errors = pipeline.run(range(5))
+
+        assert sorted(outputs) == [0, 1, 2, 4]
+        assert [(item, stage) for item, stage, _ in errors] == [(3, "check")]
+
+    def test_stages_overlap(self):
+        """Test that separate pools let stages run concurrently."""
+        active = set()
+        overlapped = threading.Event()
+
+        def stage(name):
+            def run(x):
+                active.add(name)
+                if len(active) > 1:
+                    overlapped.set()
+                time.sleep(0.01)
+                active.discard(name)
+                return x
+
+            return run
+
+        Pipeline([("a", stage("a"), 1), ("b", stage("b"), 1)]).run(range(10))
+
+        assert overlapped.is_set()
+
+    def test_metrics(self):
+        """Test per-stage throughput and queue-depth metrics."""
+        pipeline = Pipeline([("a", lambda x: x, 1), ("b", lambda x: x, 2)], queue_size=4)
+        pipeline.run(range(10))
+
+        summary = pipeline.summary()
+
+        assert [stage["name"] for stage in summary] == ["a", "b"]
+        assert summary[0]["processed"] == 10
+        assert summary[1]["workers"] == 2
+        assert 0 <= summary[0]["max_queue_depth"] <= 4
+        assert summary[0]["items_per_second"] > 0
+
+    def test_zero_workers_rejected(self):
+        """Test that a stage with no workers is rejected."""
+        with pytest.raises(ValueError, match="at least one worker"):
+            Pipeline([("a", lambda x: x, 0)])
+
+
+class TestProcessReposPipeline:
+    """Test process_repos on top of the pipeline."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = Path(self.tmpdir.name)
+        self.manager = ArchiveForks("testuser", "token", root / "work", root / "archive")
+        self.repos = [
+            {"name": f"repo{i}", "clone_url": f"https://github.com/testuser/repo{i}.git"}
+            for i in range(8)
+        ]
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_results_keep_input_order(self):
+        """Test that successes and failures are reported in input order."""
+
+        def clone(url, name):
+            if name == "repo5":
+                raise RuntimeError("clone failed")
+            time.sleep(0.001 * (8 - int(name[4:])))
+
+        with (
+            patch.object(self.manager, "clone_repo", side_effect=clone),
+            patch.object(self.manager, "archive_repo"),
+            patch.object(self.manager, "make_private"),
+        ):
+            results = self.manager.process_repos(self.repos, clone_workers=4)
+
+        assert results["successful"] == [f"repo{i}" for i in range(8) if i != 5]
+        assert results["failed"] == [{"name": "repo5", "error": "clone failed"}]
+        assert [stage["name"] for stage in results["metrics"]] == [
+            "clone",
+            "archive",
+            "privatise",
+        ]
+
+    def test_http_error_recorded_as_failure(self):
+        """Test that an HTTP error from the API fails that repo, not the run."""
+
+        def make_private(name):
+            if name == "repo2":
+                raise requests.HTTPError("403 Client Error: Forbidden")
+
+        with (
+            patch.object(self.manager, "clone_repo"),
+            patch.object(self.manager, "archive_repo"),
+            patch.object(self.manager, "make_private", side_effect=make_private),
+        ):
+            results = self.manager.process_repos(self.repos[:4])
+
+        assert results["successful"] == ["repo0", "repo1", "repo3"]
+        assert results["failed"] == [{"name": "repo2", "error": "403 Client Error: Forbidden"}]
+        assert [stage["processed"] for stage in results["metrics"]] == [4, 4, 3]
+
+    def test_unexpected_error_propagates(self):
+        """Test that programming errors are not swallowed."""
+        with (
+            patch.object(self.manager, "clone_repo"),
+            patch.object(self.manager, "archive_repo", side_effect=KeyError("boom")),
+            patch.object(self.manager, "make_private"),
+        ):
+            with pytest.raises(KeyError, match="boom"):
+                self.manager.process_repos(self.repos[:1])
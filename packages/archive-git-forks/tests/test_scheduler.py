@@ -0,0 +1,182 @@
+"""Tests for the rate-limit-aware request scheduler."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from hildie.hildie_archive_git_forks.scheduler import RequestScheduler, TokenBucket
+
+
+class FakeClock:
+    """Clock that only advances when sleep is called."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_response(status_code=200, headers=None, text=""):
+    """Build a response stand-in."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = text
+    return response
+
+
+class TestTokenBucket:
+    """Test the token bucket."""
+
+    def test_burst_then_throttle(self):
+        """Test that a full bucket serves a burst and then waits for refill."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=3, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            bucket.acquire()
+        assert clock.sleeps == []
+
+        bucket.acquire()
+        assert sum(clock.sleeps) == 0.5
+
+    def test_pause_until(self):
+        """Test that a paused bucket waits for the deadline."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10.0, capacity=10, clock=clock, sleep=clock.sleep)
+        bucket.pause_until(clock.now + 30)
+
+        bucket.acquire()
+        assert sum(clock.sleeps) == 30
+
+
+class TestRequestScheduler:
+    """Test retries and header adaptation."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.session = MagicMock()
+        self.scheduler = RequestScheduler(
+            self.session,
+            clock=self.clock,
+            wall_clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+
+    def test_success_passes_through(self):
+        """Test that a 200 is returned without retry."""
+        self.session.request.return_value = make_response(200)
+
+        response = self.scheduler.get("https://api.github.com/user", timeout=10)
+
+        assert response.status_code == 200
+        self.session.request.assert_called_once_with(
+            "GET", "https://api.github.com/user", timeout=10
+        )
+
+    def test_retries_5xx_with_backoff(self):
+        """Test that server errors are retried."""
+        self.session.request.side_effect = [make_response(502), make_response(200)]
+
+        response = self.scheduler.delete("https://api.github.com/repos/u/r")
+
+        assert response.status_code == 200
+        assert self.session.request.call_count == 2
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the final failing response is returned."""
+        self.scheduler.max_retries = 2
+        self.session.request.return_value = make_response(503)
+
+        response = self.scheduler.get("https://api.github.com/x")
+
+        assert response.status_code == 503
+        assert self.session.request.call_count == 3
+
+    def test_retry_after_pauses(self):
+        """Test that a secondary rate limit honours Retry-After."""
+        self.session.request.side_effect = [
+            make_response(403, {"Retry-After": "60"}, "secondary rate limit"),
+            make_response(200),
+        ]
+
+        response = self.scheduler.get("https://api.github.com/x")
+
+        assert response.status_code == 200
+        assert sum(self.clock.sleeps) >= 60
+
+    def test_exhausted_budget_waits_for_reset(self):
+        """Test that X-RateLimit-Remaining 0 pauses until the reset time."""
+        reset = str(self.clock.now + 120)
+        self.session.request.side_effect = [
+            make_response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}),
+            make_response(200),
+        ]
+
+        self.scheduler.get("https://api.github.com/x")
+        self.scheduler.get("https://api.github.com/x")
+
+        assert sum(self.clock.sleeps) >= 120
+
+    def test_permission_403_not_retried(self):
+        """Test that a plain 403 is returned immediately."""
+        self.session.request.return_value = make_response(403, text="Must have admin rights")
+
+        response = self.scheduler.patch("https://api.github.com/x", json={})
+
+        assert response.status_code == 403
+        self.session.request.assert_called_once()
+
+    def test_rate_adapts_to_remaining_budget(self):
+        """Test that the bucket rate spreads remaining requests over the window."""
+        reset = str(self.clock.now + 100)
+        self.session.request.return_value = make_response(
+            200, {"X-RateLimit-Remaining": "50", "X-RateLimit-Reset": reset}
+        )
+
+        self.scheduler.get("https://api.github.com/x")
+
+        assert self.scheduler.bucket.rate == 0.5
+        assert self.scheduler.bucket.tokens <= 50
+
+    def test_connection_error_retried(self):
+        """Test that connection errors are retried."""
+        self.session.request.side_effect = [ConnectionError("reset"), make_response(200)]
+
+        response = self.scheduler.get("https://api.github.com/x")
+
+        assert response.status_code == 200
+
+    def test_per_host_concurrency_cap(self):
+        """Test that no more than per_host requests are in flight to one host."""
+        scheduler = RequestScheduler(self.session, per_host=2, burst=100)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow_request(method, url, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return make_response(200)
+
+        self.session.request.side_effect = slow_request
+        threads = [
+            threading.Thread(target=scheduler.get, args=("https://api.github.com/x",))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert state["peak"] == 2
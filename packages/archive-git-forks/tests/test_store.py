@@ -0,0 +1,203 @@
+"""Tests for the content-addressed archive store."""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from hildie.hildie_archive_git_forks.archiver import ArchiveForks
+from hildie.hildie_archive_git_forks.main import cli
+from hildie.hildie_archive_git_forks.store import BlobStore
+from hildie.hildie_archive_git_forks.testing import make_template_repo
+
+
+def make_tree(root: Path, extra: str = "") -> Path:
+    """Create a small repo-like tree with a shared body and one unique file."""
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "lib.py").write_text("print('shared')\n" * 500)
+    (root / "README.md").write_text("shared readme\n")
+    script = root / "run.sh"
+    script.write_text("#!/bin/sh\necho hi\n")
+    script.chmod(0o755)
+    os.symlink("README.md", root / "LINK.md")
+    if extra:
+        (root / "extra.txt").write_text(extra)
+    return root
+
+
+class TestBlobStore:
+    """Test storing, deduplicating and restoring trees."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.store = BlobStore(self.root / "store")
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_identical_content_stored_once(self):
+        """Test that forks share blobs and only unique files add new ones."""
+        self.store.archive(make_tree(self.root / "a"), "a")
+        first = self.store.usage()
+        self.store.archive(make_tree(self.root / "b", extra="only in b"), "b")
+        second = self.store.usage()
+
+        assert second["blobs"] == first["blobs"] + 1
+        assert second["logical_bytes"] > 2 * first["stored_bytes"]
+
+    def test_restore_round_trip(self):
+        """Test that restore reproduces content, modes and symlinks."""
+        self.store.archive(make_tree(self.root / "a", extra="x"), "a")
+
+        dest = self.store.restore("a", self.root / "restored")
+
+        assert (dest / "src" / "lib.py").read_text() == "print('shared')\n" * 500
+        assert (dest / "extra.txt").read_text() == "x"
+        assert os.access(dest / "run.sh", os.X_OK)
+        assert os.readlink(dest / "LINK.md") == "README.md"
+
+    def test_restore_refuses_paths_outside_dest(self):
+        """Test that a tampered manifest cannot write outside dest."""
+        self.store.archive(make_tree(self.root / "a"), "a")
+        manifest = self.store.manifest_path("a")
+        data = json.loads(manifest.read_text())
+        data["files"][0]["path"] = "../escaped.txt"
+        manifest.write_text(json.dumps(data))
+
+        with pytest.raises(RuntimeError, match="Refusing to restore"):
+            self.store.restore("a", self.root / "restored")
+        assert not (self.root / "escaped.txt").exists()
+
+
+def git(*args, cwd) -> str:
+    """Run git with a fixed identity and return its output."""
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitClones:
+    """Test that real clones of one upstream share their git history."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.upstream = make_template_repo(self.root / "upstream")
+        self.store = BlobStore(self.root / "store")
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def fork(self, name: str) -> Path:
+        """Clone upstream, commit one file and repack, like a fork with one change."""
+        clone = self.root / name
+        git("clone", "-q", "--no-local", str(self.upstream), str(clone), cwd=self.root)
+        (clone / "fork.txt").write_text(f"only in {name}\n")
+        git("add", "-A", cwd=clone)
+        git("commit", "-q", "-m", f"Change in {name}", cwd=clone)
+        git("gc", "-q", cwd=clone)
+        return clone
+
+    def test_forks_share_git_objects(self):
+        """Test that each extra fork stores only its new objects, not a new packfile."""
+        self.store.archive(self.fork("a"), "a")
+        first = self.store.usage()
+        self.store.archive(self.fork("b"), "b")
+        second = self.store.usage()
+
+        a, b = (self.store.load_manifest(name) for name in "ab")
+        new = {o["oid"] for o in b["objects"]} - {o["oid"] for o in a["objects"]}
+        # The commit, its tree and the fork.txt blob
+        assert len(new) == 3
+        assert not any(e["path"].startswith(".git/objects/") for e in b["files"])
+        assert second["stored_bytes"] - first["stored_bytes"] < first["stored_bytes"] / 4
+
+    def test_restore_is_a_working_repo(self):
+        """Test that a restored clone passes fsck and has the fork's history."""
+        clone = self.fork("a")
+        self.store.archive(clone, "a")
+
+        dest = self.store.restore("a", self.root / "restored")
+
+        git("fsck", "--strict", cwd=dest)
+        assert git("rev-parse", "HEAD", cwd=dest) == git("rev-parse", "HEAD", cwd=clone)
+        assert git("status", "--porcelain", cwd=dest) == ""
+        assert (dest / "fork.txt").read_text() == "only in a\n"
+
+
+class TestArchiveFormats:
+    """Test ArchiveForks archive formats and the restore command."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.tree = make_tree(self.root / "repo")
+        self.runner = CliRunner()
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_unknown_format_rejected(self):
+        """Test that an unknown archive format raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown archive format: tar"):
+            ArchiveForks("u", "t", archive_format="tar")
+
+    def test_cas_archive_and_restore_command(self):
+        """Test archiving to the blob store and restoring via the CLI."""
+        archive_dir = self.root / "archive"
+        manager = ArchiveForks("u", "t", archive_dir=archive_dir, archive_format="cas")
+
+        path = manager.archive_repo(self.tree, "repo")
+        assert path == manager.archive_path("repo")
+
+        dest = self.root / "restored"
+        result = self.runner.invoke(
+            cli, ["restore", "repo", "--archive-dir", str(archive_dir), "--dest", str(dest)]
+        )
+
+        assert result.exit_code == 0
+        assert (dest / "README.md").read_text() == "shared readme\n"
+
+    def test_zip_restore_command(self):
+        """Test that restore also unpacks zip archives."""
+        archive_dir = self.root / "archive"
+        manager = ArchiveForks("u", "t", archive_dir=archive_dir)
+        manager.setup_directories()
+        os.unlink(self.tree / "LINK.md")
+        manager.archive_repo(self.tree, "repo")
+        shutil.rmtree(self.tree)
+
+        dest = self.root / "restored"
+        result = self.runner.invoke(
+            cli, ["restore", "repo", "--archive-dir", str(archive_dir), "--dest", str(dest)]
+        )
+
+        assert result.exit_code == 0
+        assert (dest / "src" / "lib.py").exists()
+
+    def test_restore_missing_archive(self):
+        """Test that restoring an unknown repo fails cleanly."""
+        result = self.runner.invoke(
+            cli,
+            ["restore", "nope", "--archive-dir", str(self.root), "--dest", str(self.root / "d")],
+        )
+
+        assert result.exit_code != 0
+        assert "No archive for nope" in result.output
@@ -0,0 +1,170 @@
+"""Tests for run telemetry."""
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from hildie.hildie_archive_git_forks.archiver import ArchiveForks
+from hildie.hildie_archive_git_forks.main import cli
+from hildie.hildie_archive_git_forks.scheduler import RequestScheduler
+from hildie.hildie_archive_git_forks.telemetry import Histogram, Telemetry
+from hildie.hildie_archive_git_forks.testing import FakeGitHub
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTelemetry:
+    """Test counters, the histogram, ETA and the JSON summary."""
+
+    def test_histogram_percentiles(self):
+        """Test that percentiles report the bucket bound holding the fraction."""
+        histogram = Histogram((10, 100, 1000))
+        for value in (5, 6, 7, 50, 5000):
+            histogram.add(value)
+
+        summary = histogram.summary()
+        assert summary["count"] == 5
+        assert summary["p50"] == 10
+        assert summary["p90"] == 5000
+        assert summary["buckets"] == {"<=10": 3, "<=100": 1, "<=1000": 0, ">1000": 1}
+
+    def test_eta_from_completed_rate(self):
+        """Test that the ETA extrapolates from repos completed so far."""
+        clock = FakeClock()
+        telemetry = Telemetry(total=10, clock=clock)
+        assert telemetry.eta() is None
+
+        clock.now += 20
+        telemetry.repo_finished(ok=True)
+        telemetry.repo_finished(ok=False)
+
+        assert telemetry.eta() == 80
+        assert "2/10 repos | 1 failed" in telemetry.progress_line()
+        assert "ETA 1:20" in telemetry.progress_line()
+
+    def test_listeners_and_json_summary(self):
+        """Test that listeners see every update and the summary is JSON."""
+        telemetry = Telemetry(total=1)
+        seen = []
+        telemetry.listeners.append(lambda t: seen.append(t.completed))
+
+        telemetry.record_stage("repo", "clone", 1.5)
+        telemetry.add_bytes("cloned", 2048)
+        telemetry.record_api("PATCH", 0.03, 200)
+        telemetry.repo_finished(ok=True)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "metrics.json"
+            telemetry.write_json(str(path), {"pipeline": []})
+            data = json.loads(path.read_text())
+
+        assert seen == [0, 0, 0, 1]
+        assert data["repos"] == {"repo": {"clone": 1.5}}
+        assert data["stage_totals"]["clone"] == {"count": 1, "seconds": 1.5}
+        assert data["bytes"]["cloned"] == 2048
+        assert data["api"]["status"] == {"200": 1}
+        assert data["api"]["latency_ms"]["buckets"]["<=50"] == 1
+        assert data["pipeline"] == []
+
+    def test_scheduler_reports_latency_and_errors(self):
+        """Test that the scheduler observer sees responses and failed attempts."""
+        session = MagicMock()
+        session.request.side_effect = [ConnectionError("reset"), MagicMock(status_code=204)]
+        telemetry = Telemetry()
+        scheduler = RequestScheduler(
+            session, sleep=lambda s: None, backoff_base=0, observer=telemetry.record_api
+        )
+
+        scheduler.delete("https://api.example.com/repos/u/r")
+
+        assert telemetry.api_latency.count == 2
+        assert telemetry.api_status == {204: 1}
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestProcessTelemetry:
+    """Test that process_repos and the CLI record telemetry."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.runner = CliRunner()
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_process_repos_records_stages_bytes_and_api(self):
+        """Test an offline run fills in timings, byte counts and API latency."""
+        with FakeGitHub(self.root / "remote") as fake:
+            fake.add_repos(2)
+            manager = ArchiveForks(
+                fake.username, "t", self.root / "work", self.root / "archive", api_url=fake.url
+            )
+            manager.setup_directories()
+            manager.telemetry = Telemetry(total=2)
+
+            manager.process_repos(manager.fetch_forked_repos())
+
+        summary = manager.telemetry.summary()
+        assert summary["completed"] == 2
+        assert summary["failed"] == 0
+        assert set(summary["repos"]["fork-0000"]) == {"clone", "archive", "privatise"}
+        assert summary["bytes"]["cloned"] > 0
+        assert summary["bytes"]["archived"] > 0
+        # One listing page plus one PATCH per repo
+        assert summary["api"]["latency_ms"]["count"] == 3
+
+    @patch("hildie.hildie_archive_git_forks.main.get_github_username", return_value="u")
+    @patch("hildie.hildie_archive_git_forks.main.ArchiveForks")
+    def test_process_writes_metrics_file(self, mock_archiver_class, _username):
+        """Test that process --metrics-file writes the summary and pipeline metrics."""
+        repos = [{"name": "a", "clone_url": "u"}, {"name": "b", "clone_url": "u"}]
+        mock_archiver = mock_archiver_class.return_value
+        mock_archiver.load_selected_repos.side_effect = lambda f: iter(repos)
+        mock_archiver.count_repos.return_value = len(repos)
+        mock_archiver.process_repos.return_value = {
+            "successful": ["a", "b"],
+            "failed": [],
+            "metrics": [],
+        }
+        flat_file = self.root / "repos.jsonl"
+        flat_file.write_text("")
+        metrics_file = self.root / "metrics.json"
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "process",
+                "--flat-file",
+                str(flat_file),
+                "--journal-file",
+                str(self.root / "journal.jsonl"),
+                "--metrics-file",
+                str(metrics_file),
+                "--progress",
+            ],
+            env={"GITHUB_TOKEN": "token"},
+        )
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(metrics_file.read_text())
+        assert data["total"] == 2
+        assert data["pipeline"] == []
+        assert "0/2 repos" in result.output
+        # Only the cheap line count reads the file ahead of the pipeline
+        mock_archiver.load_selected_repos.assert_called_once()
@@ -0,0 +1,234 @@
+"""Tests for archive verification."""
+
+import json
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from hildie.hildie_archive_git_forks.archiver import ArchiveForks
+from hildie.hildie_archive_git_forks.main import cli
+from hildie.hildie_archive_git_forks.store import BlobStore
+from hildie.hildie_archive_git_forks.testing import make_template_repo
+from hildie.hildie_archive_git_forks.verify import verify_archive, verify_archives
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def git(*args, cwd):
+    """Run git with a fixed identity."""
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+class TestVerify:
+    """Test verifying zip and blob store archives against clones."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        clone = make_template_repo(self.root / "work" / "repo", files=5)
+        script = clone / "bin" / "run.sh"
+        script.parent.mkdir()
+        script.write_text("#!/bin/sh\n")
+        script.chmod(0o755)
+        os.symlink("file_0000.txt", clone / "link.txt")
+        git("add", "-A", cwd=clone)
+        git("commit", "-q", "-m", "more", cwd=clone)
+        self.runner = CliRunner()
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def manager(self, archive_format="zip"):
+        """Build an ArchiveForks over the fixture directories."""
+        return ArchiveForks(
+            "u",
+            "t",
+            self.root / "work",
+            self.root / f"archive-{archive_format}",
+            archive_format=archive_format,
+        )
+
+    def test_zip_archive_verifies(self):
+        """Test that a fresh zip archive matches the clone."""
+        manager = self.manager()
+        manager.setup_directories()
+        path = manager.archive_repo(self.root / "work" / "repo", "repo")
+
+        result = verify_archive(str(path), str(self.root / "work" / "repo"))
+
+        assert result["ok"], result
+        assert result["checked"] == 6
+        assert len(result["head"]) == 40
+
+    def test_cas_archive_verifies_including_symlinks(self):
+        """Test that blob store manifests verify, symlinks included."""
+        manager = self.manager("cas")
+        path = manager.archive_repo(self.root / "work" / "repo", "repo")
+
+        result = verify_archive(str(path), str(self.root / "work" / "repo"))
+
+        assert result["ok"], result
+        assert result["checked"] == 7
+
+    def test_corrupted_zip_detected(self):
+        """Test that a changed file in the archive is reported."""
+        manager = self.manager()
+        manager.setup_directories()
+        path = manager.archive_repo(self.root / "work" / "repo", "repo")
+
+        tampered = path.with_suffix(".tmp")
+        with zipfile.ZipFile(path) as src, zipfile.ZipFile(tampered, "w") as dst:
+            for info in src.infolist():
+                data = src.read(info)
+                if info.filename == "file_0001.txt":
+                    data = b"tampered"
+                if info.filename != "file_0002.txt":
+                    dst.writestr(info, data)
+        os.replace(tampered, path)
+
+        result = verify_archive(str(path), str(self.root / "work" / "repo"))
+
+        assert not result["ok"]
+        assert result["mismatched"] == ["file_0001.txt"]
+        assert result["missing"] == ["file_0002.txt"]
+
+    def test_damaged_zip_member_reported(self):
+        """Test that undecompressable zip data is an error, not a crash."""
+        manager = self.manager()
+        manager.setup_directories()
+        path = manager.archive_repo(self.root / "work" / "repo", "repo")
+
+        with zipfile.ZipFile(path) as archive:
+            info = archive.getinfo("file_0001.txt")
+        with open(path, "r+b") as f:
+            # Skip the local file header to reach the deflate stream; 0xff
+            # bytes start a block of the invalid type 3
+            f.seek(info.header_offset + 26)
+            name_len, extra_len = struct.unpack("<HH", f.read(4))
+            f.seek(name_len + extra_len, os.SEEK_CUR)
+            f.write(b"\xff" * 4)
+
+        result = verify_archive(str(path), str(self.root / "work" / "repo"))
+
+        assert not result["ok"]
+        assert "invalid block type" in result["error"]
+
+    def test_damaged_blob_reported(self):
+        """Test that a blob that no longer inflates is an error, not a crash."""
+        manager = self.manager("cas")
+        path = manager.archive_repo(self.root / "work" / "repo", "repo")
+        with open(path) as f:
+            entry = next(e for e in json.load(f)["files"] if e["path"] == "file_0001.txt")
+        BlobStore(path.parent.parent).blob_path(entry["blob"]).write_bytes(b"not zlib")
+
+        result = verify_archive(str(path), str(self.root / "work" / "repo"))
+
+        assert not result["ok"]
+        assert "incorrect header check" in result["error"]
+
+    def test_failed_ls_tree_reported(self):
+        """Test that git ls-tree failing is an error, not a crash."""
+        manager = self.manager()
+        manager.setup_directories()
+        path = manager.archive_repo(self.root / "work" / "repo", "repo")
+        run = subprocess.run
+
+        def failing_ls_tree(args, **kwargs):
+            if "ls-tree" in args:
+                raise subprocess.CalledProcessError(128, args)
+            return run(args, **kwargs)
+
+        with patch.object(subprocess, "run", side_effect=failing_ls_tree):
+            result = verify_archive(str(path), str(self.root / "work" / "repo"))
+
+        assert not result["ok"]
+        assert "ls-tree" in result["error"]
+
+    def test_missing_clone_and_archive_reported(self):
+        """Test that repos without a clone or archive fail verification."""
+        manager = self.manager()
+        manager.setup_directories()
+        manager.archive_repo(self.root / "work" / "repo", "repo")
+        shutil.rmtree(self.root / "work" / "repo")
+
+        report = verify_archives(manager.archive_dir, manager.work_dir, ["repo", "ghost"], 1)
+
+        by_name = {r["name"]: r for r in report["results"]}
+        assert "Not a git clone" in by_name["repo"]["error"]
+        assert by_name["ghost"]["error"] == "no archive found"
+
+    def test_verify_command(self):
+        """Test the verify command output and exit status."""
+        manager = self.manager()
+        manager.setup_directories()
+        manager.archive_repo(self.root / "work" / "repo", "repo")
+        args = [
+            "verify",
+            "--work-dir",
+            str(manager.work_dir),
+            "--archive-dir",
+            str(manager.archive_dir),
+            "--workers",
+            "1",
+        ]
+
+        result = self.runner.invoke(cli, args)
+        assert result.exit_code == 0, result.output
+        assert "✓ repo: 6 files match" in result.output
+        assert "archives/s" in result.output
+
+        (self.root / "work" / "repo" / "file_0000.txt").write_text("changed")
+        git("commit", "-q", "-am", "change", cwd=self.root / "work" / "repo")
+        result = self.runner.invoke(cli, args)
+        assert result.exit_code != 0
+        assert "changed file_0000.txt" in result.output
+
+    @patch("hildie.hildie_archive_git_forks.main.get_github_username", return_value="u")
+    def test_delete_require_verified_skips_unverified(self, _username):
+        """Test that delete --require-verified only deletes verified repos."""
+        manager = self.manager()
+        manager.setup_directories()
+        manager.archive_repo(self.root / "work" / "repo", "repo")
+        flat_file = self.root / "repos.jsonl"
+        manager.export_repos(
+            [{"name": "repo", "clone_url": "u"}, {"name": "ghost", "clone_url": "u"}],
+            str(flat_file),
+        )
+
+        with patch.object(ArchiveForks, "delete_repo", return_value=True) as delete_repo:
+            result = self.runner.invoke(
+                cli,
+                [
+                    "delete",
+                    "--force",
+                    "--require-verified",
+                    "--flat-file",
+                    str(flat_file),
+                    "--journal-file",
+                    str(self.root / "journal.jsonl"),
+                    "--work-dir",
+                    str(manager.work_dir),
+                    "--archive-dir",
+                    str(manager.archive_dir),
+                ],
+                env={"GITHUB_TOKEN": "token"},
+            )
+
+        assert result.exit_code == 0, result.output
+        delete_repo.assert_called_once_with("repo")
+        assert "Skipping 1 repos without a verified archive" in result.output
@@ -0,0 +1,52 @@
+"""Fixtures shared by the package test suites."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def _python(*args: str) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter that sees this one's sys.path."""
+    result = subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Child interpreter failed:\n{result.stderr}")
+    return result
+
+
+def _modules_after(code: str) -> set[str]:
+    script = f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))\n"
+    return set(json.loads(_python("-c", script).stdout.splitlines()[-1]))
+
+
+def _import_times(module: str) -> dict[str, int]:
+    times = {}
+    for line in _python("-X", "importtime", "-c", f"import {module}").stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture
+def modules_after():
+    """Return a function that runs code in a fresh interpreter and returns sys.modules."""
+    return _modules_after
+
+
+@pytest.fixture
+def import_times():
+    """Return a function that imports a module under -X importtime.
+
+    The result maps each imported module to its cumulative import time in
+    microseconds, as reported by the fresh interpreter.
+    """
+    return _import_times
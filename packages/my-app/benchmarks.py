@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+hildie_app parallel benchmarks
+
+Times the sharded reduction against the serial one on an input large enough
+to show the speedup, which the unit tests only check for correctness.
+
+Usage:
+    PYTHONPATH=source python3 packages/my-app/benchmarks.py
+"""
+
+import array
+import time
+
+from hildie.hildie_app import process_numbers
+from hildie.hildie_app.parallel import process_numbers_parallel
+
+
+def best_ms(func, *args, repeat: int = 3, **kwargs) -> float:
+    """Return the fastest of repeat calls to func(*args, **kwargs), in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    """Print the time taken by each benchmark."""
+    print(f"{'benchmark':<32} {'ms':>10}")
+    print("-" * 43)
+
+    numbers = array.array("q", [1 if i % 3 else -1 for i in range(8_000_000)])
+    serial = best_ms(process_numbers, numbers)
+    print(f"{'process_numbers[8M int64]':<32} {serial:>10.1f}")
+    for workers in (2, 4):
+        parallel = best_ms(process_numbers_parallel, numbers, workers=workers, threshold=0)
+        name = f"parallel[8M int64, {workers} workers]"
+        print(f"{name:<32} {parallel:>10.1f}  ({serial / parallel:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
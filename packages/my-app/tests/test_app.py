@@ -1,6 +1,26 @@
 """Tests for my_app module."""
 
+import array
+import math
+
 from hildie.hildie_app import process_numbers
+from hildie.hildie_library import add, multiply
+
+
+def process_numbers_two_pass(numbers):
+    """The original two-loop implementation, kept as a benchmark baseline."""
+    if not numbers:
+        return {"sum": 0, "product": 0}
+
+    total = 0
+    for num in numbers:
+        total = add(total, num)
+
+    product = 1
+    for num in numbers:
+        product = multiply(product, num)
+
+    return {"sum": total, "product": product}
 
 
 class TestApp:
@@ -35,3 +55,45 @@ class TestApp:
         result = process_numbers([-2, 3, -1])
         assert result["sum"] == 0
         assert result["product"] == 6
+
+    def test_process_numbers_generator(self):
+        """Test that a generator is consumed in one pass across chunks."""
+        numbers = [3, -1, 4, 1, -5, 9, 2, 6]
+        result = process_numbers((n for n in numbers), chunk_size=3)
+        assert result == process_numbers_two_pass(numbers)
+
+    def test_process_numbers_empty_generator(self):
+        """Test that an empty generator matches an empty list."""
+        assert process_numbers(iter([])) == {"sum": 0, "product": 0}
+
+    def test_process_numbers_buffer(self):
+        """Test processing an array.array in chunks."""
+        numbers = array.array("q", range(1, 11))
+        result = process_numbers(numbers, chunk_size=4)
+        assert result == {"sum": 55, "product": 3628800}
+
+    def test_process_numbers_large_product(self):
+        """Test that chunk products combine exactly across many chunks."""
+        result = process_numbers(range(1, 5001), chunk_size=100)
+        assert result["product"] == math.factorial(5000)
+        assert result["sum"] == 5000 * 5001 // 2
+
+    def test_process_numbers_zero_in_later_chunk(self):
+        """Test that a zero anywhere makes the product zero."""
+        result = process_numbers([5, 6, 7, 0, 8, 9], chunk_size=2)
+        assert result == {"sum": 35, "product": 0}
+
+    def test_single_pass(self):
+        """Test that the sum and product come from one pass over the input."""
+        numbers = [1 if i % 3 else -1 for i in range(500_000)]
+        pulled = 0
+
+        def stream():
+            nonlocal pulled
+            for n in numbers:
+                pulled += 1
+                yield n
+
+        # A generator can only be read once, so a second loop would see nothing
+        assert process_numbers(stream()) == process_numbers_two_pass(numbers)
+        assert pulled == len(numbers)
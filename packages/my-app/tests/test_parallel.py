@@ -0,0 +1,101 @@
+"""Tests for sharded parallel reduction."""
+
+import array
+import math
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from hildie.hildie_app import CHUNK_SIZE, process_numbers
+from hildie.hildie_app.parallel import process_file, process_numbers_parallel
+
+
+class TestParallel:
+    """Test that sharded results match the serial reduction."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_list_and_buffers_via_shared_memory(self):
+        """Test lists and int64 buffers sharded through shared memory."""
+        numbers = list(range(1, 2001))
+        expected = {"sum": 2001000, "product": math.factorial(2000)}
+
+        assert process_numbers_parallel(numbers, workers=3, threshold=0) == expected
+        buffer = array.array("q", numbers)
+        assert process_numbers_parallel(buffer, workers=3, threshold=0) == expected
+        assert process_numbers_parallel(memoryview(buffer), workers=2, threshold=0) == expected
+
+    def test_lists_converted_a_chunk_at_a_time(self):
+        """Test that a list is written into shared memory without a full-size temporary."""
+        numbers = [i % 7 - 3 for i in range(2 * CHUNK_SIZE + 5)]
+        sizes = []
+        make_array = array.array
+
+        def recording_array(typecode, values):
+            sizes.append(len(values))
+            return make_array(typecode, values)
+
+        with patch("hildie.hildie_app.parallel.array.array", side_effect=recording_array):
+            result = process_numbers_parallel(numbers, workers=2, threshold=0)
+
+        assert result == process_numbers(numbers)
+        assert sizes == [CHUNK_SIZE, CHUNK_SIZE, 5]
+
+    def test_strided_and_empty_inputs(self):
+        """Test a non-contiguous buffer and an empty list."""
+        buffer = array.array("q", range(-1000, 1000))
+        strided = memoryview(buffer)[::3]
+        assert process_numbers_parallel(strided, workers=3, threshold=0) == process_numbers(
+            list(strided)
+        )
+        assert process_numbers_parallel([], workers=2, threshold=0) == {"sum": 0, "product": 0}
+
+    def test_big_ints_are_sent_in_slices(self):
+        """Test that values too large for int64 still reduce exactly."""
+        numbers = [2**70, -3, 5, 2**64 + 1]
+        assert process_numbers_parallel(numbers, workers=2, threshold=0) == process_numbers(numbers)
+
+    def test_below_threshold_runs_in_process(self):
+        """Test that small inputs never start a process pool."""
+        with patch("hildie.hildie_app.parallel.ProcessPoolExecutor") as pool:
+            result = process_numbers_parallel([1, 2, 3], threshold=10)
+        pool.assert_not_called()
+        assert result == {"sum": 6, "product": 6}
+
+    def test_text_file_shards_do_not_split_numbers(self):
+        """Test byte-range shards of a text file at awkward boundaries."""
+        numbers = [12345678, -9, 0, 77, 31337, -424242] * 50
+        path = self.root / "numbers.txt"
+        path.write_text("\n".join(" ".join(map(str, numbers[i : i + 7])) for i in range(0, 300, 7)))
+
+        for workers in (1, 3, 7):
+            assert process_file(path, workers=workers, threshold=0) == process_numbers(numbers)
+
+    def test_int64_file_shards(self):
+        """Test byte-range shards of a raw int64 file."""
+        numbers = list(range(-500, 0))
+        path = self.root / "numbers.bin"
+        path.write_bytes(array.array("q", numbers).tobytes())
+
+        assert process_file(path, "int64", workers=3, threshold=0) == process_numbers(numbers)
+
+    def test_empty_file(self):
+        """Test that an empty file matches an empty list."""
+        path = self.root / "empty.txt"
+        path.write_bytes(b"")
+        assert process_file(path, workers=2, threshold=0) == {"sum": 0, "product": 0}
+
+    def test_shards_cover_odd_lengths(self):
+        """Test shard boundaries for odd lengths and more workers than numbers."""
+        for length in (1, 2, 7, 1001):
+            numbers = array.array("q", [1 if i % 3 else -1 for i in range(length)])
+            for workers in (1, 2, 3, 9):
+                result = process_numbers_parallel(numbers, workers=workers, threshold=0)
+                assert result == process_numbers(numbers), (length, workers)
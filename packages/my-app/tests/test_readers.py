@@ -0,0 +1,134 @@
+"""Tests for the chunked integer readers."""
+
+import array
+import io
+import math
+import struct
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from hildie.hildie_app import process_mapped
+from hildie.hildie_app.parallel import process_file
+from hildie.hildie_app.readers import (
+    MappedInt64,
+    iter_chunks,
+    iter_int64_chunks,
+    iter_text_chunks,
+    read_npy_header,
+)
+
+
+def npy_bytes(values: list[int], descr: str = "<i8") -> bytes:
+    """Build a version 1.0 .npy file by hand, the way numpy.save lays it out."""
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({len(values)},), }}"
+    header += " " * (-(len(header) + 11) % 64) + "\n"
+    body = array.array("q", values).tobytes()
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode() + body
+
+
+class TestTextReader:
+    """Test parsing whitespace-separated integers."""
+
+    def test_numbers_split_across_blocks(self):
+        """Test that numbers cut at a block boundary are parsed whole."""
+        data = b"12345 -678\n90\t\t11\n\n-2 3"
+        for block_size in (1, 2, 3, 7, 1024):
+            chunks = list(iter_text_chunks(io.BytesIO(data), block_size))
+            assert [n for chunk in chunks for n in chunk] == [12345, -678, 90, 11, -2, 3]
+
+    def test_empty_and_blank_input(self):
+        """Test that empty or whitespace-only input yields nothing."""
+        assert list(iter_text_chunks(io.BytesIO(b""))) == []
+        assert list(iter_text_chunks(io.BytesIO(b" \n\t "))) == []
+
+    def test_bad_token_reported(self):
+        """Test that a non-integer token raises ValueError naming it."""
+        with pytest.raises(ValueError, match="three"):
+            list(iter_text_chunks(io.BytesIO(b"1 2 three 4")))
+
+
+class TestInt64Reader:
+    """Test reading raw little-endian int64 data."""
+
+    def test_round_trip_across_blocks(self):
+        """Test that values survive blocks that are not 8-byte aligned reads."""
+        values = array.array("q", [1, -2, 2**62, -(2**63), 7])
+        data = io.BytesIO(values.tobytes())
+
+        chunks = list(iter_int64_chunks(data, block_size=20))
+
+        assert [n for chunk in chunks for n in chunk] == values.tolist()
+
+    def test_trailing_bytes_rejected(self):
+        """Test that a truncated file raises ValueError."""
+        with pytest.raises(ValueError, match="Trailing 4 bytes"):
+            list(iter_chunks(io.BytesIO(b"\x01" * 12), "int64"))
+
+
+class TestMapped:
+    """Test memory-mapped int64 and .npy input."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_npy_header(self):
+        """Test parsing a .npy header without NumPy."""
+        f = io.BytesIO(npy_bytes([1, 2, 3]))
+        offset, count = read_npy_header(f)
+        assert offset % 64 == 0
+        assert count == 3
+        assert f.tell() == offset
+
+    def test_npy_wrong_dtype_rejected(self):
+        """Test that non-int64 .npy files raise ValueError."""
+        with pytest.raises(ValueError, match="int64"):
+            read_npy_header(io.BytesIO(npy_bytes([1], descr="<f8")))
+
+    def test_mapped_chunks_cover_every_value(self):
+        """Test that chunks walk the mapped values in order."""
+        values = list(range(-3000, 3000))
+        path = self.root / "numbers.bin"
+        path.write_bytes(array.array("q", values).tobytes())
+
+        with MappedInt64(path) as mapped:
+            assert len(mapped) == 6000
+            seen = [n for chunk in mapped.chunks(1000, 500, 5500) for n in chunk]
+
+        assert seen == values[500:5500]
+
+    def test_process_mapped_int64_and_npy(self):
+        """Test reducing raw and .npy files in place."""
+        values = list(range(1, 1001))
+        (self.root / "n.bin").write_bytes(array.array("q", values).tobytes())
+        (self.root / "n.npy").write_bytes(npy_bytes(values))
+        expected = {"sum": 500500, "product": math.factorial(1000)}
+
+        assert process_mapped(self.root / "n.bin", chunk_size=64) == expected
+        assert process_mapped(self.root / "n.npy", "npy", chunk_size=64) == expected
+        assert process_file(self.root / "n.npy", "npy", workers=3, threshold=0) == expected
+        with open(self.root / "n.npy", "rb") as f:
+            assert [n for chunk in iter_chunks(f, "npy") for n in chunk] == values
+
+    def test_empty_files(self):
+        """Test that empty files match an empty list."""
+        (self.root / "empty.bin").write_bytes(b"")
+        (self.root / "empty.npy").write_bytes(npy_bytes([]))
+
+        assert process_mapped(self.root / "empty.bin") == {"sum": 0, "product": 0}
+        assert process_mapped(self.root / "empty.npy", "npy") == {"sum": 0, "product": 0}
+
+    def test_numpy_saved_file(self):
+        """Test a file written by numpy.save, when NumPy is installed."""
+        np = pytest.importorskip("numpy")
+        path = self.root / "saved.npy"
+        np.save(path, np.arange(-50, 50, dtype="<i8").reshape(10, 10))
+
+        assert process_mapped(path, "npy") == {"sum": -50, "product": 0}
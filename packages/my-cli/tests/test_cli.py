@@ -1,5 +1,11 @@
 """Tests for my_cli module."""
 
+import array
+import math
+import struct
+import tempfile
+from pathlib import Path
+
 from click.testing import CliRunner
 
 from hildie.hildie_cli.main import cli
@@ -35,3 +41,47 @@ class TestCLI:
         result = self.runner.invoke(cli, ["multiply-all", "2", "3", "4"])
         assert result.exit_code == 0
         assert "Product: 24" in result.output
+
+    def test_sum_all_from_stdin(self):
+        """Test streaming whitespace-separated numbers from stdin."""
+        result = self.runner.invoke(cli, ["sum-all", "--input", "-"], input="1 2\n3\t4\n")
+        assert result.exit_code == 0
+        assert "Sum: 10" in result.output
+
+    def test_multiply_all_from_int64_file(self):
+        """Test streaming a binary int64 file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "numbers.bin"
+            path.write_bytes(array.array("q", range(1, 31)).tobytes())
+
+            result = self.runner.invoke(
+                cli, ["multiply-all", "--input", str(path), "--format", "int64"]
+            )
+
+        assert result.exit_code == 0
+        assert f"Product: {math.factorial(30)}" in result.output
+
+    def test_sum_all_from_npy_stdin(self):
+        """Test streaming a .npy file through stdin."""
+        values = array.array("q", [5, -7, 9])
+        header = "{'descr': '<i8', 'fortran_order': False, 'shape': (3,), }".ljust(117) + "\n"
+        data = b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode()
+
+        result = self.runner.invoke(
+            cli, ["sum-all", "--input", "-", "--format", "npy"], input=data + values.tobytes()
+        )
+
+        assert result.exit_code == 0
+        assert "Sum: 7" in result.output
+
+    def test_sum_all_requires_numbers_or_input(self):
+        """Test that numbers come from exactly one source."""
+        assert self.runner.invoke(cli, ["sum-all"]).exit_code != 0
+        result = self.runner.invoke(cli, ["sum-all", "1", "--input", "-"], input="2")
+        assert result.exit_code != 0
+
+    def test_sum_all_bad_input(self):
+        """Test that an unparsable token is reported."""
+        result = self.runner.invoke(cli, ["sum-all", "--input", "-"], input="1 x 2")
+        assert result.exit_code != 0
+        assert "Not an integer: 'x'" in result.output
@@ -0,0 +1,33 @@
+"""Import regression tests for the hildie-cli entry point."""
+
+ENTRY_POINT = "hildie.hildie_cli.main"
+
+# NumPy is only loaded to reduce binary buffers
+LAZY_MODULES = {"numpy", "multiprocessing", "concurrent.futures"}
+
+# The entry point's import time, relative to click's; click is most of it
+MAX_CLICK_RATIO = 3
+
+
+class TestStartup:
+    """Test that the CLI defers NumPy and the process pool machinery."""
+
+    def test_heavy_modules_not_imported(self, modules_after):
+        """Test that importing the entry point leaves NumPy and process pools alone."""
+        loaded = modules_after(f"import {ENTRY_POINT}")
+        assert not loaded & LAZY_MODULES, sorted(loaded & LAZY_MODULES)
+
+    def test_sum_all_does_not_import_numpy(self, modules_after):
+        """Test that reducing plain arguments never imports NumPy."""
+        loaded = modules_after(
+            "from hildie.hildie_cli.main import cli\n"
+            "cli(['sum-all', '1', '2', '3'], standalone_mode=False)"
+        )
+        assert "numpy" not in loaded
+
+    def test_import_time_relative_to_click(self, import_times):
+        """Test that -X importtime keeps the entry point close to click alone."""
+        # Best of three, to ride out a cold disk cache or a busy machine
+        runs = [import_times(ENTRY_POINT) for _ in range(3)]
+        ratio = min(times[ENTRY_POINT] / times["click"] for times in runs)
+        assert ratio < MAX_CLICK_RATIO, f"import took {ratio:.1f}x click's"
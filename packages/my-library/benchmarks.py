@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+hildie_library batch benchmarks
+
+Times the batch reductions on inputs large enough to show their scaling,
+which the unit tests only check for correctness.
+
+Usage:
+    PYTHONPATH=source python3 packages/my-library/benchmarks.py
+"""
+
+import math
+import time
+
+from hildie.hildie_library import _numpy, add_many, multiply_many
+
+
+def best_ms(func, *args, repeat: int = 3) -> float:
+    """Return the fastest of repeat calls to func(*args), in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    """Print the time taken by each benchmark."""
+    print(f"{'benchmark':<32} {'ms':>10}")
+    print("-" * 43)
+
+    values = list(range(1, 50_001))
+    linear = best_ms(math.prod, values)
+    tree = best_ms(multiply_many, values)
+    print(f"{'math.prod[50k factors]':<32} {linear:>10.1f}")
+    print(f"{'multiply_many[50k factors]':<32} {tree:>10.1f}  ({linear / tree:.1f}x)")
+
+    np = _numpy()
+    if np is None:
+        print(f"{'add_many[10M int64]':<32} {'no numpy':>10}")
+    else:
+        values = np.arange(10_000_000, dtype="int64")
+        print(f"{'add_many[10M int64]':<32} {best_ms(add_many, values):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Tests for the batch add/multiply API."""
+
+import array
+import math
+from unittest.mock import patch
+
+import pytest
+
+from hildie.hildie_library import (
+    ProductAccumulator,
+    add_arrays,
+    add_many,
+    multiply_many,
+    tree_product,
+)
+
+
+class TestBatch:
+    """Test batch reductions over the supported input types."""
+
+    def test_add_many_inputs(self):
+        """Test that every supported input type gives the same sum."""
+        values = [3, -1, 4, 1, -5, 9]
+        assert add_many(values) == 11
+        assert add_many(iter(values)) == 11
+        assert add_many(array.array("q", values)) == 11
+        assert add_many(memoryview(array.array("q", values))) == 11
+        assert add_many([]) == 0
+
+    def test_multiply_many_inputs(self):
+        """Test that every supported input type gives the same product."""
+        values = [3, -1, 4, 2]
+        assert multiply_many(values) == -24
+        assert multiply_many(x for x in values) == -24
+        assert multiply_many(array.array("i", values)) == -24
+        assert multiply_many([]) == 1
+        assert multiply_many(array.array("q", [5, 0, 7])) == 0
+
+    def test_add_arrays(self):
+        """Test elementwise addition and the length check."""
+        assert add_arrays([1, 2, 3], (10, 20, 30)) == [11, 22, 33]
+
+        with pytest.raises(ValueError, match="Length mismatch: 2 != 1"):
+            add_arrays([1, 2], [1])
+
+    def test_pure_python_fallback(self):
+        """Test the results without NumPy match the NumPy path."""
+        buffer = array.array("q", range(1, 21))
+        with patch("hildie.hildie_library._numpy", return_value=None):
+            assert add_many(buffer) == 210
+            assert multiply_many(buffer) == math.factorial(20)
+            assert add_arrays(buffer, buffer) == [2 * x for x in range(1, 21)]
+
+
+class TestTreeProduct:
+    """Test the balanced-tree product."""
+
+    def test_matches_left_to_right(self):
+        """Test that the tree product is exact for any input shape."""
+        for n in (0, 1, 63, 64, 65, 1000):
+            values = list(range(1, n + 1))
+            assert tree_product(values) == math.factorial(n)
+            assert tree_product(iter(values)) == math.factorial(n)
+        assert tree_product([-3, 2, -1, 5]) == 30
+
+    def test_accumulator_push_and_update(self):
+        """Test mixing pushed partial products with updates."""
+        accumulator = ProductAccumulator()
+        accumulator.update(range(1, 101))
+        for factor in (101, 102, 103):
+            accumulator.push(factor)
+        accumulator.update(x for x in range(104, 201))
+
+        assert accumulator.result() == math.factorial(200)
+
+
+class TestBatchNumpy:
+    """Test the NumPy path, when NumPy is installed."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.np = pytest.importorskip("numpy")
+
+    def test_integer_results_stay_exact(self):
+        """Test that int64 overflow falls back to exact Python ints."""
+        big = self.np.full(4, 2**62, dtype="int64")
+        assert add_many(big) == 4 * 2**62
+        assert multiply_many(self.np.full(3, 2**40, dtype="int64")) == 2**120
+        assert multiply_many(self.np.arange(1, 21)) == math.factorial(20)
+
+    def test_add_arrays_returns_ndarray(self):
+        """Test that NumPy inputs give a NumPy result."""
+        result = add_arrays(self.np.arange(3), [1, 1, 1])
+        assert isinstance(result, self.np.ndarray)
+        assert result.tolist() == [1, 2, 3]
+
+    def test_add_arrays_exact_past_int64(self):
+        """Test that sums which would wrap in int64 are exact instead."""
+        result = add_arrays(self.np.array([2**62, -(2**62)]), [2**62, -(2**62) - 1])
+        assert result.tolist() == [2**63, -(2**63) - 1]
+
+        small = self.np.array([2**31 - 1], dtype="int32")
+        assert add_arrays(small, small).tolist() == [2**32 - 2]
+
+    def test_add_many_10m(self):
+        """Test that 10M int64 values sum exactly on the NumPy path."""
+        values = self.np.arange(10_000_000, dtype="int64")
+        assert add_many(values) == 10_000_000 * 9_999_999 // 2
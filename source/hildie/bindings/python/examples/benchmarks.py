@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Hildie Python Bindings Microbenchmarks
+
+Measures calls per second for each binding that is available, so the FFI
+overhead of Rust (PyO3), Go (ctypes) and C++ (ctypes) can be compared.
+With --scaling, measures process_data_parallel throughput against thread
+count instead; with --factorial, the exact factorial engine for n up to 10**6.
+
+Usage:
+    python3 examples/benchmarks.py [--calls N]
+    python3 examples/benchmarks.py --scaling [--sizes 10000000,100000000]
+    python3 examples/benchmarks.py --factorial
+"""
+
+import argparse
+import array
+import functools
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import bindings
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hildie_bindings import (
+    add_go,
+    add_go_many,
+    add_rust,
+    compute_factorial,
+    factorial,
+    greet_all,
+    greet_go,
+    greet_go_many,
+    greet_rust,
+    process_data,
+    process_data_parallel,
+    sum_rust,
+)
+
+BENCHMARKS = [
+    ("add_rust", add_rust, (2, 3)),
+    ("greet_rust", greet_rust, ("Alice",)),
+    ("greet_all[10000]", greet_all, ([f"user{i}" for i in range(10_000)],)),
+    ("add_go", add_go, (2, 3)),
+    ("greet_go", greet_go, ("Alice",)),
+    ("add_go_many[1000]", add_go_many, (list(range(1000)), list(range(1000)))),
+    ("greet_go_many[1000]", greet_go_many, (["Alice"] * 1000,)),
+    ("sum_rust[100000]", sum_rust, (array.array("q", range(100_000)),)),
+    ("compute_factorial", compute_factorial, (10,)),
+    ("process_data[8]", process_data, ([1, 2, 3, 4, 5, 6, 7, 8],)),
+    ("process_data[10000 list]", process_data, (list(range(10_000)),)),
+    ("process_data[10000 buffer]", process_data, (array.array("i", range(10_000)),)),
+    (
+        "process_data[10000 into out]",
+        functools.partial(process_data, out=array.array("i", bytes(40_000))),
+        (array.array("i", range(10_000)),),
+    ),
+]
+
+
+def calls_per_second(func, args: tuple, calls: int) -> float:
+    """Return how many times per second func(*args) can be called."""
+    func(*args)  # Warm up, and fail early if the binding is not loaded
+
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        func(*args)
+    return calls / (time.perf_counter() - t0)
+
+
+def run(calls: int) -> dict[str, float | None]:
+    """Benchmark every binding; unavailable bindings map to None."""
+    results: dict[str, float | None] = {}
+    for name, func, args in BENCHMARKS:
+        try:
+            results[name] = calls_per_second(func, args, calls)
+        except (ImportError, TypeError):
+            # TypeError: the Rust extension is missing and the name is None
+            results[name] = None
+    return results
+
+
+def scaling(size: int, thread_counts: list[int], repeat: int = 3) -> dict[int, float]:
+    """Return process_data_parallel throughput, in ints/sec, per thread count."""
+    values = array.array("i", bytes(size * 4))
+    out = array.array("i", bytes(size * 4))
+
+    results = {}
+    for threads in thread_counts:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            process_data_parallel(values, out=out, workers=threads)
+            best = min(best, time.perf_counter() - t0)
+        results[threads] = size / best
+    return results
+
+
+def factorial_times(ns: list[int]) -> list[tuple[int, float, float]]:
+    """Return (n, compute_factorial seconds, math.factorial seconds) per n."""
+    results = []
+    for n in ns:
+        factorial.factorial.cache_clear()
+        t0 = time.perf_counter()
+        compute_factorial(n)
+        engine = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        math.factorial(n)
+        results.append((n, engine, time.perf_counter() - t0))
+    return results
+
+
+def main():
+    """Print calls/sec for each binding, or the --scaling/--factorial results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=100_000, help="Calls per binding")
+    parser.add_argument(
+        "--scaling", action="store_true", help="Measure process_data_parallel thread scaling"
+    )
+    parser.add_argument(
+        "--factorial", action="store_true", help="Measure exact factorials up to 10**6"
+    )
+    parser.add_argument(
+        "--sizes", default="10000000,100000000", help="Comma-separated array lengths"
+    )
+    args = parser.parse_args()
+
+    if args.factorial:
+        print(f"{'n':>10} {'compute_factorial':>18} {'math.factorial':>15}")
+        print("-" * 45)
+        for n, engine, reference in factorial_times([10**3, 10**4, 10**5, 10**6]):
+            print(f"{n:>10,} {engine * 1000:>16.1f}ms {reference * 1000:>13.1f}ms")
+        return
+
+    if args.scaling:
+        cpus = os.cpu_count() or 1
+        thread_counts = sorted({1, 2, 4, 8, cpus})
+        print(f"{'ints':>12} {'threads':>8} {'M ints/sec':>12} {'speedup':>8}")
+        print("-" * 43)
+        for size in map(int, args.sizes.split(",")):
+            results = scaling(size, thread_counts)
+            for threads, rate in results.items():
+                speedup = rate / results[1]
+                print(f"{size:>12,} {threads:>8} {rate / 1e6:>12,.0f} {speedup:>7.2f}x")
+        return
+
+    print(f"{'binding':<28} {'calls/sec':>14} {'ns/call':>10}")
+    print("-" * 54)
+    for name, rate in run(args.calls).items():
+        if rate is None:
+            print(f"{name:<28} {'not loaded':>14}")
+        else:
+            print(f"{name:<28} {rate:>14,.0f} {1e9 / rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -78,7 +78,7 @@ def demo_go_bindings():
     except ImportError as e:
         print(f"⚠️  Go bindings not available: {e}")
         print(
-            "   Build with: cd source/hildie/go && go build -buildmode=c-shared -o libhildie_go.so ./..."
+            "   Build with: cd source/hildie/go && go build -buildmode=c-shared -o libhildie_go.so ./capi"
         )
 
 
@@ -10,7 +10,12 @@ Provides Python interfaces to:
 # Import Rust bindings
 try:
     from hildie_bindings import (
+        add_arrays_rust,
         greet_all,
+        greet_all_packed,
+        greet_iter,
+        product_rust,
+        sum_rust,
     )
     from hildie_bindings import (
         py_add as add_rust,
@@ -23,27 +28,49 @@ except ImportError:
     greet_rust = None
     add_rust = None
     greet_all = None
+    greet_all_packed = None
+    greet_iter = None
+    add_arrays_rust = None
+    sum_rust = None
+    product_rust = None
 
 # Import Go bindings
 # Import C++ bindings
 from .cpp_bindings import (
     compute_factorial,
     process_data,
+    process_data_file,
+    process_data_inplace,
+    process_data_parallel,
+    process_data_stream,
 )
 from .go_bindings import (
     add_go,
+    add_go_many,
     greet_go,
+    greet_go_many,
 )
 
 __all__ = [
     # Rust
     "greet_rust",
     "add_rust",
+    "add_arrays_rust",
+    "sum_rust",
+    "product_rust",
     "greet_all",
+    "greet_all_packed",
+    "greet_iter",
     # Go
     "greet_go",
     "add_go",
+    "greet_go_many",
+    "add_go_many",
     # C++
     "process_data",
+    "process_data_inplace",
+    "process_data_parallel",
+    "process_data_stream",
+    "process_data_file",
     "compute_factorial",
 ]
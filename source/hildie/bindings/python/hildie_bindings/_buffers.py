@@ -0,0 +1,44 @@
+"""
+Buffer-protocol helpers shared by the ctypes bindings
+"""
+
+import ctypes
+import sys
+
+_INT_SIZE = ctypes.sizeof(ctypes.c_int)
+
+# Buffer formats whose items are C ints; raw byte buffers are read as ints too
+_INT_FORMATS = ("i", "l") if sys.byteorder == "big" else ("i", "l", "<i", "<l")
+_BYTE_FORMATS = ("B", "b", "c")
+
+
+def _int_buffer(data, writable: bool = False):
+    """Return (ctypes int array sharing data's memory, length), or None.
+
+    None means data is not a C-contiguous buffer of C ints (int32), or not a
+    writable one if writable is set. Read-only buffers are copied once at C
+    level, since ctypes cannot wrap them in place.
+    """
+    if isinstance(data, (list, tuple)):
+        return None
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+
+    fmt = view.format.lstrip("@=")
+    if fmt in _BYTE_FORMATS:
+        usable = view.nbytes % _INT_SIZE == 0
+    else:
+        usable = view.itemsize == _INT_SIZE and fmt in _INT_FORMATS
+    usable = usable and view.c_contiguous and not (writable and view.readonly)
+    count = view.nbytes // _INT_SIZE
+    readonly = view.readonly
+    view.release()
+
+    if not usable:
+        return None
+    array_type = ctypes.c_int * count
+    if readonly:
+        return array_type.from_buffer_copy(data), count
+    return array_type.from_buffer(data), count
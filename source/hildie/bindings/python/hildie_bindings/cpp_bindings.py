@@ -5,8 +5,18 @@ Uses ctypes to call compiled C++ shared library.
 Requires: g++ -shared -fPIC -o libhildie_cpp.so cpp/hildie.cpp
 """
 
+import array
 import ctypes
+import functools
+import itertools
+import math
 import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
+
+from . import factorial
+from ._buffers import _INT_SIZE, _int_buffer
 
 # Try to load the C++ shared library
 _lib_path: str | None = None
@@ -26,8 +36,43 @@ for path in _search_paths:
         _lib_path = path
         break
 
+
+def _prototype(lib: ctypes.CDLL, name: str, restype, *argtypes):
+    """Look up a foreign function once and fix its signature."""
+    func = getattr(lib, name)
+    func.argtypes = list(argtypes)
+    func.restype = restype
+    return func
+
+
+# Foreign functions are resolved and typed once here; doing it per call costs
+# more than the call itself in tight loops
+_process_data_into = _process_data_inplace = _factorial = None
+
 if _lib_path:
     _hildie_cpp = ctypes.CDLL(_lib_path)
+
+    # The caller-allocated variants are used rather than process_data, so no
+    # call allocates on the C++ side or has to free across the FFI boundary
+    # C++: void process_data_into(const int* data, int size, int* out)
+    _process_data_into = _prototype(
+        _hildie_cpp,
+        "process_data_into",
+        None,
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.c_int,
+        ctypes.POINTER(ctypes.c_int),
+    )
+    # C++: void process_data_inplace(int* data, int size)
+    _process_data_inplace = _prototype(
+        _hildie_cpp,
+        "process_data_inplace",
+        None,
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.c_int,
+    )
+    # C++: long factorial(int n)
+    _factorial = _prototype(_hildie_cpp, "factorial", ctypes.c_long, ctypes.c_int)
 else:
     _hildie_cpp = None
     import warnings
@@ -40,53 +85,256 @@ else:
     )
 
 
-def process_data(data: list[int]) -> list[int]:
+# Inputs with fewer ints than this are processed on one thread; below it the
+# cost of dispatching to a pool outweighs the work saved
+PARALLEL_THRESHOLD = 1_000_000
+
+# Largest n whose factorial fits in a C long, the C++ factorial's return type
+_NATIVE_FACTORIAL_MAX = max(
+    n for n in range(64) if math.factorial(n) < 2 ** (8 * ctypes.sizeof(ctypes.c_long) - 1)
+)
+
+# Ints processed per step when streaming; 256 KiB stays in cache and makes
+# the per-chunk call overhead negligible
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def process_data(data, out=None):
     """Process data using C++ library.
 
+    A list (or any sequence) of ints gives a list back. Writable buffers of C
+    ints (array.array("i"), bytearray, memoryview, NumPy int32 arrays) are
+    handed to C++ without copying and give an array.array("i") back; bytes
+    and bytearray are read as native-endian int32 values. Pass out to have
+    the results written into a buffer of your own instead. C++ writes
+    straight into the result, so no call allocates on the C++ side, and none
+    allocates at all when out is given.
+
     Args:
-        data: List of integers to process
+        data: Integers to process
+        out: Optional writable buffer of C ints, at least as long as data
 
     Returns:
-        Processed data
+        Processed data; out itself if it was given
+
+    Raises:
+        TypeError: If out is not a writable buffer of C ints
+        ValueError: If out is shorter than data
     """
-    if _hildie_cpp is None:
+    if _process_data_into is None:
         raise ImportError("C++ bindings not loaded. Please compile libhildie_cpp first.")
+    return _process(data, out, _process_data_into)
 
-    # Define the C++ function signature
-    # C++: int* process_data(int* data, int size)
-    _hildie_cpp.process_data.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_int]
-    _hildie_cpp.process_data.restype = ctypes.POINTER(ctypes.c_int)
 
-    # Convert Python list to C array
-    c_array = (ctypes.c_int * len(data))(*data)
+def _process(data, out, kernel):
+    """Run kernel(source, count, dest) over data; see process_data for the rules."""
+    source = _int_buffer(data)
+    if source is None:
+        # Convert Python list to C array
+        count = len(data)
+        c_array = (ctypes.c_int * count)(*data)
+    else:
+        c_array, count = source
 
-    # Call C++ function
-    result_ptr = _hildie_cpp.process_data(c_array, len(data))
+    if out is not None:
+        target = _int_buffer(out, writable=True)
+        if target is None:
+            raise TypeError("out must be a writable, C-contiguous buffer of C ints")
+        if target[1] < count:
+            raise ValueError(f"out holds {target[1]} ints, need {count}")
+        kernel(c_array, count, target[0])
+        return out
 
-    # Convert C array back to Python list
-    result = list(result_ptr[: len(data)])
-
-    # Free C++ allocated memory
-    _hildie_cpp.free_memory(result_ptr)
+    if source is None:
+        # The C array is ours; process it in place and convert it back
+        kernel(c_array, count, c_array)
+        return c_array[:]
 
+    result = array.array("i", bytes(count * _INT_SIZE))
+    kernel(c_array, count, _int_buffer(result, writable=True)[0])
     return result
 
 
-def compute_factorial(n: int) -> int:
-    """Compute factorial using C++ library.
+def _at(c_array, index: int):
+    """Return the c_int at c_array[index], sharing its memory."""
+    return ctypes.c_int.from_address(ctypes.addressof(c_array) + index * _INT_SIZE)
+
+
+def _into_parallel(source, count: int, dest, workers: int):
+    """Run process_data_into over disjoint slices on a thread pool."""
+    step = max(-(-count // workers), 1)
+    starts = range(0, count, step)
+
+    def run(start: int):
+        size = min(step, count - start)
+        _process_data_into(ctypes.byref(_at(source, start)), size, ctypes.byref(_at(dest, start)))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # list() re-raises any error from a worker
+        list(pool.map(run, starts))
+
+
+def process_data_parallel(
+    data, out=None, workers: int | None = None, threshold: int = PARALLEL_THRESHOLD
+):
+    """Process data like process_data, split across threads.
+
+    ctypes releases the GIL for the length of every foreign call, so each
+    thread runs the C++ kernel on its own slice of the input at the same
+    time, writing to a disjoint slice of one output buffer. Inputs shorter
+    than threshold are processed on the calling thread, where starting a
+    pool would cost more than it saves.
 
     Args:
-        n: Number to compute factorial for
+        data: Integers to process (see process_data)
+        out: Optional writable buffer of C ints, at least as long as data
+        workers: Threads to use (default: CPU count)
+        threshold: Minimum input length to split
 
     Returns:
-        Factorial result
+        Processed data; out itself if it was given
     """
-    if _hildie_cpp is None:
+    if _process_data_into is None:
         raise ImportError("C++ bindings not loaded. Please compile libhildie_cpp first.")
 
-    # Define the C++ function signature
-    # C++: long factorial(int n)
-    _hildie_cpp.factorial.argtypes = [ctypes.c_int]
-    _hildie_cpp.factorial.restype = ctypes.c_long
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(data) < threshold:
+        return _process(data, out, _process_data_into)
+    return _process(data, out, functools.partial(_into_parallel, workers=workers))
+
+
+def process_data_inplace(data):
+    """Process a writable buffer of C ints in place.
+
+    Args:
+        data: Writable buffer of C ints (see process_data)
+
+    Returns:
+        data, with every value processed
+
+    Raises:
+        TypeError: If data is not a writable buffer of C ints
+    """
+    if _process_data_inplace is None:
+        raise ImportError("C++ bindings not loaded. Please compile libhildie_cpp first.")
+
+    target = _int_buffer(data, writable=True)
+    if target is None:
+        raise TypeError("data must be a writable, C-contiguous buffer of C ints")
+    _process_data_inplace(*target)
+    return data
 
-    return _hildie_cpp.factorial(n)
+
+def _fill(f: BinaryIO, raw: memoryview) -> int:
+    """Read from f into raw until it is full or f is exhausted; return bytes read."""
+    filled = 0
+    while filled < len(raw):
+        read = f.readinto(raw[filled:])
+        if not read:
+            break
+        filled += read
+    return filled
+
+
+def _stream_chunks(source, buffer, raw: memoryview) -> Iterator[int]:
+    """Load successive chunks of source into buffer, yielding each chunk's length."""
+    if hasattr(source, "readinto"):
+        while filled := _fill(source, raw):
+            if filled % _INT_SIZE:
+                raise ValueError(
+                    f"Trailing {filled % _INT_SIZE} bytes: input is not a whole number of C ints"
+                )
+            yield filled // _INT_SIZE
+        return
+
+    iterator = iter(source)
+    while chunk := list(itertools.islice(iterator, len(buffer))):
+        buffer[: len(chunk)] = chunk
+        yield len(chunk)
+
+
+def process_data_stream(
+    source: Iterable[int] | BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[memoryview]:
+    """Process a stream of ints of any length in fixed-size chunks.
+
+    source is an iterable of ints, or a binary file of native-endian C ints
+    (read straight into the chunk buffer with readinto). Every chunk goes
+    through one reused C buffer, processed in place, so memory use is
+    bounded by chunk_size however long the input is.
+
+    Each yielded memoryview (format "i") is a view of that reused buffer and
+    is only valid until the next chunk is requested; copy it (tolist(),
+    bytes(), array.array("i", view)) to keep it.
+
+    Args:
+        source: Integers or binary file to process
+        chunk_size: Ints processed per step
+
+    Returns:
+        Iterator over the processed chunks, in order
+
+    Raises:
+        ValueError: If a file is not a whole number of C ints
+    """
+    # Checked here rather than in the generator, so the error is immediate
+    if _process_data_inplace is None:
+        raise ImportError("C++ bindings not loaded. Please compile libhildie_cpp first.")
+    return _process_stream(source, chunk_size)
+
+
+def _process_stream(source, chunk_size: int) -> Iterator[memoryview]:
+    buffer = (ctypes.c_int * chunk_size)()
+    view = memoryview(buffer).cast("B").cast("i")
+    raw = view.cast("B")
+    for count in _stream_chunks(source, buffer, raw):
+        _process_data_inplace(buffer, count)
+        yield view[:count]
+
+
+def process_data_file(
+    source: Iterable[int] | BinaryIO, dest: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE
+) -> int:
+    """Process a stream of ints and write the results to a binary file.
+
+    Results are written as native-endian C ints, chunk by chunk, as they are
+    produced (see process_data_stream), so input and output can both be far
+    larger than memory.
+
+    Args:
+        source: Integers or binary file to process
+        dest: Binary file to write the results to
+        chunk_size: Ints processed per step
+
+    Returns:
+        Number of ints written
+    """
+    written = 0
+    for chunk in process_data_stream(source, chunk_size):
+        dest.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def compute_factorial(n: int) -> int:
+    """Compute factorial, exactly, for any n.
+
+    The C++ factorial returns a C long, so it is only called for n whose
+    factorial fits in one (n <= 20 with a 64-bit long); larger n, or any n
+    when the library is not loaded, are computed by factorial.factorial,
+    which is exact and memoizes recent results.
+
+    Args:
+        n: Number to compute factorial for
+
+    Returns:
+        Factorial result
+
+    Raises:
+        ValueError: If n is negative
+    """
+    if n < 0:
+        raise ValueError(f"factorial() not defined for negative values: {n}")
+    if n <= _NATIVE_FACTORIAL_MAX and _factorial is not None:
+        return _factorial(n)
+    return factorial.factorial(n)
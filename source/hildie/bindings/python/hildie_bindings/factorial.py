@@ -0,0 +1,81 @@
+"""
+Exact factorials of any size
+
+Used by compute_factorial for results that do not fit in a C long.
+"""
+
+import functools
+import math
+
+# Below this, math.factorial (binary splitting in C) is fastest; above it the
+# prime-swing recursion wins, since half its work is one big squaring
+SWING_THRESHOLD = 20_000
+
+# Recently computed factorials kept; 10**6! alone is about 2.3 MB
+CACHE_SIZE = 16
+
+
+def _primes(n: int) -> list[int]:
+    """Return the primes up to n (sieve of Eratosthenes)."""
+    sieve = bytearray([1]) * (n + 1)
+    sieve[:2] = b"\0\0"
+    for i in range(2, math.isqrt(n) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytes(len(range(i * i, n + 1, i)))
+    return [i for i, is_prime in enumerate(sieve) if is_prime]
+
+
+def _product(values: list[int], start: int, stop: int) -> int:
+    """Multiply values[start:stop] with a balanced multiplication tree."""
+    if stop - start <= 8:
+        return math.prod(values[start:stop])
+    middle = (start + stop) // 2
+    return _product(values, start, middle) * _product(values, middle, stop)
+
+
+def _swing(n: int, primes: list[int]) -> int:
+    """Return the swing number n! / ((n // 2)!) ** 2 from its prime factors."""
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        # The exponent of p is the number of odd terms in n // p, n // p**2, ...
+        exponent = 0
+        q = n
+        while q >= p:
+            q //= p
+            exponent += q & 1
+        if exponent:
+            factors.append(p**exponent)
+    return _product(factors, 0, len(factors))
+
+
+def _prime_swing(n: int, primes: list[int]) -> int:
+    if n < SWING_THRESHOLD:
+        return math.factorial(n)
+    return _prime_swing(n // 2, primes) ** 2 * _swing(n, primes)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def factorial(n: int) -> int:
+    """Compute n! exactly.
+
+    Small n go to math.factorial; larger n use Luschny's prime-swing
+    algorithm, n! = ((n // 2)!)**2 * swing(n), with the swing number built
+    from its prime factorisation in a balanced product tree. The last
+    CACHE_SIZE results are memoized.
+
+    Args:
+        n: Non-negative integer
+
+    Returns:
+        n!
+
+    Raises:
+        ValueError: If n is negative
+    """
+    if n < 0:
+        raise ValueError(f"factorial() not defined for negative values: {n}")
+    if n < SWING_THRESHOLD:
+        return math.factorial(n)
+    return _prime_swing(n, _primes(n))
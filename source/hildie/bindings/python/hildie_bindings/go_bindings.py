@@ -2,11 +2,15 @@
 Python bindings for Hildie Go library
 
 Uses ctypes to call compiled Go shared library.
-Requires: go build -o libhildie_go.so -buildmode=c-shared ./source/hildie/go
+Requires: cd source/hildie/go && go build -o libhildie_go.so -buildmode=c-shared ./capi
 """
 
+import array
 import ctypes
 import os
+from collections.abc import Iterable
+
+from ._buffers import _INT_SIZE, _int_buffer
 
 # Try to load the Go shared library
 _lib_path: str | None = None
@@ -26,15 +30,56 @@ for path in _search_paths:
         _lib_path = path
         break
 
+
+def _prototype(lib: ctypes.CDLL, name: str, restype, *argtypes):
+    """Look up a foreign function once and fix its signature."""
+    func = getattr(lib, name)
+    func.argtypes = list(argtypes)
+    func.restype = restype
+    return func
+
+
+# Foreign functions are resolved and typed once here, so calls in a loop pay
+# only for the cgo transition
+_greet = _add = _add_many = _greet_many = _free_string = None
+
 if _lib_path:
     _hildie_go = ctypes.CDLL(_lib_path)
+
+    # Strings come back as c_void_p rather than c_char_p, so the pointer
+    # survives for FreeString after the bytes are copied out
+    # Go: func Greet(name *C.char) *C.char
+    _greet = _prototype(_hildie_go, "Greet", ctypes.c_void_p, ctypes.c_char_p)
+    # Go: func Add(a, b C.int) C.int
+    _add = _prototype(_hildie_go, "Add", ctypes.c_int, ctypes.c_int, ctypes.c_int)
+    # Go: func AddMany(a, b, out *C.int, n C.int)
+    _add_many = _prototype(
+        _hildie_go,
+        "AddMany",
+        None,
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.c_int,
+    )
+    # Go: func GreetMany(names *C.char, size C.int, outSize *C.int) *C.char
+    _greet_many = _prototype(
+        _hildie_go,
+        "GreetMany",
+        ctypes.c_void_p,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.POINTER(ctypes.c_int),
+    )
+    # Go: func FreeString(s *C.char)
+    _free_string = _prototype(_hildie_go, "FreeString", None, ctypes.c_void_p)
 else:
     _hildie_go = None
     import warnings
 
     warnings.warn(
         "Hildie Go bindings not found. Install with: "
-        "cd source/hildie/go && go build -o libhildie_go.so -buildmode=c-shared ./...",
+        "cd source/hildie/go && go build -o libhildie_go.so -buildmode=c-shared ./capi",
         RuntimeWarning,
         stacklevel=2,
     )
@@ -49,16 +94,14 @@ def greet_go(name: str) -> str:
     Returns:
         Greeting string from Go
     """
-    if _hildie_go is None:
+    if _greet is None:
         raise ImportError("Go bindings not loaded. Please compile libhildie_go first.")
 
-    # Define the Go function signature
-    # Go: func Greet(name string) string
-    _hildie_go.Greet.argtypes = [ctypes.c_char_p]
-    _hildie_go.Greet.restype = ctypes.c_char_p
-
-    result = _hildie_go.Greet(name.encode("utf-8"))
-    return result.decode("utf-8")
+    result = _greet(name.encode("utf-8"))
+    try:
+        return ctypes.string_at(result).decode("utf-8")
+    finally:
+        _free_string(result)
 
 
 def add_go(a: int, b: int) -> int:
@@ -71,12 +114,95 @@ def add_go(a: int, b: int) -> int:
     Returns:
         Sum from Go
     """
-    if _hildie_go is None:
+    if _add is None:
+        raise ImportError("Go bindings not loaded. Please compile libhildie_go first.")
+
+    return _add(a, b)
+
+
+def greet_go_many(names: Iterable[str]) -> list[str]:
+    """Greet many people with one call into the Go library.
+
+    The names are packed into one buffer of NUL-terminated strings and the
+    greetings come back the same way, so a batch of any size costs a single
+    cgo transition, and the returned buffer is freed straight away.
+
+    Args:
+        names: Names to greet
+
+    Returns:
+        Greeting strings from Go, in order
+
+    Raises:
+        ValueError: If a name contains a NUL character
+    """
+    if _greet_many is None:
         raise ImportError("Go bindings not loaded. Please compile libhildie_go first.")
 
-    # Define the Go function signature
-    # Go: func Add(a, b int) int
-    _hildie_go.Add.argtypes = [ctypes.c_int, ctypes.c_int]
-    _hildie_go.Add.restype = ctypes.c_int
+    names = list(names)
+    if not names:
+        return []
+    joined = "\0".join(names)
+    # Every NUL in the joined string must be one of the separators
+    if joined.count("\0") != len(names) - 1:
+        raise ValueError("Names must not contain NUL characters")
+    packed = (joined + "\0").encode("utf-8")
+
+    size = ctypes.c_int()
+    result = _greet_many(packed, len(packed), ctypes.byref(size))
+    try:
+        greetings = ctypes.string_at(result, size.value)
+    finally:
+        _free_string(result)
+
+    return greetings[:-1].decode("utf-8").split("\0")
+
+
+def add_go_many(a, b, out=None):
+    """Add two equal-length sequences elementwise with one call into Go.
+
+    Lists give a list back; buffers of C ints (array.array("i"), NumPy int32
+    arrays, ...) are passed to Go without copying and give an
+    array.array("i") back. Pass out to have the sums written into a buffer
+    of your own; it may be a or b.
+
+    Args:
+        a: First sequence of integers
+        b: Second sequence of integers
+        out: Optional writable buffer of C ints, at least as long as a
+
+    Returns:
+        The elementwise sums; out itself if it was given
+
+    Raises:
+        TypeError: If out is not a writable buffer of C ints
+        ValueError: If a and b differ in length, or out is too short
+    """
+    if _add_many is None:
+        raise ImportError("Go bindings not loaded. Please compile libhildie_go first.")
 
-    return _hildie_go.Add(a, b)
+    left = _int_buffer(a) or _to_c_ints(a)
+    right = _int_buffer(b) or _to_c_ints(b)
+    count = left[1]
+    if right[1] != count:
+        raise ValueError(f"Length mismatch: {count} != {right[1]}")
+
+    if out is not None:
+        target = _int_buffer(out, writable=True)
+        if target is None:
+            raise TypeError("out must be a writable, C-contiguous buffer of C ints")
+        if target[1] < count:
+            raise ValueError(f"out holds {target[1]} ints, need {count}")
+        _add_many(left[0], right[0], target[0], count)
+        return out
+
+    result = array.array("i", bytes(count * _INT_SIZE))
+    _add_many(left[0], right[0], _int_buffer(result, writable=True)[0], count)
+    if isinstance(a, (list, tuple)) or isinstance(b, (list, tuple)):
+        return result.tolist()
+    return result
+
+
+def _to_c_ints(values) -> tuple:
+    """Copy a sequence of ints into a C int array (array.array converts in C)."""
+    return _int_buffer(array.array("i", values))
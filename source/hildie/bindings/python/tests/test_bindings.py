@@ -7,15 +7,38 @@ Tests all language bindings:
 - C++ (via ctypes)
 """
 
+import array
+import ctypes
+import io
+import math
+import os
+import tempfile
+import tracemalloc
+from unittest.mock import patch
+
 import pytest
 from hildie_bindings import (
+    add_arrays_rust,
     add_go,
+    add_go_many,
     add_rust,
     compute_factorial,
+    cpp_bindings,
+    factorial,
+    go_bindings,
     greet_all,
+    greet_all_packed,
     greet_go,
+    greet_go_many,
+    greet_iter,
     greet_rust,
     process_data,
+    process_data_file,
+    process_data_inplace,
+    process_data_parallel,
+    process_data_stream,
+    product_rust,
+    sum_rust,
 )
 
 
@@ -84,6 +107,117 @@ class TestRustBindings:
         assert isinstance(result, str)
 
 
+class TestRustBatches:
+    """Tests for the GIL-releasing, parallel Rust batch greetings."""
+
+    pytestmark = pytest.mark.skipif(greet_iter is None, reason="Rust bindings not built")
+
+    def test_greet_all_matches_greet_rust(self):
+        """Test serial and parallel batches against one greeting at a time."""
+        for count in (0, 3, 10_000):
+            names = [f"user{i}" for i in range(count)]
+            assert greet_all(names) == [greet_rust(name) for name in names]
+
+    def test_greet_all_packed(self):
+        """Test the packed NUL-terminated result."""
+        names = ["Alice", "", "Zoë"]
+        packed = greet_all_packed(names)
+        assert isinstance(packed, bytes)
+        assert packed.decode().split("\0")[:-1] == greet_all(names)
+        assert greet_all_packed([]) == b""
+
+    def test_greet_iter_is_lazy(self):
+        """Test that names are pulled from the iterable a chunk at a time."""
+        pulled = []
+
+        def names():
+            for i in range(100_000):
+                pulled.append(i)
+                yield f"user{i}"
+
+        greetings = greet_iter(names())
+        assert next(greetings) == greet_rust("user0")
+        assert len(pulled) < 100_000
+        assert sum(1 for _ in greetings) == 99_999
+
+    def test_greet_all_1m_keeps_order(self):
+        """Test that a million names split across threads come back in order."""
+        names = [f"user{i}" for i in range(1_000_000)]
+
+        greetings = greet_all(names)
+
+        assert len(greetings) == len(names)
+        # A prime stride samples every parallel chunk, including its edges
+        assert greetings[::997] == [greet_rust(name) for name in names[::997]]
+        assert greetings[-1] == greet_rust("user999999")
+
+
+class TestRustKernels:
+    """Tests for the buffer-protocol numeric kernels in Rust."""
+
+    pytestmark = pytest.mark.skipif(sum_rust is None, reason="Rust bindings not built")
+
+    def test_sum_and_product(self):
+        """Test reductions over int64 buffers."""
+        values = array.array("q", [3, -1, 4, 2])
+        assert sum_rust(values) == 8
+        assert product_rust(values) == -24
+        assert sum_rust(array.array("q")) == 0
+        assert product_rust(array.array("q")) == 1
+
+    def test_sum_is_exact(self):
+        """Test that sums past int64 do not wrap."""
+        assert sum_rust(array.array("q", [2**62] * 4)) == 2**64
+
+    def test_product_overflow(self):
+        """Test that a product past int64 raises, unless a factor is zero."""
+        assert product_rust(array.array("q", [2**40, 2**40, 0])) == 0
+        with pytest.raises(OverflowError, match="does not fit in an int64"):
+            product_rust(array.array("q", [2**40, 2**40]))
+
+    def test_add_arrays(self):
+        """Test elementwise addition into out, including in place."""
+        a = array.array("q", [1, 2, 3])
+        out = array.array("q", [0, 0, 0])
+        assert add_arrays_rust(a, a, out) is out
+        assert out == array.array("q", [2, 4, 6])
+
+        add_arrays_rust(a, out, a)
+        assert a == array.array("q", [3, 6, 9])
+
+        result = add_arrays_rust(a, a)
+        assert isinstance(result, array.array) and result == array.array("q", [6, 12, 18])
+        assert add_arrays_rust(array.array("q"), array.array("q")) == array.array("q")
+
+    def test_add_arrays_overflow(self):
+        """Test that a sum past int64 raises and leaves out untouched."""
+        a = array.array("q", [1, 2**62])
+        out = array.array("q", [7, 7])
+        with pytest.raises(OverflowError, match="int64"):
+            add_arrays_rust(a, a, out)
+        assert out == array.array("q", [7, 7])
+        assert add_arrays_rust(a, array.array("q", [0, 2**62 - 1]))[-1] == 2**63 - 1
+
+    def test_add_arrays_errors(self):
+        """Test length and writability checks."""
+        a = array.array("q", [1, 2])
+        with pytest.raises(ValueError, match="out has 1 items, needs 2"):
+            add_arrays_rust(a, a, array.array("q", [0]))
+        with pytest.raises(ValueError, match="length mismatch"):
+            add_arrays_rust(a, a[:1], array.array("q", [0, 0]))
+
+    def test_numpy_10m(self):
+        """Test the kernels over 10M NumPy int64 values, several sum chunks long."""
+        np = pytest.importorskip("numpy")
+        values = np.arange(10_000_000, dtype="int64")
+        out = np.empty_like(values)
+
+        assert sum_rust(values) == 10_000_000 * 9_999_999 // 2
+        assert sum_rust(-values) == -(10_000_000 * 9_999_999 // 2)
+        assert add_arrays_rust(values, values, out) is out
+        assert (out == 2 * values).all()
+
+
 class TestGoBindings:
     """Tests for Go bindings via ctypes."""
 
@@ -137,6 +271,55 @@ class TestGoBindings:
         assert result == 3000000
 
 
+class TestGoBatches:
+    """Tests for the batched Go entry points."""
+
+    pytestmark = pytest.mark.skipif(go_bindings._add_many is None, reason="Go bindings not loaded")
+
+    def test_greet_go_many(self):
+        """Test that a batch matches greeting one name at a time."""
+        names = ["Alice", "", "Bob & Alice", "Zoë"]
+        assert greet_go_many(names) == [greet_go(name) for name in names]
+        assert greet_go_many([]) == []
+
+    def test_greet_go_many_rejects_nul(self):
+        """Test that names with NUL characters are rejected."""
+        with pytest.raises(ValueError, match="NUL"):
+            greet_go_many(["a\0b"])
+
+    def test_add_go_many(self):
+        """Test elementwise addition of lists, buffers and into out."""
+        assert add_go_many([1, -2, 3], [10, 20, -30]) == [11, 18, -27]
+        assert add_go_many([], []) == []
+
+        values = array.array("i", [1, 2, 3])
+        assert add_go_many(values, values) == array.array("i", [2, 4, 6])
+        assert add_go_many(values, values, out=values) is values
+        assert values == array.array("i", [2, 4, 6])
+
+    def test_add_go_many_length_mismatch(self):
+        """Test that inputs of different lengths are rejected."""
+        with pytest.raises(ValueError, match="Length mismatch: 2 != 1"):
+            add_go_many([1, 2], [1])
+
+    def test_batches_cross_ffi_once(self):
+        """Test that 1M greetings and additions are one call each, not 1M."""
+        names = [f"user{i}" for i in range(1_000_000)]
+        values = array.array("i", range(1_000_000))
+
+        with (
+            patch.object(go_bindings, "_greet_many", wraps=go_bindings._greet_many) as greet,
+            patch.object(go_bindings, "_add_many", wraps=go_bindings._add_many) as add,
+        ):
+            greetings = greet_go_many(names)
+            sums = add_go_many(values, values)
+
+        assert greet.call_count == 1
+        assert add.call_count == 1
+        assert len(greetings) == 1_000_000 and greetings[-1] == greet_go("user999999")
+        assert sums[-1] == 2 * 999_999
+
+
 class TestCppBindings:
     """Tests for C++ bindings via ctypes."""
 
@@ -207,6 +390,309 @@ class TestCppBindings:
             assert compute_factorial(n) == expected_fact
 
 
+class TestCppBuffers:
+    """Tests for passing buffers to process_data without copying."""
+
+    pytestmark = pytest.mark.skipif(
+        cpp_bindings._process_data_into is None, reason="C++ bindings not loaded"
+    )
+
+    def test_buffer_inputs(self):
+        """Test that int32 buffers give an int32 array back."""
+        values = array.array("i", [1, -2, 3])
+        assert process_data(values) == array.array("i", [2, -4, 6])
+        assert process_data(memoryview(values)) == array.array("i", [2, -4, 6])
+        assert process_data(bytearray(values.tobytes())) == array.array("i", [2, -4, 6])
+        assert process_data(values.tobytes()) == array.array("i", [2, -4, 6])
+        assert process_data(array.array("i")) == array.array("i")
+
+    def test_other_buffers_are_converted(self):
+        """Test that buffers of other item types take the list path."""
+        assert process_data(array.array("q", [1, 2])) == [2, 4]
+
+    def test_out_buffer(self):
+        """Test that results are written into a caller-provided buffer."""
+        out = array.array("i", [0] * 4)
+        assert process_data([1, 2, 3], out=out) is out
+        assert out == array.array("i", [2, 4, 6, 0])
+
+    def test_out_buffer_errors(self):
+        """Test that an unusable out buffer is rejected."""
+        for out, error, message in (
+            (array.array("i", [0]), ValueError, "out holds 1 ints, need 2"),
+            (bytes(8), TypeError, "writable"),
+            (array.array("q", [0, 0]), TypeError, "buffer of C ints"),
+        ):
+            with pytest.raises(error, match=message):
+                process_data([1, 2], out=out)
+
+    def test_inplace(self):
+        """Test processing a buffer in place."""
+        values = array.array("i", [5, 6, 7])
+        assert process_data_inplace(values) is values
+        assert values == array.array("i", [10, 12, 14])
+
+        for data in ([1, 2], b"\x01\x00\x00\x00", array.array("q", [1])):
+            with pytest.raises(TypeError, match="writable, C-contiguous buffer of C ints"):
+                process_data_inplace(data)
+
+    def test_out_may_alias_data(self):
+        """Test that writing into the input buffer itself is safe."""
+        values = array.array("i", range(10))
+        process_data(values, out=values)
+        assert values == array.array("i", range(0, 20, 2))
+
+    def test_repeated_batches_reuse_out(self):
+        """Test that every batch is written into the same out buffer."""
+        addresses, record = self.recording_kernel()
+        out = array.array("i", bytes(10 * 4))
+
+        with patch.object(cpp_bindings, "_process_data_into", side_effect=record):
+            for start in range(0, 100, 10):
+                batch = array.array("i", range(start, start + 10))
+                assert process_data(batch, out=out) is out
+                assert out == array.array("i", range(2 * start, 2 * start + 20, 2))
+
+        assert len(addresses) == 10
+        assert {dest for _, dest in addresses} == {out.buffer_info()[0]}
+
+    def test_numpy_int32(self):
+        """Test that NumPy int32 arrays are processed without copying."""
+        np = pytest.importorskip("numpy")
+        values = np.arange(5, dtype="int32")
+        out = np.empty_like(values)
+
+        process_data(values, out=out)
+        assert out.tolist() == [0, 2, 4, 6, 8]
+        process_data_inplace(values)
+        assert values.tolist() == [0, 2, 4, 6, 8]
+
+    def recording_kernel(self):
+        """Return ([(source, dest) addresses], a kernel that appends to it)."""
+        addresses = []
+        kernel = cpp_bindings._process_data_into
+
+        def record(source, count, dest):
+            addresses.append((ctypes.addressof(source), ctypes.addressof(dest)))
+            kernel(source, count, dest)
+
+        return addresses, record
+
+    def test_buffers_are_not_copied(self):
+        """Test that the C++ kernel reads and writes the callers' own memory."""
+        addresses, record = self.recording_kernel()
+        values = array.array("i", range(1000))
+        out = array.array("i", bytes(len(values) * 4))
+        with patch.object(cpp_bindings, "_process_data_into", side_effect=record):
+            assert process_data(values, out=out) is out
+
+        assert addresses == [(values.buffer_info()[0], out.buffer_info()[0])]
+        assert out == array.array("i", range(0, 2000, 2))
+
+    def test_numpy_buffers_are_not_copied(self):
+        """Test that NumPy int32 arrays are passed to C++ by address."""
+        np = pytest.importorskip("numpy")
+        addresses, record = self.recording_kernel()
+        values = np.arange(1000, dtype="int32")
+        out = np.empty_like(values)
+        with patch.object(cpp_bindings, "_process_data_into", side_effect=record):
+            process_data(values, out=out)
+
+        assert addresses == [(values.ctypes.data, out.ctypes.data)]
+        assert (out == 2 * values).all()
+
+
+class TestCppStreaming:
+    """Tests for processing streams in fixed-size chunks."""
+
+    pytestmark = pytest.mark.skipif(
+        cpp_bindings._process_data_into is None, reason="C++ bindings not loaded"
+    )
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_stream_iterable(self):
+        """Test that chunks come out in order, the last one short."""
+        chunks = [chunk.tolist() for chunk in process_data_stream(iter(range(10)), 4)]
+        assert chunks == [[0, 2, 4, 6], [8, 10, 12, 14], [16, 18]]
+        assert list(process_data_stream([], 4)) == []
+
+    def test_stream_file(self):
+        """Test reading native ints from a binary file."""
+        source = io.BytesIO(array.array("i", range(-5, 5)).tobytes())
+        result = [x for chunk in process_data_stream(source, 3) for x in chunk]
+        assert result == [2 * x for x in range(-5, 5)]
+
+    def test_stream_file_trailing_bytes(self):
+        """Test that a partial int at the end of a file is an error."""
+        with pytest.raises(ValueError, match="Trailing 1 bytes"):
+            list(process_data_stream(io.BytesIO(b"\x01\x00\x00\x00\x02")))
+
+    def test_process_data_file(self):
+        """Test streaming from one file to another."""
+        source = os.path.join(self.temp_dir.name, "in.bin")
+        dest = os.path.join(self.temp_dir.name, "out.bin")
+        with open(source, "wb") as f:
+            array.array("i", range(100_000)).tofile(f)
+
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            assert process_data_file(src, dst, 4096) == 100_000
+
+        with open(dest, "rb") as f:
+            result = array.array("i", f.read())
+        assert result == array.array("i", range(0, 200_000, 2))
+
+    def test_memory_bounded_by_chunk_size(self):
+        """Test that streaming 5M ints allocates about one chunk."""
+        source = os.path.join(self.temp_dir.name, "in.bin")
+        with open(source, "wb") as f:
+            array.array("i", range(5_000_000)).tofile(f)
+
+        tracemalloc.start()
+        try:
+            with open(source, "rb") as src, open(os.devnull, "wb") as dst:
+                written = process_data_file(src, dst, 64 * 1024)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert written == 5_000_000
+        assert peak < 1024 * 1024, f"peak {peak} bytes (expected < 1 MiB)"
+
+
+class TestCppParallel:
+    """Tests for splitting process_data across threads."""
+
+    pytestmark = pytest.mark.skipif(
+        cpp_bindings._process_data_into is None, reason="C++ bindings not loaded"
+    )
+
+    def test_matches_serial(self):
+        """Test that every slice split gives the serial result."""
+        for length in (0, 1, 7, 10, 1001):
+            values = list(range(-length, length, 2))
+            expected = process_data(values)
+            for workers in (2, 3, 8):
+                assert process_data_parallel(values, workers=workers, threshold=0) == expected
+
+    def test_buffers_and_out(self):
+        """Test buffer input, an out buffer, and processing in place."""
+        values = array.array("i", range(1001))
+        expected = array.array("i", range(0, 2002, 2))
+        assert process_data_parallel(values, workers=4, threshold=0) == expected
+
+        out = array.array("i", bytes(len(values) * 4))
+        assert process_data_parallel(values, out=out, workers=4, threshold=0) is out
+        assert out == expected
+
+        process_data_parallel(values, out=values, workers=4, threshold=0)
+        assert values == expected
+
+    def test_small_inputs_stay_on_one_thread(self):
+        """Test that inputs under the threshold never start a pool."""
+        with patch.object(cpp_bindings, "ThreadPoolExecutor") as pool:
+            assert process_data_parallel([1, 2, 3], workers=4) == [2, 4, 6]
+        pool.assert_not_called()
+
+    def test_slices_cover_odd_lengths(self):
+        """Test slice boundaries for odd lengths and more workers than ints."""
+        kernel = cpp_bindings._process_data_into
+        for length in (1, 3, 1001, 4099):
+            values = array.array("i", range(-3 * length, 4 * length, 7)[:length])
+            expected = process_data(values)
+            for workers in (2, 3, 5, length + 3):
+                sizes = []
+
+                def record(source, count, dest, sizes=sizes):
+                    sizes.append(count)
+                    kernel(source, count, dest)
+
+                with patch.object(cpp_bindings, "_process_data_into", side_effect=record):
+                    result = process_data_parallel(values, workers=workers, threshold=0)
+
+                assert result == expected, (length, workers)
+                assert sum(sizes) == length and min(sizes) >= 1
+                assert len(sizes) <= min(workers, length)
+
+
+class TestFactorial:
+    """Tests for exact factorials of any size."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        factorial.factorial.cache_clear()
+
+    def test_exact_past_native_range(self):
+        """Test that results past 20! do not overflow."""
+        for n in (0, 1, 20, 21, 25, 100, 1000):
+            assert compute_factorial(n) == math.factorial(n)
+
+    def test_prime_swing_matches(self):
+        """Test the prime-swing path against math.factorial."""
+        for n in (factorial.SWING_THRESHOLD, 3 * factorial.SWING_THRESHOLD + 7):
+            assert factorial.factorial(n) == math.factorial(n)
+
+    def test_negative(self):
+        """Test that negative n is rejected."""
+        with pytest.raises(ValueError, match="negative"):
+            compute_factorial(-1)
+
+    def test_native_only_when_result_fits(self):
+        """Test that the C++ factorial only sees n whose result fits a C long."""
+        calls = []
+        with patch.object(cpp_bindings, "_factorial", side_effect=lambda n: calls.append(n) or 1):
+            compute_factorial(cpp_bindings._NATIVE_FACTORIAL_MAX)
+            compute_factorial(cpp_bindings._NATIVE_FACTORIAL_MAX + 1)
+        assert calls == [cpp_bindings._NATIVE_FACTORIAL_MAX]
+
+    def test_memoized(self):
+        """Test that a repeated large factorial comes from the memo."""
+        first = compute_factorial(100_000)
+        second = compute_factorial(100_000)
+
+        assert first is second
+        assert factorial.factorial.cache_info().hits == 1
+
+
+class TestPrototypes:
+    """Tests that foreign functions are bound once, at load time."""
+
+    @pytest.mark.skipif(cpp_bindings._factorial is None, reason="C++ bindings not loaded")
+    def test_cpp_signatures_fixed_at_load(self):
+        """Test that the C++ handles carry their signatures."""
+        assert cpp_bindings._factorial.argtypes == [ctypes.c_int]
+        assert cpp_bindings._factorial.restype is ctypes.c_long
+        assert cpp_bindings._process_data_into.restype is None
+
+    @pytest.mark.skipif(cpp_bindings._factorial is None, reason="C++ bindings not loaded")
+    def test_calls_do_not_touch_library(self):
+        """Test that calls never look symbols up on the CDLL again."""
+        with patch.object(cpp_bindings, "_hildie_cpp", object()):
+            assert compute_factorial(5) == 120
+            assert process_data([1, 2]) == [2, 4]
+
+    @pytest.mark.skipif(cpp_bindings._factorial is None, reason="C++ bindings not loaded")
+    def test_calls_do_not_rebind(self):
+        """Test that calls go straight to the handles bound at load."""
+        factorial_handle = cpp_bindings._factorial
+        with (
+            patch.object(cpp_bindings, "_prototype", side_effect=AssertionError("rebound")),
+            patch.object(cpp_bindings, "_factorial", wraps=factorial_handle) as native,
+        ):
+            for _ in range(3):
+                assert compute_factorial(10) == 3628800
+            assert process_data([1, 2]) == [2, 4]
+
+        assert native.call_count == 3
+        assert cpp_bindings._factorial is factorial_handle
+
+
 class TestCrossLanguageConsistency:
     """Tests to ensure consistency across language bindings."""
 
@@ -1,12 +1,33 @@
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyOverflowError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyIterator};
+use rayon::prelude::*;
 use hildie_lib::{greet, add};
 
+/// Batches at least this long are formatted across the rayon thread pool;
+/// below it, splitting the work costs more than it saves
+const PARALLEL_THRESHOLD: usize = 4096;
+
+/// Names pulled from the Python iterator per step by greet_iter
+const ITER_CHUNK: usize = 4096;
+
+/// Values summed per chunk by sum_rust; small enough that neither 64-bit
+/// half-sum in sum_exact can overflow
+const SUM_CHUNK: usize = 1 << 20;
+
 /// Python bindings for Hildie Rust library
 #[pymodule]
 fn hildie_bindings(py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(py_greet, m)?)?;
     m.add_function(wrap_pyfunction!(py_add, m)?)?;
     m.add_function(wrap_pyfunction!(greet_all, m)?)?;
+    m.add_function(wrap_pyfunction!(greet_all_packed, m)?)?;
+    m.add_function(wrap_pyfunction!(greet_iter, m)?)?;
+    m.add_class::<GreetIter>()?;
+    m.add_function(wrap_pyfunction!(add_arrays_rust, m)?)?;
+    m.add_function(wrap_pyfunction!(sum_rust, m)?)?;
+    m.add_function(wrap_pyfunction!(product_rust, m)?)?;
     Ok(())
 }
 
@@ -22,8 +43,248 @@ fn py_add(a: i32, b: i32) -> PyResult<i32> {
     Ok(add(a, b))
 }
 
+/// Greet every name, in parallel once the batch is large enough
+fn greet_batch(names: &[String]) -> Vec<String> {
+    if names.len() >= PARALLEL_THRESHOLD {
+        names.par_iter().map(|n| greet(n)).collect()
+    } else {
+        names.iter().map(|n| greet(n)).collect()
+    }
+}
+
 /// Greet multiple people
+///
+/// The GIL is released while the greetings are formatted, so other Python
+/// threads keep running; large batches are split across cores.
+#[pyfunction]
+fn greet_all(py: Python, names: Vec<String>) -> PyResult<Vec<String>> {
+    Ok(py.allow_threads(|| greet_batch(&names)))
+}
+
+/// Greet multiple people, returning one bytes object of NUL-terminated
+/// UTF-8 greetings
+///
+/// Building one buffer instead of a list of str skips creating a Python
+/// object per greeting; split it with `packed.split(b"\0")[:-1]`.
+#[pyfunction]
+fn greet_all_packed(py: Python, names: Vec<String>) -> PyResult<PyObject> {
+    let packed = py.allow_threads(|| {
+        let greetings = greet_batch(&names);
+        let size = greetings.iter().map(|g| g.len() + 1).sum();
+        let mut packed = Vec::with_capacity(size);
+        for greeting in &greetings {
+            packed.extend_from_slice(greeting.as_bytes());
+            packed.push(0);
+        }
+        packed
+    });
+    Ok(PyBytes::new(py, &packed).into())
+}
+
+/// Lazily greet the names from any Python iterable
+///
+/// Names are converted ITER_CHUNK at a time, so the input is never turned
+/// into one big Vec and the first greeting is available straight away.
 #[pyfunction]
-fn greet_all(names: Vec<String>) -> PyResult<Vec<String>> {
-    Ok(names.iter().map(|n| greet(n)).collect())
+fn greet_iter(names: &PyAny) -> PyResult<GreetIter> {
+    Ok(GreetIter {
+        names: names.iter()?.into(),
+        pending: Vec::new().into_iter(),
+    })
+}
+
+/// Iterator returned by greet_iter
+#[pyclass]
+struct GreetIter {
+    names: Py<PyIterator>,
+    pending: std::vec::IntoIter<String>,
+}
+
+#[pymethods]
+impl GreetIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<String>> {
+        if let Some(greeting) = slf.pending.next() {
+            return Ok(Some(greeting));
+        }
+
+        let py = slf.py();
+        let mut batch = Vec::with_capacity(ITER_CHUNK);
+        for name in slf.names.as_ref(py).take(ITER_CHUNK) {
+            batch.push(name?.extract::<String>()?);
+        }
+        if batch.is_empty() {
+            return Ok(None);
+        }
+
+        slf.pending = py.allow_threads(|| greet_batch(&batch)).into_iter();
+        Ok(slf.pending.next())
+    }
+}
+
+/// Address and length of a C-contiguous int64 buffer, which can be moved
+/// into allow_threads (PyBuffer itself cannot leave the GIL)
+///
+/// The PyBuffer it was taken from must outlive it: holding the buffer is
+/// what keeps the exporter from freeing or resizing the memory.
+#[derive(Clone, Copy)]
+struct RawInts {
+    ptr: usize,
+    len: usize,
+}
+
+impl RawInts {
+    fn new(buffer: &PyBuffer<i64>) -> PyResult<Self> {
+        if !buffer.is_c_contiguous() {
+            return Err(PyValueError::new_err("buffer must be C-contiguous"));
+        }
+        Ok(RawInts {
+            ptr: buffer.buf_ptr() as usize,
+            len: buffer.item_count(),
+        })
+    }
+
+    fn as_ptr(self) -> *const i64 {
+        self.ptr as *const i64
+    }
+
+    /// # Safety
+    /// The source PyBuffer must still be held and not written to meanwhile.
+    unsafe fn as_slice<'a>(self) -> &'a [i64] {
+        if self.len == 0 {
+            &[]
+        } else {
+            std::slice::from_raw_parts(self.as_ptr(), self.len)
+        }
+    }
+}
+
+/// Add two int64 buffers elementwise and return the result
+///
+/// Accepts array.array("q"), NumPy int64 arrays or any C-contiguous int64
+/// buffer. The sums go into out, which may alias a or b; without out a new
+/// array.array("q") is allocated. Runs with the GIL released. Raises
+/// OverflowError, leaving out untouched, if any sum does not fit in an int64.
+#[pyfunction]
+#[pyo3(signature = (a, b, out=None))]
+fn add_arrays_rust(
+    py: Python,
+    a: PyBuffer<i64>,
+    b: PyBuffer<i64>,
+    out: Option<&PyAny>,
+) -> PyResult<PyObject> {
+    let (a_raw, b_raw) = (RawInts::new(&a)?, RawInts::new(&b)?);
+    if a_raw.len != b_raw.len {
+        return Err(PyValueError::new_err(format!(
+            "length mismatch: a has {}, b has {}",
+            a_raw.len, b_raw.len
+        )));
+    }
+
+    let overflow = py.allow_threads(|| {
+        let (x, y) = unsafe { (a_raw.as_slice(), b_raw.as_slice()) };
+        // Fold every overflow flag rather than stopping at the first, so the
+        // loop has no early exit and vectorises
+        x.iter()
+            .zip(y)
+            .fold(false, |overflow, (&x, &y)| overflow | x.overflowing_add(y).1)
+    });
+    if overflow {
+        return Err(PyOverflowError::new_err("sum does not fit in an int64"));
+    }
+
+    let out = match out {
+        Some(out) => out,
+        // array("q", [0]) * n allocates and zeroes the result in one step
+        None => py
+            .import("array")?
+            .getattr("array")?
+            .call1(("q", vec![0i64]))?
+            .call_method1("__mul__", (a_raw.len,))?,
+    };
+    let out_buffer = PyBuffer::<i64>::get(out)?;
+    if out_buffer.readonly() {
+        return Err(PyValueError::new_err("out must be writable"));
+    }
+    let out_raw = RawInts::new(&out_buffer)?;
+    if out_raw.len < a_raw.len {
+        return Err(PyValueError::new_err(format!(
+            "out has {} items, needs {}",
+            out_raw.len, a_raw.len
+        )));
+    }
+
+    py.allow_threads(|| {
+        let (x, y, z) = (a_raw.as_ptr(), b_raw.as_ptr(), out_raw.as_ptr() as *mut i64);
+        // Raw pointers rather than slices, since out may alias a or b; the
+        // loop is a straight line over memory, which LLVM vectorises. The
+        // overflow check above means wrapping_add never actually wraps.
+        for i in 0..a_raw.len {
+            unsafe { *z.add(i) = (*x.add(i)).wrapping_add(*y.add(i)) };
+        }
+    });
+    Ok(out.into())
+}
+
+/// Sum int64 values exactly, in 64-bit arithmetic that vectorises
+///
+/// Each value is split into a signed high and an unsigned low 32-bit half.
+/// Over SUM_CHUNK values both half-sums fit in 64 bits, so the inner loop is
+/// plain 64-bit adds; only the per-chunk totals are combined in 128 bits.
+fn sum_exact(data: &[i64]) -> i128 {
+    data.chunks(SUM_CHUNK)
+        .map(|chunk| {
+            let (mut high, mut low) = (0i64, 0u64);
+            for &x in chunk {
+                high += x >> 32;
+                low += x as u32 as u64;
+            }
+            ((high as i128) << 32) + low as i128
+        })
+        .sum()
+}
+
+/// Sum an int64 buffer exactly, with the GIL released
+#[pyfunction]
+fn sum_rust(py: Python, values: PyBuffer<i64>) -> PyResult<i128> {
+    let raw = RawInts::new(&values)?;
+    Ok(py.allow_threads(|| sum_exact(unsafe { raw.as_slice() })))
+}
+
+/// Multiply an int64 buffer, with the GIL released
+///
+/// Raises OverflowError if the product does not fit in an int64; callers
+/// that need the exact big product should fall back to Python ints.
+#[pyfunction]
+fn product_rust(py: Python, values: PyBuffer<i64>) -> PyResult<i64> {
+    let raw = RawInts::new(&values)?;
+    let product = py.allow_threads(|| {
+        let data = unsafe { raw.as_slice() };
+        // A zero makes the product zero however large the other factors are
+        if data.contains(&0) {
+            return Some(0);
+        }
+        data.iter()
+            .try_fold(1i64, |product, &x| product.checked_mul(x))
+    });
+    product.ok_or_else(|| PyOverflowError::new_err("product does not fit in an int64"))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn sum_exact_matches_i128_sum() {
+        let values: Vec<i64> = (0..3 * SUM_CHUNK as i64)
+            .map(|i| i.wrapping_mul(0x9E37_79B9_7F4A_7C15u64 as i64))
+            .chain([i64::MIN, i64::MAX, -1, 0])
+            .collect();
+        let expected: i128 = values.iter().map(|&x| x as i128).sum();
+        assert_eq!(sum_exact(&values), expected);
+        assert_eq!(sum_exact(&[]), 0);
+    }
 }
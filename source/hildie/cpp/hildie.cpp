@@ -5,10 +5,20 @@
 // Process data array - multiply each element by 2
 int* process_data(int* data, int size) {
     int* result = new int[size];
+    process_data_into(data, size, result);
+    return result;
+}
+
+// Process data into a caller-provided buffer - no allocation
+void process_data_into(const int* data, int size, int* out) {
     for (int i = 0; i < size; i++) {
-        result[i] = data[i] * 2;
+        out[i] = data[i] * 2;
     }
-    return result;
+}
+
+// Process data in place - no allocation
+void process_data_inplace(int* data, int size) {
+    process_data_into(data, size, data);
 }
 
 // Compute factorial
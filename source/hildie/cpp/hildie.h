@@ -8,6 +8,13 @@ extern "C" {
 // Process data array
 int* process_data(int* data, int size);
 
+// Process data array into a caller-provided buffer of at least size ints.
+// out may be the same pointer as data; no memory is allocated.
+void process_data_into(const int* data, int size, int* out);
+
+// Process data array in place; no memory is allocated
+void process_data_inplace(int* data, int size);
+
 // Compute factorial
 long factorial(int n);
 
@@ -0,0 +1,96 @@
+// Package main exports the Hildie Go library as a C shared library for the
+// Python ctypes bindings.
+//
+// Build with: go build -o libhildie_go.so -buildmode=c-shared ./capi
+//
+// Every string returned to C is allocated with malloc and must be released
+// with FreeString. The *Many functions handle a whole batch per call, so
+// callers pay for one cgo transition rather than one per value.
+package main
+
+/*
+#include <stdlib.h>
+*/
+import "C"
+
+import (
+	"bytes"
+	"unsafe"
+
+	"github.com/clintonsteiner/hildie-go/lib"
+)
+
+// Greet returns a greeting for a NUL-terminated name. Free it with FreeString.
+//
+//export Greet
+func Greet(name *C.char) *C.char {
+	return C.CString(lib.Greet(C.GoString(name)))
+}
+
+// Add returns the sum of two integers
+//
+//export Add
+func Add(a, b C.int) C.int {
+	return C.int(lib.Add(int(a), int(b)))
+}
+
+// AddMany writes a[i] + b[i] into out[i] for each of the n elements.
+// out may be the same array as a or b.
+//
+//export AddMany
+func AddMany(a, b, out *C.int, n C.int) {
+	if n <= 0 {
+		return
+	}
+	addMany(
+		unsafe.Slice((*int32)(unsafe.Pointer(a)), int(n)),
+		unsafe.Slice((*int32)(unsafe.Pointer(b)), int(n)),
+		unsafe.Slice((*int32)(unsafe.Pointer(out)), int(n)),
+	)
+}
+
+// GreetMany greets every name in a packed buffer of size bytes holding
+// NUL-terminated names. It returns the greetings packed the same way and
+// stores their total size in *outSize. Free the result with FreeString.
+//
+//export GreetMany
+func GreetMany(names *C.char, size C.int, outSize *C.int) *C.char {
+	var packed []byte
+	if size > 0 {
+		packed = unsafe.Slice((*byte)(unsafe.Pointer(names)), int(size))
+	}
+	greetings := greetPacked(packed)
+	*outSize = C.int(len(greetings))
+	return (*C.char)(C.CBytes(greetings))
+}
+
+// FreeString releases a string returned by Greet or GreetMany
+//
+//export FreeString
+func FreeString(s *C.char) {
+	C.free(unsafe.Pointer(s))
+}
+
+func addMany(a, b, out []int32) {
+	for i := range out {
+		out[i] = int32(lib.Add(int(a[i]), int(b[i])))
+	}
+}
+
+// greetPacked greets each NUL-terminated name in packed and returns the
+// greetings, each NUL-terminated, in one buffer.
+func greetPacked(packed []byte) []byte {
+	var out bytes.Buffer
+	for len(packed) > 0 {
+		end := bytes.IndexByte(packed, 0)
+		if end < 0 {
+			end = len(packed)
+		}
+		out.WriteString(lib.Greet(string(packed[:end])))
+		out.WriteByte(0)
+		packed = packed[min(end+1, len(packed)):]
+	}
+	return out.Bytes()
+}
+
+func main() {}
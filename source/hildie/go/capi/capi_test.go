@@ -0,0 +1,42 @@
+package main
+
+import (
+	"bytes"
+	"testing"
+)
+
+func TestAddMany(t *testing.T) {
+	a := []int32{1, -2, 3}
+	b := []int32{10, 20, -30}
+	out := make([]int32, 3)
+	addMany(a, b, out)
+	for i, expected := range []int32{11, 18, -27} {
+		if out[i] != expected {
+			t.Errorf("out[%d]: expected %d, got %d", i, expected, out[i])
+		}
+	}
+}
+
+func TestGreetPacked(t *testing.T) {
+	result := greetPacked([]byte("Alice\x00\x00Bob\x00"))
+	parts := bytes.Split(bytes.TrimSuffix(result, []byte{0}), []byte{0})
+	expected := []string{
+		"Hello from Hildie Go Library, Alice!",
+		"Hello from Hildie Go Library, !",
+		"Hello from Hildie Go Library, Bob!",
+	}
+	if len(parts) != len(expected) {
+		t.Fatalf("Expected %d greetings, got %d", len(expected), len(parts))
+	}
+	for i, part := range parts {
+		if string(part) != expected[i] {
+			t.Errorf("Expected %s, got %s", expected[i], part)
+		}
+	}
+}
+
+func TestGreetPackedEmpty(t *testing.T) {
+	if result := greetPacked(nil); len(result) != 0 {
+		t.Errorf("Expected no greetings, got %q", result)
+	}
+}
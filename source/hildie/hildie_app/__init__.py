@@ -1,27 +1,105 @@
 """An application that uses the shared library."""
 
+import itertools
+from collections.abc import Iterable, Iterator, Sequence
+
 from hildie._version import __version__ as __version__
-from hildie.hildie_library import add, multiply
+from hildie.hildie_library import ProductAccumulator, add_many, multiply_many
+
+from .readers import MappedInt64
+
+# Numbers reduced per step; small enough to stay in cache, large enough that
+# the per-chunk Python overhead is negligible
+CHUNK_SIZE = 64 * 1024
+
+
+def _chunks(numbers: Iterable[int], size: int) -> Iterator:
+    """Yield numbers in slices of at most size items.
+
+    Sequences and buffers (lists, array.array, memoryview, NumPy arrays) are
+    sliced in place; any other iterable is read size items at a time, so
+    generators and streams are never held in memory whole.
+    """
+    try:
+        memoryview(numbers)
+        sliceable = True
+    except TypeError:
+        sliceable = isinstance(numbers, Sequence)
+
+    if sliceable:
+        for start in range(0, len(numbers), size):
+            yield numbers[start : start + size]
+        return
+
+    iterator = iter(numbers)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def reduce_chunks(chunks: Iterable) -> tuple[int, int, int]:
+    """Return (sum, product, count) over chunks of numbers in a single pass.
+
+    Each chunk is reduced for both the sum and the product while it is in
+    cache. Chunk products are combined in a balanced tree, so huge products
+    never multiply a giant running product by a small one. The product of
+    no numbers is 1.
+    """
+    total = 0
+    count = 0
+    products = ProductAccumulator()
+    zero = False
 
+    for chunk in chunks:
+        count += len(chunk)
+        total += add_many(chunk)
+        # Once the product is zero it stays zero; skip the multiplications
+        if not zero:
+            factor = multiply_many(chunk)
+            zero = factor == 0
+            products.push(factor)
 
-def process_numbers(numbers: list[int]) -> dict[str, int]:
-    """Process a list of numbers using library functions.
+    return total, 0 if zero else products.result(), count
+
+
+def process_numbers(numbers: Iterable[int], chunk_size: int = CHUNK_SIZE) -> dict[str, int]:
+    """Process numbers using library functions.
+
+    The sum and product are computed together in a single pass over chunks
+    of the input (see reduce_chunks), so the input can be any iterable,
+    including a generator over a stream that does not fit in memory.
 
     Args:
-        numbers: List of integers to process
+        numbers: Integers to process
+        chunk_size: Numbers reduced per step
 
     Returns:
         Dictionary with sum and product of all numbers
     """
-    if not numbers:
+    total, product, count = reduce_chunks(_chunks(numbers, chunk_size))
+    if not count:
         return {"sum": 0, "product": 0}
 
-    total = 0
-    for num in numbers:
-        total = add(total, num)
+    return {"sum": total, "product": product}
+
+
+def process_mapped(path: str, fmt: str = "int64", chunk_size: int = CHUNK_SIZE) -> dict[str, int]:
+    """Process the numbers in a raw little-endian int64 or .npy file.
 
-    product = 1
-    for num in numbers:
-        product = multiply(product, num)
+    The file is memory-mapped and reduced in place through a memoryview, so
+    no list of Python ints is ever built and pages are released as they are
+    consumed.
+
+    Args:
+        path: File to read
+        fmt: "int64" or "npy"
+        chunk_size: Numbers reduced per step
+
+    Returns:
+        Dictionary with sum and product of all numbers
+    """
+    with MappedInt64(path, fmt) as mapped:
+        total, product, count = reduce_chunks(mapped.chunks(chunk_size))
+    if not count:
+        return {"sum": 0, "product": 0}
 
     return {"sum": total, "product": product}
@@ -0,0 +1,227 @@
+"""Sharded sum/product reduction across a process pool."""
+
+import array
+import os
+import re
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from hildie.hildie_library import ProductAccumulator
+
+from . import CHUNK_SIZE, _chunks, process_mapped, process_numbers, reduce_chunks
+from .readers import BLOCK_SIZE, MappedInt64, iter_chunks
+
+# Inputs with fewer numbers than this are reduced in-process; below it the
+# cost of starting workers outweighs the work saved
+PARALLEL_THRESHOLD = 1_000_000
+
+# Bytes per number assumed when comparing a file's size to the threshold
+_INT64_SIZE = 8
+
+# The separators bytes.split() uses, which the text reader splits on
+_WHITESPACE = re.compile(rb"\s")
+
+
+class _RangeReader:
+    """File-like view of bytes [start, end) of an open binary file."""
+
+    def __init__(self, f, start: int, end: int):
+        self.f = f
+        self.remaining = end - start
+        f.seek(start)
+
+    def read(self, size: int) -> bytes:
+        data = self.f.read(min(size, self.remaining))
+        self.remaining -= len(data)
+        return data
+
+
+def _align_text(f, offset: int, size: int) -> int:
+    """Move offset forward to a whitespace boundary, so no number is split."""
+    if offset <= 0 or offset >= size:
+        return min(max(offset, 0), size)
+
+    f.seek(offset - 1)
+    if f.read(1).isspace():
+        return offset
+    while block := f.read(4096):
+        match = _WHITESPACE.search(block)
+        if match:
+            return offset + match.start()
+        offset += len(block)
+    return size
+
+
+def _text_shards(path: str, shards: int) -> list[tuple[int, int]]:
+    """Split a text file into byte ranges that each hold whole numbers."""
+    size = os.path.getsize(path)
+    step = max(size // shards, 1)
+    with open(path, "rb") as f:
+        bounds = sorted({_align_text(f, offset, size) for offset in range(0, size, step)})
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:], strict=False) if end > start]
+
+
+def _reduce_text_range(path: str, start: int, end: int) -> tuple[int, int, int]:
+    with open(path, "rb") as f:
+        return reduce_chunks(iter_chunks(_RangeReader(f, start, end), "text", BLOCK_SIZE))
+
+
+def _reduce_mapped_range(path: str, fmt: str, start: int, stop: int) -> tuple[int, int, int]:
+    with MappedInt64(path, fmt) as mapped:
+        return reduce_chunks(mapped.chunks(CHUNK_SIZE, start, stop))
+
+
+def _reduce_shared(name: str, start: int, stop: int) -> tuple[int, int, int]:
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf.cast("q")[start:stop]
+    try:
+        return reduce_chunks(_chunks(view, CHUNK_SIZE))
+    finally:
+        # Every export of the buffer must be released before it can close
+        view.release()
+        shm.close()
+
+
+def _reduce_list(numbers: list[int]) -> tuple[int, int, int]:
+    return reduce_chunks(_chunks(numbers, CHUNK_SIZE))
+
+
+def _combine(partials: Iterable[tuple[int, int, int]]) -> dict[str, int]:
+    """Merge per-shard (sum, product, count) into process_numbers' result."""
+    total = 0
+    count = 0
+    products = ProductAccumulator()
+    for shard_total, shard_product, shard_count in partials:
+        total += shard_total
+        count += shard_count
+        products.push(shard_product)
+
+    if not count:
+        return {"sum": 0, "product": 0}
+    return {"sum": total, "product": products.result()}
+
+
+def _fill_int64(numbers, buf: memoryview) -> bool:
+    """Write numbers into buf as native int64s, or return False if they don't fit.
+
+    Contiguous int64 buffers are copied straight in. Anything else is
+    converted a chunk at a time, so the only full-size copy is buf itself.
+    """
+    try:
+        view = memoryview(numbers)
+    except TypeError:
+        view = None
+
+    if view is not None:
+        with view:
+            int64 = view.itemsize == 8 and view.format.lstrip("@=") in ("q", "l")
+            if int64 and view.ndim == 1 and view.c_contiguous:
+                buf[: view.nbytes] = view.cast("B")
+                return True
+
+    with buf.cast("q") as out:
+        try:
+            for start in range(0, len(numbers), CHUNK_SIZE):
+                stop = min(start + CHUNK_SIZE, len(numbers))
+                out[start:stop] = array.array("q", numbers[start:stop])
+        except (OverflowError, TypeError):
+            return False
+    return True
+
+
+def _ranges(length: int, shards: int) -> list[tuple[int, int]]:
+    step = -(-length // shards)
+    return [(start, min(start + step, length)) for start in range(0, length, step)]
+
+
+def process_numbers_parallel(
+    numbers: Sequence[int], workers: int | None = None, threshold: int = PARALLEL_THRESHOLD
+) -> dict[str, int]:
+    """Compute process_numbers(numbers) with one shard per worker process.
+
+    Inputs that fit in int64 (lists, array.array, memoryview, NumPy arrays)
+    are written straight into shared memory, a chunk at a time, and workers
+    reduce their slice in place, so nothing is pickled but the offsets.
+    Lists with larger ints are sent to workers in slices. Per-shard products
+    are combined in a balanced tree. Inputs shorter than threshold, and
+    iterables without a length, are reduced in this process.
+
+    Args:
+        numbers: Integers to process
+        workers: Worker processes (default: CPU count)
+        threshold: Minimum input length to shard
+
+    Returns:
+        Dictionary with sum and product of all numbers
+    """
+    if not hasattr(numbers, "__len__") or len(numbers) < max(threshold, 1):
+        return process_numbers(numbers)
+
+    workers = workers or os.cpu_count() or 1
+    ranges = _ranges(len(numbers), workers)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(len(numbers), 1) * _INT64_SIZE)
+    try:
+        if _fill_int64(numbers, shm.buf):
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                names = [shm.name] * len(ranges)
+                starts = [start for start, _ in ranges]
+                stops = [stop for _, stop in ranges]
+                return _combine(pool.map(_reduce_shared, names, starts, stops))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        slices = [numbers[start:stop] for start, stop in ranges]
+        return _combine(pool.map(_reduce_list, slices))
+
+
+def process_file(
+    path: str,
+    fmt: str = "text",
+    workers: int | None = None,
+    threshold: int = PARALLEL_THRESHOLD,
+) -> dict[str, int]:
+    """Compute process_numbers over the integers in a file, sharded across workers.
+
+    fmt is "text" (whitespace-separated), "int64" (raw little-endian) or
+    "npy". Each worker opens the file itself: binary files are memory-mapped
+    and each worker reduces its own range of values in place; text files are
+    split into byte ranges whose boundaries are moved to whitespace, so no
+    number is split. Files smaller than threshold int64s are read in this
+    process.
+
+    Args:
+        path: File to read
+        fmt: Input format
+        workers: Worker processes (default: CPU count)
+        threshold: Minimum size to shard, in numbers (8 bytes each)
+
+    Returns:
+        Dictionary with sum and product of all numbers
+    """
+    path = os.fspath(path)
+    serial = os.path.getsize(path) < threshold * _INT64_SIZE
+    workers = workers or os.cpu_count() or 1
+
+    if fmt == "text":
+        if serial:
+            return _combine([_reduce_text_range(path, 0, os.path.getsize(path))])
+        shards = _text_shards(path, workers)
+        func = _reduce_text_range
+        args = [[path] * len(shards)]
+    else:
+        if serial:
+            return process_mapped(path, fmt)
+        with MappedInt64(path, fmt) as mapped:
+            shards = _ranges(len(mapped), workers) if len(mapped) else []
+        func = _reduce_mapped_range
+        args = [[path] * len(shards), [fmt] * len(shards)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        starts = [start for start, _ in shards]
+        ends = [end for _, end in shards]
+        return _combine(pool.map(func, *args, starts, ends))
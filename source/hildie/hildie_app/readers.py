@@ -0,0 +1,214 @@
+"""Chunked readers for integer streams too large to hold in memory."""
+
+import array
+import ast
+import math
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Iterator
+from typing import BinaryIO
+
+# Bytes read per step; a multiple of 8 so int64 blocks stay aligned
+BLOCK_SIZE = 1024 * 1024
+
+FORMATS = ("text", "int64", "npy")
+
+NPY_MAGIC = b"\x93NUMPY"
+
+# Little-endian int64 as a NumPy dtype string; "<i8" and "<q" are equivalent
+NPY_INT64 = ("<i8", "<q")
+
+
+def iter_text_chunks(f: BinaryIO, block_size: int = BLOCK_SIZE) -> Iterator[list[int]]:
+    """Yield lists of integers parsed from whitespace-separated text.
+
+    Numbers may be separated by any mix of spaces, tabs and newlines. The
+    file is read block_size bytes at a time; a number split across two
+    blocks is carried over to the next one, so memory use does not grow
+    with the size of the input.
+
+    Raises:
+        ValueError: If a token is not an integer
+    """
+    tail = b""
+    while block := f.read(block_size):
+        tokens = (tail + block).split()
+        tail = b""
+        # The last token may continue in the next block
+        if tokens and not block[-1:].isspace():
+            tail = tokens.pop()
+        if tokens:
+            yield _parse(tokens)
+
+    if tail:
+        yield _parse([tail])
+
+
+def _parse(tokens: list[bytes]) -> list[int]:
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        for token in tokens:
+            try:
+                int(token)
+            except ValueError:
+                text = token[:40].decode(errors="replace")
+                raise ValueError(f"Not an integer: {text!r}") from None
+        raise
+
+
+def iter_int64_chunks(f: BinaryIO, block_size: int = BLOCK_SIZE) -> Iterator[array.array]:
+    """Yield arrays of integers from raw little-endian int64 data.
+
+    Raises:
+        ValueError: If the data is not a whole number of 8-byte integers
+    """
+    block_size -= block_size % 8
+    tail = b""
+    while block := f.read(block_size):
+        if tail:
+            block = tail + block
+        whole = len(block) - len(block) % 8
+        tail = block[whole:]
+        if whole:
+            numbers = array.array("q")
+            numbers.frombytes(block[:whole])
+            if sys.byteorder == "big":
+                numbers.byteswap()
+            yield numbers
+
+    if tail:
+        raise ValueError(f"Trailing {len(tail)} bytes: input is not a whole number of int64s")
+
+
+def read_npy_header(f: BinaryIO) -> tuple[int, int]:
+    """Parse a .npy header, leaving f at the start of the data.
+
+    Only C-ordered little-endian int64 arrays are accepted; their data is a
+    raw int64 stream. Parsed without NumPy, which need not be installed.
+
+    Returns:
+        (data offset in bytes, number of values)
+
+    Raises:
+        ValueError: If f is not a .npy file of int64 values
+    """
+    if f.read(len(NPY_MAGIC)) != NPY_MAGIC:
+        raise ValueError("Not a .npy file")
+
+    major = f.read(2)[:1]
+    if major == b"\x01":
+        (length,) = struct.unpack("<H", f.read(2))
+        prefix = len(NPY_MAGIC) + 4
+    elif major in (b"\x02", b"\x03"):
+        (length,) = struct.unpack("<I", f.read(4))
+        prefix = len(NPY_MAGIC) + 6
+    else:
+        raise ValueError(f"Unsupported .npy version: {major!r}")
+
+    header = ast.literal_eval(f.read(length).decode("latin1"))
+    if header.get("descr") not in NPY_INT64:
+        raise ValueError(f"Expected little-endian int64 .npy data, got {header.get('descr')!r}")
+    if header.get("fortran_order") and len(header["shape"]) > 1:
+        raise ValueError("Fortran-ordered .npy arrays are not supported")
+
+    return prefix + length, math.prod(header["shape"])
+
+
+def iter_npy_chunks(f: BinaryIO, block_size: int = BLOCK_SIZE) -> Iterator[array.array]:
+    """Yield arrays of integers from a .npy file of int64 values."""
+    read_npy_header(f)
+    return iter_int64_chunks(f, block_size)
+
+
+def iter_chunks(f: BinaryIO, fmt: str = "text", block_size: int = BLOCK_SIZE) -> Iterator:
+    """Yield chunks of integers from f in the given format (see FORMATS)."""
+    if fmt == "text":
+        return iter_text_chunks(f, block_size)
+    if fmt == "int64":
+        return iter_int64_chunks(f, block_size)
+    if fmt == "npy":
+        return iter_npy_chunks(f, block_size)
+    raise ValueError(f"Unknown input format: {fmt}")
+
+
+class MappedInt64:
+    """Read-only memory map of a raw int64 or .npy file.
+
+    numbers is a memoryview of the values straight out of the page cache:
+    nothing is copied or converted to Python ints up front. chunks() walks
+    the values in slices and, where the OS allows, tells it to drop each
+    slice's pages once the slice has been handed out and reduced, so reading
+    a multi-GB file keeps resident memory near zero.
+
+    On big-endian hosts the data has to be byte-swapped, so it is copied into
+    memory instead.
+    """
+
+    def __init__(self, path: str | os.PathLike, fmt: str = "int64"):
+        if fmt not in ("int64", "npy"):
+            raise ValueError(f"Cannot memory-map format: {fmt}")
+
+        self.offset = 0
+        with open(path, "rb") as f:
+            if fmt == "npy":
+                self.offset, count = read_npy_header(f)
+            size = os.fstat(f.fileno()).st_size
+            if fmt == "int64":
+                if size % 8:
+                    raise ValueError(f"Trailing {size % 8} bytes: not a whole number of int64s")
+                count = size // 8
+            if size < self.offset + count * 8:
+                raise ValueError("File is shorter than its .npy header says")
+
+            self._mmap = None
+            if count and sys.byteorder == "little":
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+                data = memoryview(self._mmap)[self.offset : self.offset + count * 8]
+                self.numbers = data.cast("q")
+                data.release()
+            else:
+                f.seek(self.offset)
+                values = array.array("q")
+                values.fromfile(f, count)
+                values.byteswap()
+                self.numbers = memoryview(values)
+
+    def chunks(self, size: int, start: int = 0, stop: int | None = None) -> Iterator[memoryview]:
+        """Yield numbers[start:stop] in slices of at most size values."""
+        stop = len(self.numbers) if stop is None else stop
+        released = self._page(start)
+        for index in range(start, stop, size):
+            end = min(index + size, stop)
+            yield self.numbers[index:end]
+            released = self._drop(released, self._page(end))
+
+    def _page(self, index: int) -> int:
+        """Return the start of the page holding numbers[index]."""
+        position = self.offset + index * 8
+        return position - position % mmap.PAGESIZE
+
+    def _drop(self, first: int, last: int) -> int:
+        """Let the OS reclaim mapped pages [first, last). Returns last."""
+        if self._mmap is not None and hasattr(mmap, "MADV_DONTNEED") and last > first:
+            self._mmap.madvise(mmap.MADV_DONTNEED, first, last - first)
+        return last
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def close(self):
+        """Release the view and unmap the file."""
+        self.numbers.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self) -> "MappedInt64":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
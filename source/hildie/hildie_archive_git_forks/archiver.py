@@ -1,11 +1,23 @@
 """Archive GitHub forked repositories."""
 
+import itertools
 import json
+import os
 import shutil
 import subprocess
+import time
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-import requests
+from .journal import ARCHIVED, CLONED, DELETED, PRIVATISED, Journal
+from .pipeline import Pipeline
+from .scheduler import RequestScheduler
+from .store import BlobStore
+from .telemetry import Telemetry
+from .verify import verify_archives
+
+GITHUB_API_URL = "https://api.github.com"
+ARCHIVE_FORMATS = ("zip", "cas")
 
 
 def get_github_username() -> str:
@@ -23,8 +35,64 @@ def get_github_username() -> str:
     )
 
 
+def restore_archive(archive_dir: str | Path, repo_name: str, dest: str | Path) -> Path:
+    """Rebuild a repository tree under dest from a blob store manifest or zip."""
+    store = BlobStore(archive_dir)
+    if store.manifest_path(repo_name).exists():
+        return store.restore(repo_name, dest)
+
+    zip_path = Path(archive_dir) / f"{repo_name}.zip"
+    if not zip_path.exists():
+        raise FileNotFoundError(f"No archive for {repo_name} in {archive_dir}")
+
+    shutil.unpack_archive(zip_path, dest, "zip")
+    return Path(dest)
+
+
+def _trim(repo: dict) -> dict:
+    """Keep only the fields needed to select and process a repo."""
+    return {
+        "name": repo["name"],
+        "clone_url": repo["clone_url"],
+        "updated_at": repo.get("updated_at", ""),
+    }
+
+
+def _tree_size(path: Path) -> int:
+    """Return the total size of the regular files under path."""
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            full = os.path.join(dirpath, filename)
+            if not os.path.islink(full):
+                total += os.path.getsize(full)
+    return total
+
+
+def _iter_records(f) -> Iterator[dict]:
+    """Yield one repo per JSON line from f, then close it."""
+    with f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+
+        if first == "[":
+            yield from json.loads(first + f.read())
+            return
+
+        for line in itertools.chain([first + f.readline()], f):
+            if line.strip():
+                yield json.loads(line)
+
+
 class ArchiveForks:
-    """Archive forked repositories on GitHub."""
+    """Archive forked repositories on GitHub.
+
+    Progress is recorded on self.telemetry: stage timings per repo, bytes
+    cloned and archived, and the latency of every API call. Replace it with a
+    fresh Telemetry (for instance one with a known total, for an ETA) before
+    a run.
+    """
 
     def __init__(
         self,
@@ -32,65 +100,97 @@ class ArchiveForks:
         token: str,
         work_dir: str = "./forked_repos",
         archive_dir: str = "./archived_repos",
+        api_url: str = GITHUB_API_URL,
+        archive_format: str = "zip",
     ):
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unknown archive format: {archive_format}")
+
         self.username = username
         self.token = token
+        self.api_url = api_url.rstrip("/")
         self.work_dir = Path(work_dir)
         self.archive_dir = Path(archive_dir)
+        self.archive_format = archive_format
+        self.store = BlobStore(self.archive_dir)
+
+        # requests pulls in urllib3 and ssl; import it only when a command
+        # actually talks to GitHub, so local commands start quickly
+        import requests
+
         self.session = requests.Session()
         self.session.auth = (username, token)
+        self.telemetry = Telemetry()
+        self.scheduler = RequestScheduler(self.session, observer=self._observe_api)
+
+    def _observe_api(self, method: str, seconds: float, status: int | None):
+        self.telemetry.record_api(method, seconds, status)
 
     def setup_directories(self):
         """Create work and archive directories."""
         self.work_dir.mkdir(parents=True, exist_ok=True)
         self.archive_dir.mkdir(parents=True, exist_ok=True)
 
-    def fetch_forked_repos(self) -> list[dict]:
-        """Fetch all forked repositories (excluding own repos)."""
-        repos = []
-        page = 1
+    def fetch_forked_repos(self) -> Iterator[dict]:
+        """Yield forked repositories (excluding own repos), newest first.
 
-        while True:
-            url = f"https://api.github.com/users/{self.username}/repos?per_page=100&page={page}"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+        GitHub sorts the listing by last update, so records are yielded in
+        export order as each page arrives and only one page is held in memory.
+        Records are trimmed to the fields export_repos writes.
+        """
+        url = f"{self.api_url}/users/{self.username}/repos?per_page=100&sort=updated&direction=desc"
 
-            data = response.json()
-            if not data:
-                break
+        while url:
+            response = self.scheduler.get(url, timeout=10)
+            response.raise_for_status()
 
             # Only include forked repos
-            for repo in data:
+            for repo in response.json():
                 if repo.get("fork"):
-                    repos.append(repo)
-
-            page += 1
+                    yield _trim(repo)
 
-        return repos
+            url = response.links.get("next", {}).get("url")
 
-    def export_repos(self, repos: list[dict], filename: str):
-        """Export repos to JSON file, sorted by last updated."""
-        # Sort by updated_at, newest first
-        sorted_repos = sorted(repos, key=lambda r: r.get("updated_at", ""), reverse=True)
+    def export_repos(self, repos: Iterable[dict], filename: str) -> int:
+        """Write repos to a JSON Lines file as they arrive. Returns the count.
 
-        data = [
-            {
-                "name": r["name"],
-                "clone_url": r["clone_url"],
-                "updated_at": r.get("updated_at", ""),
-            }
-            for r in sorted_repos
-        ]
+        Repos are written in the order given; fetch_forked_repos already
+        yields them newest first.
+        """
+        count = 0
         with open(filename, "w") as f:
-            json.dump(data, f, indent=2)
-
-    def load_repos(self, filename: str) -> list[dict]:
-        """Load repos from JSON file."""
-        with open(filename) as f:
-            return json.load(f)
-
-    def load_selected_repos(self, filename: str) -> list[dict]:
-        """Load selected repos from JSON file."""
+            for repo in repos:
+                f.write(json.dumps(_trim(repo)) + "\n")
+                count += 1
+        return count
+
+    def load_repos(self, filename: str) -> Iterator[dict]:
+        """Lazily read repos from a JSON Lines file.
+
+        The file is opened immediately, so a missing file raises
+        FileNotFoundError here rather than on first iteration. Files in the
+        older single JSON array format are still accepted, but are read whole.
+        """
+        f = open(filename)
+        return _iter_records(f)
+
+    def count_repos(self, filename: str) -> int:
+        """Count the repos in a flat file without decoding each one.
+
+        JSON Lines files are counted by their non-blank lines; files in the
+        older single JSON array format are decoded, as load_repos does.
+        """
+        with open(filename, "rb") as f:
+            first = f.read(1)
+            while first.isspace():
+                first = f.read(1)
+
+            if first == b"[":
+                return len(json.loads(first + f.read()))
+            return sum(1 for line in itertools.chain([first + f.readline()], f) if line.strip())
+
+    def load_selected_repos(self, filename: str) -> Iterator[dict]:
+        """Lazily read selected repos from a JSON Lines file."""
         return self.load_repos(filename)
 
     def _ssh_url(self, https_url: str) -> str:
@@ -117,16 +217,42 @@ class ArchiveForks:
 
         return local_path
 
+    def archive_path(self, repo_name: str) -> Path:
+        """Return the path archive_repo writes for repo_name."""
+        if self.archive_format == "cas":
+            return self.store.manifest_path(repo_name)
+        return self.archive_dir / f"{repo_name}.zip"
+
     def archive_repo(self, local_path: Path, repo_name: str) -> Path:
-        """Create zip archive of repository."""
+        """Archive a repository as a zip, or as a manifest in the blob store."""
+        if self.archive_format == "cas":
+            return self.store.archive(local_path, repo_name)
+
         archive_base = self.archive_dir / repo_name
         archive_path = shutil.make_archive(str(archive_base), "zip", local_path)
         return Path(archive_path)
 
+    def _archived_size(self, path: Path) -> int:
+        """Return the zip size, or the logical bytes a blob store manifest covers."""
+        if self.archive_format == "cas":
+            with open(path) as f:
+                return sum(entry.get("size", 0) for entry in json.load(f)["files"])
+        return path.stat().st_size
+
+    def restore_repo(self, repo_name: str, dest: str | Path) -> Path:
+        """Rebuild a repository tree under dest from its archive."""
+        return restore_archive(self.archive_dir, repo_name, dest)
+
+    def verify_archives(
+        self, repo_names: list[str] | None = None, workers: int | None = None
+    ) -> dict:
+        """Check archives against their clones' HEAD trees across a process pool."""
+        return verify_archives(self.archive_dir, self.work_dir, repo_names, workers)
+
     def make_private(self, repo_name: str):
         """Make repository private on GitHub."""
-        url = f"https://api.github.com/repos/{self.username}/{repo_name}"
-        response = self.session.patch(url, json={"private": True}, timeout=10)
+        url = f"{self.api_url}/repos/{self.username}/{repo_name}"
+        response = self.scheduler.patch(url, json={"private": True}, timeout=10)
 
         if response.status_code == 422:
             raise RuntimeError(
@@ -136,47 +262,203 @@ class ArchiveForks:
 
         response.raise_for_status()
 
-    def delete_repo(self, repo_name: str) -> bool:
-        """Delete repository from GitHub. Returns True if deleted."""
-        url = f"https://api.github.com/repos/{self.username}/{repo_name}"
-        response = self.session.delete(url, timeout=10)
-        return response.status_code in (204, 404)  # 204=deleted, 404=already gone
-
-    def process_repos(self, repos: list[dict]) -> dict:
-        """Clone, archive, and make repos private."""
+    def repo_exists(self, repo_name: str) -> bool:
+        """Return whether the repository still exists on GitHub."""
+        url = f"{self.api_url}/repos/{self.username}/{repo_name}"
+        response = self.scheduler.get(url, timeout=10)
+        if response.status_code == 404:
+            return False
+        if response.status_code != 200:
+            raise RuntimeError(f"Cannot check {repo_name}: HTTP {response.status_code}")
+        return True
+
+    def delete_repo(self, repo_name: str) -> str:
+        """Delete repository from GitHub.
+
+        Returns "deleted", or "already_gone" if GitHub answered 404. Any other
+        status, after the scheduler's retries, raises RuntimeError.
+        """
+        url = f"{self.api_url}/repos/{self.username}/{repo_name}"
+        response = self.scheduler.delete(url, timeout=10)
+        if response.status_code == 204:
+            return "deleted"
+        if response.status_code == 404:
+            return "already_gone"
+        raise RuntimeError(f"Failed to delete {repo_name}: HTTP {response.status_code}")
+
+    def process_repos(
+        self,
+        repos: Iterable[dict],
+        journal: Journal | None = None,
+        clone_workers: int = 4,
+        archive_workers: int = 2,
+        api_workers: int = 2,
+    ) -> dict:
+        """Clone, archive, and make repos private.
+
+        The three steps run as a pipeline with a separate worker pool each, so
+        network clones overlap with compressing earlier repos and with API
+        calls. Per-stage throughput and queue depths are returned under
+        "metrics"; per-repo timings and byte counts go to self.telemetry as
+        each stage finishes.
+
+        If a journal is given, stages it already records as complete are
+        skipped (as long as their output is still on disk) and each newly
+        completed stage is appended to it.
+        """
         results = {"successful": [], "failed": [], "warnings": []}
+        telemetry = self.telemetry
 
-        for repo in repos:
+        def timed(stage: str, func, last: bool = False):
+            def run(item):
+                repo_name = item[1]["name"]
+                start = time.perf_counter()
+                try:
+                    result = func(item)
+                except Exception:
+                    telemetry.record_stage(repo_name, stage, time.perf_counter() - start)
+                    telemetry.repo_finished(ok=False)
+                    raise
+                telemetry.record_stage(repo_name, stage, time.perf_counter() - start)
+                if last:
+                    telemetry.repo_finished(ok=True)
+                return result
+
+            return run
+
+        def done(repo_name: str) -> set[str]:
+            return journal.completed(repo_name) if journal else set()
+
+        def record(repo_name: str, stage: str):
+            if journal:
+                journal.record(repo_name, stage)
+
+        def needs_archive(repo_name: str) -> bool:
+            return ARCHIVED not in done(repo_name) or not self.archive_path(repo_name).exists()
+
+        def clone(item):
+            _, repo = item
             repo_name = repo["name"]
-            try:
+            local_path = self.work_dir / repo_name
+            if needs_archive(repo_name) and (
+                CLONED not in done(repo_name) or not local_path.exists()
+            ):
                 self.clone_repo(repo["clone_url"], repo_name)
-                self.archive_repo(self.work_dir / repo_name, repo_name)
+                telemetry.add_bytes("cloned", _tree_size(local_path))
+                record(repo_name, CLONED)
+            return item
 
+        def archive(item):
+            _, repo = item
+            repo_name = repo["name"]
+            if needs_archive(repo_name):
+                path = self.archive_repo(self.work_dir / repo_name, repo_name)
+                telemetry.add_bytes("archived", self._archived_size(path))
+                record(repo_name, ARCHIVED)
+            return item
+
+        def privatise(item):
+            _, repo = item
+            repo_name = repo["name"]
+            if PRIVATISED not in done(repo_name):
                 try:
                     self.make_private(repo_name)
+                    record(repo_name, PRIVATISED)
                 except RuntimeError as e:
                     if "422" in str(e):
                         results["warnings"].append({"name": repo_name, "reason": str(e)})
                     else:
                         raise
+            return item
+
+        pipeline = Pipeline(
+            [
+                ("clone", timed("clone", clone), clone_workers),
+                ("archive", timed("archive", archive), archive_workers),
+                ("privatise", timed("privatise", privatise, last=True), api_workers),
+            ]
+        )
+        finished, errors = pipeline.run(enumerate(repos))
+
+        for _, repo in sorted(finished, key=lambda item: item[0]):
+            results["successful"].append(repo["name"])
 
-                results["successful"].append(repo_name)
-            except RuntimeError as e:
-                results["failed"].append({"name": repo_name, "error": str(e)})
+        for (_, repo), _, error in sorted(errors, key=lambda e: e[0][0]):
+            # requests' exceptions (HTTP errors included) subclass OSError;
+            # anything else is a bug and should not be reported as a failed repo
+            if not isinstance(error, (RuntimeError, OSError)):
+                raise error
+            results["failed"].append({"name": repo["name"], "error": str(error)})
 
+        results["metrics"] = pipeline.summary()
         return results
 
-    def delete_repos(self, repos: list[dict]) -> dict:
-        """Delete repositories from GitHub."""
-        results = {"deleted": [], "failed": []}
+    def _run_each(self, name: str, func, repos: Iterable[dict], workers: int):
+        """Call func(repo) for every repo with at most workers in flight.
+
+        Returns ([(repo, result)], [(repo, error)]), both in input order.
+        """
+
+        def run(item):
+            index, repo = item
+            return index, repo, func(repo)
+
+        pipeline = Pipeline([(name, run, workers)], queue_size=workers * 2)
+        outputs, errors = pipeline.run(enumerate(repos))
+        return (
+            [(repo, result) for _, repo, result in sorted(outputs, key=lambda o: o[0])],
+            [(repo, error) for (_, repo), _, error in sorted(errors, key=lambda e: e[0][0])],
+        )
+
+    def plan_deletes(self, repos: Iterable[dict], workers: int = 8) -> dict:
+        """Check which repos still exist on GitHub, without changing anything.
+
+        Returns names under "live" and "gone", checks that errored under
+        "failed", and live repos with no archive on disk under "unarchived".
+        """
+        plan = {"live": [], "gone": [], "failed": [], "unarchived": []}
+
+        checked, errors = self._run_each(
+            "plan", lambda repo: self.repo_exists(repo["name"]), repos, workers
+        )
+        for repo, exists in checked:
+            repo_name = repo["name"]
+            plan["live" if exists else "gone"].append(repo_name)
+            if exists and not self.archive_path(repo_name).exists():
+                plan["unarchived"].append(repo_name)
+
+        for repo, error in errors:
+            plan["failed"].append({"name": repo["name"], "error": str(error)})
+
+        return plan
+
+    def delete_repos(
+        self, repos: Iterable[dict], journal: Journal | None = None, workers: int = 8
+    ) -> dict:
+        """Delete repositories from GitHub with up to workers requests in flight.
+
+        Repos GitHub no longer has (404) are reported under "already_gone"
+        rather than "deleted". 5xx responses are retried by the scheduler.
+        Repos the journal marks deleted are skipped and reported as deleted.
+        """
+        results = {"deleted": [], "already_gone": [], "failed": []}
 
-        for repo in repos:
+        def delete(repo):
             repo_name = repo["name"]
-            try:
-                if self.delete_repo(repo_name):
-                    results["deleted"].append(repo_name)
-            except Exception as e:
-                results["failed"].append({"name": repo_name, "error": str(e)})
+            if journal and journal.is_done(repo_name, DELETED):
+                return "deleted"
+            outcome = self.delete_repo(repo_name)
+            if journal:
+                journal.record(repo_name, DELETED)
+            return outcome
+
+        finished, errors = self._run_each("delete", delete, repos, workers)
+        for repo, outcome in finished:
+            key = "already_gone" if outcome == "already_gone" else "deleted"
+            results[key].append(repo["name"])
+
+        for repo, error in errors:
+            results["failed"].append({"name": repo["name"], "error": str(error)})
 
         return results
 
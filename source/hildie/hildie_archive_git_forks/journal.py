@@ -0,0 +1,66 @@
+"""Append-only JSON Lines journal of per-repo stage completion."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+CLONED = "cloned"
+ARCHIVED = "archived"
+PRIVATISED = "privatised"
+DELETED = "deleted"
+
+STAGES = (CLONED, ARCHIVED, PRIVATISED, DELETED)
+
+
+class Journal:
+    """Record which stages have finished for each repo so runs can resume.
+
+    Each completed stage is appended as one JSON object per line and flushed
+    immediately, so a run killed part-way loses at most the stage in flight.
+    A torn final line from a crash mid-write is ignored on load. Without
+    resume, earlier entries are ignored but kept, and new ones are appended.
+    """
+
+    def __init__(self, path: str, resume: bool = True):
+        self.path = Path(path)
+        self._completed: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+        if resume:
+            self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get("stage") in STAGES and entry.get("name"):
+                    self._completed.setdefault(entry["name"], set()).add(entry["stage"])
+
+    def completed(self, repo_name: str) -> set[str]:
+        """Return the stages already recorded for repo_name."""
+        return set(self._completed.get(repo_name, ()))
+
+    def is_done(self, repo_name: str, stage: str) -> bool:
+        """Return True if stage has been recorded for repo_name."""
+        return stage in self._completed.get(repo_name, ())
+
+    def record(self, repo_name: str, stage: str):
+        """Append a stage completion for repo_name."""
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage: {stage}")
+
+        entry = {"name": repo_name, "stage": stage, "time": time.time()}
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+                f.flush()
+
+            self._completed.setdefault(repo_name, set()).add(stage)
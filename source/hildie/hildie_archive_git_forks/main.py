@@ -1,10 +1,22 @@
 """CLI for archiving GitHub forked repositories."""
 
+import itertools
 import os
+import sys
+import threading
+import time
 
 import click
 
-from .archiver import ArchiveForks, get_github_username
+from .archiver import ARCHIVE_FORMATS, ArchiveForks, get_github_username, restore_archive
+from .journal import Journal
+from .telemetry import Telemetry
+from .verify import verify_archives
+
+FLAT_FILE = "forked_repos.jsonl"
+# The default flat file before fetch switched to JSON Lines
+LEGACY_FLAT_FILE = "forked_repos.json"
+JOURNAL_FILE = "archive_journal.jsonl"
 
 
 def get_env_or_fail(var_name: str) -> str:
@@ -20,6 +32,41 @@ def get_token() -> str:
     return get_env_or_fail("GITHUB_TOKEN")
 
 
+def resolve_flat_file(flat_file: str) -> str:
+    """Return flat_file, or the legacy default if it is the only one on disk.
+
+    Lets process and delete keep working on a file written by an older fetch.
+    """
+    if (
+        flat_file == FLAT_FILE
+        and not os.path.exists(flat_file)
+        and os.path.exists(LEGACY_FLAT_FILE)
+    ):
+        click.echo(f"{FLAT_FILE} not found, reading {LEGACY_FLAT_FILE}", err=True)
+        return LEGACY_FLAT_FILE
+    return flat_file
+
+
+def live_progress(interval: float = 0.5):
+    """Return a telemetry listener that redraws one progress line on stderr.
+
+    Redraws are throttled to one per interval seconds, since listeners run on
+    every update from every worker thread.
+    """
+    lock = threading.Lock()
+    last = [0.0]
+
+    def show(telemetry: Telemetry):
+        now = time.monotonic()
+        with lock:
+            if now - last[0] < interval:
+                return
+            last[0] = now
+            click.echo(f"\r\033[K{telemetry.progress_line()}", nl=False, err=True)
+
+    return show
+
+
 @click.group()
 def cli():
     """Archive and manage GitHub forked repositories."""
@@ -28,7 +75,7 @@ def cli():
 @cli.command()
 @click.option("--work-dir", default="./forked_repos")
 @click.option("--archive-dir", default="./archived_repos")
-@click.option("--flat-file", default="forked_repos.json")
+@click.option("--flat-file", default=FLAT_FILE)
 def fetch(work_dir, archive_dir, flat_file):
     """Fetch all your forked repos."""
     try:
@@ -43,20 +90,22 @@ def fetch(work_dir, archive_dir, flat_file):
     manager.setup_directories()
 
     click.echo("Fetching forked repos...")
-    repos = manager.fetch_forked_repos()
-    click.echo(f"Found {len(repos)} forked repositories\n")
-
-    # Sort by updated date and display
-    sorted_repos = sorted(repos, key=lambda r: r.get("updated_at", ""), reverse=True)
     click.echo("Recent repos:")
-    for repo in sorted_repos[:10]:  # Show top 10
-        updated = repo.get("updated_at", "unknown")[:10]  # Just the date part
-        click.echo(f"  {repo['name']:40} ({updated})")
-    if len(repos) > 10:
-        click.echo(f"  ... and {len(repos) - 10} more")
-
-    manager.export_repos(repos, flat_file)
-    click.echo(f"\nExported {len(repos)} repos to {flat_file}")
+
+    def show_recent(repos):
+        # Repos arrive newest first, so the first ten are the most recent
+        for count, repo in enumerate(repos):
+            if count < 10:
+                updated = repo.get("updated_at", "unknown")[:10]  # Just the date part
+                click.echo(f"  {repo['name']:40} ({updated})")
+            yield repo
+
+    count = manager.export_repos(show_recent(manager.fetch_forked_repos()), flat_file)
+    if count > 10:
+        click.echo(f"  ... and {count - 10} more")
+
+    click.echo(f"\nFound {count} forked repositories")
+    click.echo(f"Exported {count} repos to {flat_file}")
     click.echo("Edit the file to select which repos to archive")
     click.echo("Then run: archive-git-forks process")
 
@@ -64,8 +113,38 @@ def fetch(work_dir, archive_dir, flat_file):
 @cli.command()
 @click.option("--work-dir", default="./forked_repos")
 @click.option("--archive-dir", default="./archived_repos")
-@click.option("--flat-file", default="forked_repos.json")
-def process(work_dir, archive_dir, flat_file):
+@click.option("--flat-file", default=FLAT_FILE)
+@click.option("--journal-file", default=JOURNAL_FILE, help="Stage completion journal")
+@click.option("--resume", is_flag=True, help="Skip stages already recorded in the journal")
+@click.option("--clone-workers", default=4, show_default=True, help="Concurrent git clones")
+@click.option("--archive-workers", default=2, show_default=True, help="Concurrent zip archives")
+@click.option("--api-workers", default=2, show_default=True, help="Concurrent GitHub API calls")
+@click.option(
+    "--archive-format",
+    type=click.Choice(ARCHIVE_FORMATS),
+    default="zip",
+    show_default=True,
+    help="zip per repo, or cas for a deduplicating blob store",
+)
+@click.option(
+    "--progress/--no-progress",
+    default=None,
+    help="Show a live progress line (default: when stderr is a terminal)",
+)
+@click.option("--metrics-file", default=None, help="Write a JSON telemetry summary here")
+def process(
+    work_dir,
+    archive_dir,
+    flat_file,
+    journal_file,
+    resume,
+    clone_workers,
+    archive_workers,
+    api_workers,
+    archive_format,
+    progress,
+    metrics_file,
+):
     """Clone, archive, and make repos private."""
     try:
         token = get_token()
@@ -73,20 +152,42 @@ def process(work_dir, archive_dir, flat_file):
     except Exception as e:
         raise click.ClickException(str(e)) from e
 
-    manager = ArchiveForks(username, token, work_dir, archive_dir)
+    manager = ArchiveForks(username, token, work_dir, archive_dir, archive_format=archive_format)
     manager.setup_directories()
 
+    flat_file = resolve_flat_file(flat_file)
     try:
-        repos = manager.load_selected_repos(flat_file)
+        repos = iter(manager.load_selected_repos(flat_file))
     except FileNotFoundError:
         raise click.ClickException(f"{flat_file} not found. Run 'fetch' first.") from None
 
-    if not repos:
+    # Peek at the first repo so an empty file fails fast without reading ahead
+    first = next(repos, None)
+    if first is None:
         raise click.ClickException("No repos to process")
-
-    click.echo(f"Processing {len(repos)} selected repositories\n")
-
-    results = manager.process_repos(repos)
+    repos = itertools.chain([first], repos)
+
+    # Counting lines is far cheaper than the JSON decoding the pipeline does
+    total = manager.count_repos(flat_file)
+    click.echo(f"Processing {total} selected repositories from {flat_file}\n")
+
+    telemetry = Telemetry(total=total)
+    if progress is None:
+        progress = sys.stderr.isatty()
+    if progress:
+        telemetry.listeners.append(live_progress())
+    manager.telemetry = telemetry
+
+    journal = Journal(journal_file, resume=resume)
+    results = manager.process_repos(
+        repos,
+        journal=journal,
+        clone_workers=clone_workers,
+        archive_workers=archive_workers,
+        api_workers=api_workers,
+    )
+    if progress:
+        click.echo(f"\r\033[K{telemetry.progress_line()}", err=True)
 
     # Show results
     for name in results["successful"]:
@@ -104,11 +205,82 @@ def process(work_dir, archive_dir, flat_file):
         f"{len(results['failed'])} failed"
     )
 
+    for stage in results.get("metrics", []):
+        click.echo(
+            f"  {stage['name']:10} {stage['workers']} workers, "
+            f"{stage['items_per_second']:.2f} repos/s, "
+            f"{stage['utilisation']:.0%} busy, "
+            f"queue avg {stage['avg_queue_depth']:.1f} max {stage['max_queue_depth']}"
+        )
+
+    if metrics_file:
+        telemetry.write_json(metrics_file, {"pipeline": results.get("metrics", [])})
+        click.echo(f"Wrote telemetry to {metrics_file}")
+
+
+def show_verification(report: dict):
+    """Print per-repo verification results and throughput."""
+    for result in report["results"]:
+        if result["ok"]:
+            click.echo(f"✓ {result['name']}: {result['checked']} files match {result['head'][:12]}")
+            continue
+
+        problems = result["error"] or ", ".join(
+            [f"missing {p}" for p in result["missing"][:3]]
+            + [f"changed {p}" for p in result["mismatched"][:3]]
+        )
+        click.echo(f"✗ {result['name']}: {problems}")
+
+    click.echo(
+        f"\nVerified {len(report['results'])} archives in {report['elapsed']:.1f}s "
+        f"({report['archives_per_second']:.1f} archives/s, {report['mb_per_second']:.1f} MB/s)"
+    )
+
 
 @cli.command()
-@click.option("--flat-file", default="forked_repos.json")
+@click.option("--work-dir", default="./forked_repos")
+@click.option("--archive-dir", default="./archived_repos")
+@click.option("--workers", type=int, default=None, help="Verifier processes (default: CPU count)")
+def verify(work_dir, archive_dir, workers):
+    """Check every archive against its clone's git tree."""
+    report = verify_archives(archive_dir, work_dir, workers=workers)
+    if not report["results"]:
+        raise click.ClickException(f"No archives found in {archive_dir}")
+
+    show_verification(report)
+
+    failed = [r for r in report["results"] if not r["ok"]]
+    if failed:
+        raise click.ClickException(f"{len(failed)} archives failed verification")
+
+
+@cli.command()
+@click.option("--flat-file", default=FLAT_FILE)
 @click.option("--force", is_flag=True, help="Skip confirmation")
-def delete(flat_file, force):
+@click.option("--journal-file", default=JOURNAL_FILE, help="Stage completion journal")
+@click.option("--resume", is_flag=True, help="Skip repos already recorded as deleted")
+@click.option(
+    "--require-verified",
+    is_flag=True,
+    help="Only delete repos whose archive passes verification",
+)
+@click.option("--work-dir", default="./forked_repos")
+@click.option("--archive-dir", default="./archived_repos")
+@click.option("--workers", default=8, show_default=True, help="DELETE requests in flight")
+@click.option("--plan", is_flag=True, help="Check which repos still exist and only delete those")
+@click.option("--dry-run", is_flag=True, help="Show the plan and exit without deleting")
+def delete(
+    flat_file,
+    force,
+    journal_file,
+    resume,
+    require_verified,
+    work_dir,
+    archive_dir,
+    workers,
+    plan,
+    dry_run,
+):
     """Delete forked repos from GitHub (irreversible!)."""
     try:
         token = get_token()
@@ -116,33 +288,107 @@ def delete(flat_file, force):
     except Exception as e:
         raise click.ClickException(str(e)) from e
 
-    manager = ArchiveForks(username, token)
+    manager = ArchiveForks(username, token, work_dir, archive_dir)
 
+    flat_file = resolve_flat_file(flat_file)
     try:
         repos = manager.load_repos(flat_file)
     except FileNotFoundError:
         raise click.ClickException(f"{flat_file} not found") from None
 
-    if not repos:
-        raise click.ClickException("No repos to delete")
-
+    # List by streaming the file once, then stream it again to delete
     click.echo("Repos to delete:")
+    count = 0
     for repo in repos:
         click.echo(f"  - {repo['name']}")
+        count += 1
+
+    if not count:
+        raise click.ClickException("No repos to delete")
 
-    if not force and not click.confirm(f"\nDelete {len(repos)} repos? This cannot be undone!"):
+    unverified = set()
+    if require_verified:
+        click.echo("\nVerifying archives...")
+        names = [repo["name"] for repo in manager.load_repos(flat_file)]
+        report = manager.verify_archives(names)
+        show_verification(report)
+        unverified = {r["name"] for r in report["results"] if not r["ok"]}
+        if unverified:
+            click.echo(f"Skipping {len(unverified)} repos without a verified archive")
+        count -= len(unverified)
+        if not count:
+            raise click.ClickException("No verified repos to delete")
+
+    def targets():
+        return (r for r in manager.load_repos(flat_file) if r["name"] not in unverified)
+
+    live = None
+    if plan or dry_run:
+        click.echo("\nChecking which repos still exist...")
+        checked = manager.plan_deletes(targets(), workers=workers)
+        for name in checked["gone"]:
+            click.echo(f"  - {name} already gone")
+        for failed in checked["failed"]:
+            click.echo(f"  ✗ {failed['name']}: {failed['error']}")
+        for name in checked["unarchived"]:
+            click.echo(f"  ⚠ {name} has no local archive")
+        click.echo(
+            f"Plan: {len(checked['live'])} live, {len(checked['gone'])} already gone, "
+            f"{len(checked['failed'])} could not be checked"
+        )
+
+        if dry_run:
+            return
+        live = set(checked["live"])
+        count = len(live)
+        if not count:
+            click.echo("Nothing to delete")
+            return
+
+    if not force and not click.confirm(f"\nDelete {count} repos? This cannot be undone!"):
         click.echo("Cancelled")
         return
 
-    results = manager.delete_repos(repos)
+    journal = Journal(journal_file, resume=resume)
+    repos = targets()
+    if live is not None:
+        repos = (r for r in repos if r["name"] in live)
+    results = manager.delete_repos(repos, journal=journal, workers=workers)
 
     for name in results["deleted"]:
         click.echo(f"✓ {name} deleted")
 
+    for name in results.get("already_gone", []):
+        click.echo(f"- {name} already gone")
+
     for failed in results["failed"]:
         click.echo(f"✗ {failed['name']}: {failed['error']}")
 
-    click.echo(f"\nDeleted: {len(results['deleted'])}, Failed: {len(results['failed'])}")
+    click.echo(
+        f"\nDeleted: {len(results['deleted'])}, "
+        f"Already gone: {len(results.get('already_gone', []))}, "
+        f"Failed: {len(results['failed'])}"
+    )
+
+
+@cli.command()
+@click.argument("repo_name")
+@click.option("--archive-dir", default="./archived_repos")
+@click.option("--dest", default=None, help="Directory to restore into (default: ./<repo_name>)")
+def restore(repo_name, archive_dir, dest):
+    """Rebuild a repo's files from its archive."""
+    from pathlib import Path
+
+    dest = Path(dest or repo_name)
+    if dest.exists() and any(dest.iterdir()):
+        raise click.ClickException(f"{dest} already exists and is not empty")
+
+    try:
+        restore_archive(archive_dir, repo_name, dest)
+    except FileNotFoundError as e:
+        raise click.ClickException(str(e)) from None
+
+    click.echo(f"Restored {repo_name} to {dest}")
 
 
 @cli.command()
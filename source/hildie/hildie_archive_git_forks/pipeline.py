@@ -0,0 +1,148 @@
+"""Staged worker-pool pipeline with bounded queues between stages."""
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+_DONE = object()
+
+
+class StageMetrics:
+    """Throughput and queue-depth counters for one pipeline stage."""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+        self._lock = threading.Lock()
+
+    def sample_queue(self, depth: int):
+        """Record the input queue depth seen when a worker took an item."""
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+            self._depth_total += depth
+            self._depth_samples += 1
+
+    def record(self, seconds: float, ok: bool):
+        """Record one item handled in seconds."""
+        with self._lock:
+            self.busy_seconds += seconds
+            if ok:
+                self.processed += 1
+            else:
+                self.failed += 1
+
+    def summary(self, elapsed: float) -> dict:
+        """Return the counters as a dict, with rates computed over elapsed seconds."""
+        elapsed = max(elapsed, 1e-9)
+        return {
+            "name": self.name,
+            "workers": self.workers,
+            "processed": self.processed,
+            "failed": self.failed,
+            "items_per_second": self.processed / elapsed,
+            "utilisation": self.busy_seconds / (elapsed * self.workers),
+            "avg_queue_depth": self._depth_total / max(self._depth_samples, 1),
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+class Pipeline:
+    """Run items through a chain of stages, each with its own thread pool.
+
+    Stages are (name, func, workers) tuples. func takes an item and returns
+    the item to hand to the next stage. If func raises, the item is dropped
+    and (item, stage name, exception) is added to errors. Queues between
+    stages hold at most queue_size items, so a fast stage cannot run
+    arbitrarily far ahead of a slow one.
+    """
+
+    def __init__(self, stages: list[tuple[str, Callable, int]], queue_size: int = 8):
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        if any(workers < 1 for _, _, workers in stages):
+            raise ValueError("Every stage needs at least one worker")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.metrics = [StageMetrics(name, workers) for name, _, workers in stages]
+        self.elapsed = 0.0
+
+    def run(self, items: Iterable) -> tuple[list, list]:
+        """Push items through every stage. Returns (outputs, errors)."""
+        queues = [queue.Queue(self.queue_size) for _ in self.stages]
+        outputs = []
+        errors = []
+        threads = []
+        start = time.perf_counter()
+
+        for index, (name, func, workers) in enumerate(self.stages):
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            next_workers = self.stages[index + 1][2] if outbox is not None else 0
+            remaining = [workers]
+            lock = threading.Lock()
+            metrics = self.metrics[index]
+
+            def work(
+                name=name,
+                func=func,
+                inbox=inbox,
+                outbox=outbox,
+                next_workers=next_workers,
+                remaining=remaining,
+                lock=lock,
+                metrics=metrics,
+            ):
+                while True:
+                    metrics.sample_queue(inbox.qsize())
+                    item = inbox.get()
+                    if item is _DONE:
+                        break
+
+                    t0 = time.perf_counter()
+                    try:
+                        result = func(item)
+                    except Exception as e:
+                        metrics.record(time.perf_counter() - t0, ok=False)
+                        errors.append((item, name, e))
+                        continue
+                    metrics.record(time.perf_counter() - t0, ok=True)
+
+                    if outbox is None:
+                        outputs.append(result)
+                    else:
+                        outbox.put(result)
+
+                # The last worker out tells every worker of the next stage to stop
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last and outbox is not None:
+                    for _ in range(next_workers):
+                        outbox.put(_DONE)
+
+            for _ in range(workers):
+                thread = threading.Thread(target=work, name=f"pipeline-{name}", daemon=True)
+                thread.start()
+                threads.append(thread)
+
+        for item in items:
+            queues[0].put(item)
+        for _ in range(self.stages[0][2]):
+            queues[0].put(_DONE)
+
+        for thread in threads:
+            thread.join()
+
+        self.elapsed = time.perf_counter() - start
+        return outputs, errors
+
+    def summary(self) -> list[dict]:
+        """Return per-stage metrics from the last run."""
+        return [metrics.summary(self.elapsed) for metrics in self.metrics]
@@ -0,0 +1,210 @@
+"""Rate-limit-aware request scheduling for the GitHub API."""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+RETRY_STATUSES = {500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose refill rate can be changed on the fly."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def set_rate(self, rate: float, available: float | None = None):
+        """Change the refill rate in tokens per second.
+
+        If available is given, tokens already in the bucket are capped to it.
+        """
+        with self._lock:
+            self._refill(self.clock())
+            self.rate = rate
+            if available is not None:
+                self.tokens = min(self.tokens, available)
+
+    def pause_until(self, deadline: float):
+        """Hand out no tokens until the clock reaches deadline."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, deadline)
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+class RequestScheduler:
+    """Wrap a requests session with adaptive throttling and retries.
+
+    Every request takes a token from a shared bucket whose rate follows
+    GitHub's X-RateLimit-Remaining/X-RateLimit-Reset headers, so the remaining
+    budget is spread evenly until the window resets. Primary and secondary
+    rate-limit responses (403/429) pause the whole bucket for Retry-After or
+    until the reset time; 5xx responses and connection errors are retried
+    with full-jitter exponential backoff. Concurrent requests to one host are
+    capped by a semaphore.
+
+    If an observer is given it is called as observer(method, seconds, status)
+    after every round trip, with status None when the request raised.
+    """
+
+    def __init__(
+        self,
+        session,
+        rate: float = 10.0,
+        burst: float = 100.0,
+        max_rate: float = 50.0,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 60.0,
+        per_host: int = 8,
+        clock=time.monotonic,
+        wall_clock=time.time,
+        sleep=time.sleep,
+        observer=None,
+    ):
+        self.session = session
+        self.observer = observer
+        self.bucket = TokenBucket(rate, burst, clock=clock, sleep=sleep)
+        self.max_rate = max_rate
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.per_host = per_host
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.sleep = sleep
+        self._hosts: dict[str, threading.BoundedSemaphore] = {}
+        self._hosts_lock = threading.Lock()
+
+    @contextmanager
+    def _host_slot(self, url: str):
+        host = urlsplit(url).netloc
+        with self._hosts_lock:
+            slot = self._hosts.setdefault(host, threading.BoundedSemaphore(self.per_host))
+        with slot:
+            yield
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2**attempt))
+
+    def _reset_in(self, response) -> float | None:
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset is None:
+            return None
+        return max(float(reset) - self.wall_clock(), 0.0)
+
+    def _adapt(self, response):
+        """Spread the remaining rate-limit budget over the rest of the window."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset_in = self._reset_in(response)
+        if remaining is None or reset_in is None:
+            return
+
+        remaining = int(remaining)
+        if remaining == 0:
+            self.bucket.pause_until(self.clock() + reset_in)
+        else:
+            rate = min(self.max_rate, remaining / max(reset_in, 1.0))
+            self.bucket.set_rate(rate, available=remaining)
+
+    def _is_rate_limited(self, response) -> bool:
+        if response.status_code == 429:
+            return True
+        if response.status_code != 403:
+            return False
+        if "Retry-After" in response.headers:
+            return True
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            return True
+        return "rate limit" in getattr(response, "text", "").lower()
+
+    def _retry_delay(self, response, attempt: int) -> float | None:
+        """Return how long to wait before retrying, or None if not retryable."""
+        if self._is_rate_limited(response):
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None:
+                delay = float(retry_after)
+            else:
+                delay = self._reset_in(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+            # Rate limits are per account, so stop every caller, not just this one
+            self.bucket.pause_until(self.clock() + delay)
+            return 0.0
+
+        if response.status_code in RETRY_STATUSES:
+            return self._backoff(attempt)
+
+        return None
+
+    def request(self, method: str, url: str, **kwargs):
+        """Send a request through the throttle, retrying transient failures."""
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            try:
+                with self._host_slot(url):
+                    start = time.perf_counter()
+                    status = None
+                    try:
+                        response = self.session.request(method, url, **kwargs)
+                        status = response.status_code
+                    finally:
+                        if self.observer:
+                            self.observer(method, time.perf_counter() - start, status)
+            except OSError:
+                # requests' ConnectionError and Timeout are OSError subclasses
+                if attempt == self.max_retries:
+                    raise
+                self.sleep(self._backoff(attempt))
+                continue
+
+            self._adapt(response)
+            delay = self._retry_delay(response, attempt)
+            if delay is None or attempt == self.max_retries:
+                return response
+            if delay:
+                self.sleep(delay)
+
+    def get(self, url: str, **kwargs):
+        """Send a throttled GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def patch(self, url: str, **kwargs):
+        """Send a throttled PATCH request."""
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        """Send a throttled DELETE request."""
+        return self.request("DELETE", url, **kwargs)
@@ -0,0 +1,245 @@
+"""Content-addressed, deduplicating archive storage."""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import subprocess
+import tempfile
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class BlobStore:
+    """Store repo trees as manifests pointing at shared, compressed blobs.
+
+    Every file is hashed with SHA-256 and stored once under
+    blobs/<first two hex digits>/<digest>, zlib-compressed. A repo archive is
+    a JSON manifest under manifests/<repo>.json listing each path with its
+    mode and blob digest (or its target, for symlinks). Forks of the same
+    upstream share most files, so the store grows by roughly their unique
+    content only.
+
+    A clone's .git/objects is not stored file by file: every clone packs the
+    shared history into its own, byte-for-byte different packfile, which
+    would defeat deduplication. Instead each git object is stored once,
+    keyed by its own object id, as a loose object (the zlib-compressed
+    "<type> <size>\\0<content>" git itself writes), and the manifest lists
+    the ids under "objects". Restoring writes them back as loose objects;
+    run git gc in the restored repo to pack them again.
+
+    Blobs and manifests are written to a temporary file and renamed into
+    place, so concurrent writers and interrupted runs never leave a partial
+    blob behind.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.blob_dir = self.root / "blobs"
+        self.manifest_dir = self.root / "manifests"
+
+    def blob_path(self, digest: str) -> Path:
+        """Return where the blob with this hex digest or git object id is stored."""
+        return self.blob_dir / digest[:2] / digest
+
+    def manifest_path(self, repo_name: str) -> Path:
+        """Return where the manifest for repo_name is stored."""
+        return self.manifest_dir / f"{repo_name}.json"
+
+    def _write_atomic(self, path: Path, chunks: Iterator[bytes]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def put_file(self, path: Path) -> tuple[str, int]:
+        """Store the file at path if its content is new. Returns (digest, size)."""
+        digest = hashlib.sha256()
+        size = 0
+        with open(path, "rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                digest.update(chunk)
+                size += len(chunk)
+        digest = digest.hexdigest()
+
+        # Hash first: most files in related forks are already stored, so the
+        # common case costs one read and no write
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            self._write_atomic(blob, _compress(path))
+
+        return digest, size
+
+    def read_blob(self, digest: str) -> Iterator[bytes]:
+        """Yield the decompressed content of a blob in chunks."""
+        decompressor = zlib.decompressobj()
+        with open(self.blob_path(digest), "rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                yield decompressor.decompress(chunk)
+        yield decompressor.flush()
+
+    def put_git_objects(self, git_dir: Path) -> list[dict]:
+        """Store the objects in git_dir that are new. Returns their ids and sizes."""
+        listing = subprocess.run(
+            [
+                "git",
+                "--git-dir",
+                str(git_dir),
+                "cat-file",
+                "--batch-all-objects",
+                "--batch-check=%(objectname) %(objectsize)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        objects = []
+        for line in listing.stdout.splitlines():
+            oid, size = line.split()
+            objects.append({"oid": oid, "size": int(size)})
+
+        # Forks share most of their history, so most objects are already here
+        # and only the new ones are read out of the pack
+        missing = [o["oid"] for o in objects if not self.blob_path(o["oid"]).exists()]
+        if not missing:
+            return objects
+
+        with tempfile.TemporaryFile() as request:
+            request.write("".join(f"{oid}\n" for oid in missing).encode())
+            request.seek(0)
+            with subprocess.Popen(
+                ["git", "--git-dir", str(git_dir), "cat-file", "--batch"],
+                stdin=request,
+                stdout=subprocess.PIPE,
+            ) as proc:
+                for _ in missing:
+                    oid, kind, size = proc.stdout.readline().decode().split()
+                    self._write_atomic(
+                        self.blob_path(oid), _loose_object(proc.stdout, kind, int(size))
+                    )
+                    proc.stdout.read(1)
+            if proc.returncode != 0:
+                raise RuntimeError(f"git cat-file failed in {git_dir}")
+
+        return objects
+
+    def archive(self, local_path: Path, repo_name: str) -> Path:
+        """Store every file under local_path and write the repo's manifest."""
+        local_path = Path(local_path)
+        git_dir = local_path / ".git"
+        entries = []
+        objects = None
+
+        for dirpath, dirnames, filenames in os.walk(local_path):
+            dirnames.sort()
+            if Path(dirpath) == git_dir and "objects" in dirnames:
+                dirnames.remove("objects")
+                objects = self.put_git_objects(git_dir)
+            for filename in sorted(filenames):
+                path = Path(dirpath) / filename
+                rel = path.relative_to(local_path).as_posix()
+                info = path.lstat()
+
+                if stat.S_ISLNK(info.st_mode):
+                    entries.append({"path": rel, "link": os.readlink(path)})
+                elif stat.S_ISREG(info.st_mode):
+                    digest, size = self.put_file(path)
+                    entries.append(
+                        {
+                            "path": rel,
+                            "mode": stat.S_IMODE(info.st_mode),
+                            "blob": digest,
+                            "size": size,
+                        }
+                    )
+
+        manifest = self.manifest_path(repo_name)
+        body = {"name": repo_name, "files": entries}
+        if objects is not None:
+            body["objects"] = objects
+        body = json.dumps(body).encode()
+        self._write_atomic(manifest, iter([body]))
+        return manifest
+
+    def load_manifest(self, repo_name: str) -> dict:
+        """Read the manifest for repo_name."""
+        with open(self.manifest_path(repo_name)) as f:
+            return json.load(f)
+
+    def restore(self, repo_name: str, dest: str | Path) -> Path:
+        """Rebuild the tree for repo_name under dest."""
+        dest = Path(dest)
+        manifest = self.load_manifest(repo_name)
+        for entry in manifest["files"]:
+            target = dest / entry["path"]
+            if not target.resolve().is_relative_to(dest.resolve()):
+                raise RuntimeError(f"Refusing to restore {entry['path']} outside {dest}")
+            target.parent.mkdir(parents=True, exist_ok=True)
+
+            if "link" in entry:
+                os.symlink(entry["link"], target)
+                continue
+
+            with open(target, "wb") as f:
+                for chunk in self.read_blob(entry["blob"]):
+                    f.write(chunk)
+            os.chmod(target, entry["mode"])
+
+        if "objects" in manifest:
+            git_dir = dest / ".git"
+            # git refuses a .git without these, and they are often empty
+            for sub in ("objects/info", "objects/pack", "refs/heads", "refs/tags"):
+                (git_dir / sub).mkdir(parents=True, exist_ok=True)
+            for obj in manifest["objects"]:
+                oid = obj["oid"]
+                target = git_dir / "objects" / oid[:2] / oid[2:]
+                target.parent.mkdir(exist_ok=True)
+                shutil.copyfile(self.blob_path(oid), target)
+
+        return dest
+
+    def usage(self) -> dict:
+        """Return blob count, bytes on disk, and logical bytes across manifests."""
+        blobs = [p for p in self.blob_dir.glob("*/*") if not p.name.startswith(".tmp-")]
+        logical = 0
+        for manifest in self.manifest_dir.glob("*.json"):
+            with open(manifest) as f:
+                data = json.load(f)
+            logical += sum(e.get("size", 0) for e in data["files"])
+            logical += sum(o["size"] for o in data.get("objects", []))
+        return {
+            "blobs": len(blobs),
+            "stored_bytes": sum(p.stat().st_size for p in blobs),
+            "logical_bytes": logical,
+        }
+
+
+def _compress(path: Path) -> Iterator[bytes]:
+    compressor = zlib.compressobj()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield compressor.compress(chunk)
+    yield compressor.flush()
+
+
+def _loose_object(stream, kind: str, size: int) -> Iterator[bytes]:
+    compressor = zlib.compressobj()
+    yield compressor.compress(f"{kind} {size}\0".encode())
+    remaining = size
+    while remaining:
+        chunk = stream.read(min(CHUNK_SIZE, remaining))
+        if not chunk:
+            raise RuntimeError("git cat-file output ended early")
+        remaining -= len(chunk)
+        yield compressor.compress(chunk)
+    yield compressor.flush()
@@ -0,0 +1,166 @@
+"""Run telemetry: stage timings, byte counts, API latency and ETA."""
+
+import bisect
+import json
+import threading
+import time
+from collections.abc import Callable
+
+# Upper bounds of the API latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float):
+        """Add one observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction: float) -> float:
+        """Return the upper bound of the bucket holding the given fraction."""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.max
+
+    def summary(self) -> dict:
+        """Return counts per bucket and summary statistics."""
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+class Telemetry:
+    """Thread-safe counters for a process run.
+
+    Listeners are called with the Telemetry instance after every update, so a
+    CLI can redraw a progress line while the run is going.
+    """
+
+    def __init__(self, total: int | None = None, clock=time.monotonic):
+        self.total = total
+        self.clock = clock
+        self.started = clock()
+        self.completed = 0
+        self.failed = 0
+        self.bytes = {"cloned": 0, "archived": 0}
+        self.stages: dict[str, dict[str, float]] = {}
+        self.api_latency = Histogram()
+        self.api_status: dict[int, int] = {}
+        self.listeners: list[Callable[[Telemetry], None]] = []
+        self._lock = threading.Lock()
+
+    def _notify(self):
+        for listener in self.listeners:
+            listener(self)
+
+    def record_stage(self, repo_name: str, stage: str, seconds: float):
+        """Record how long one stage took for one repo."""
+        with self._lock:
+            self.stages.setdefault(repo_name, {})[stage] = seconds
+        self._notify()
+
+    def add_bytes(self, kind: str, count: int):
+        """Add to the bytes cloned or archived so far."""
+        with self._lock:
+            self.bytes[kind] = self.bytes.get(kind, 0) + count
+        self._notify()
+
+    def record_api(self, method: str, seconds: float, status: int | None):
+        """Record one API round trip."""
+        with self._lock:
+            self.api_latency.add(seconds * 1000)
+            if status is not None:
+                self.api_status[status] = self.api_status.get(status, 0) + 1
+        self._notify()
+
+    def repo_finished(self, ok: bool):
+        """Count a repo as done, successfully or not."""
+        with self._lock:
+            self.completed += 1
+            if not ok:
+                self.failed += 1
+        self._notify()
+
+    def elapsed(self) -> float:
+        """Seconds since the run started."""
+        return self.clock() - self.started
+
+    def eta(self) -> float | None:
+        """Estimated seconds remaining, if the total is known and work is done."""
+        if not self.total or not self.completed:
+            return None
+        remaining = max(self.total - self.completed, 0)
+        return remaining * self.elapsed() / self.completed
+
+    def progress_line(self) -> str:
+        """Return a one-line progress summary."""
+        done = f"{self.completed}/{self.total}" if self.total else str(self.completed)
+        eta = self.eta()
+        parts = [
+            f"{done} repos",
+            f"{self.failed} failed",
+            f"{self.bytes['cloned'] / 1e6:.1f} MB cloned",
+            f"{self.bytes['archived'] / 1e6:.1f} MB archived",
+            f"API p50 {self.api_latency.percentile(0.5):.0f}ms",
+            f"ETA {_format_seconds(eta)}" if eta is not None else "ETA --",
+        ]
+        return " | ".join(parts)
+
+    def summary(self) -> dict:
+        """Return everything recorded so far as a JSON-serialisable dict."""
+        with self._lock:
+            stage_totals: dict[str, dict[str, float]] = {}
+            for timings in self.stages.values():
+                for stage, seconds in timings.items():
+                    totals = stage_totals.setdefault(stage, {"count": 0, "seconds": 0.0})
+                    totals["count"] += 1
+                    totals["seconds"] += seconds
+
+            return {
+                "elapsed": self.elapsed(),
+                "total": self.total,
+                "completed": self.completed,
+                "failed": self.failed,
+                "bytes": dict(self.bytes),
+                "stage_totals": stage_totals,
+                "repos": {name: dict(timings) for name, timings in self.stages.items()},
+                "api": {
+                    "latency_ms": self.api_latency.summary(),
+                    "status": {str(k): v for k, v in sorted(self.api_status.items())},
+                },
+            }
+
+    def write_json(self, path: str, extra: dict | None = None):
+        """Write summary(), plus any extra keys, to path as JSON."""
+        with open(path, "w") as f:
+            json.dump({**self.summary(), **(extra or {})}, f, indent=2)
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
@@ -0,0 +1,351 @@
+"""Local GitHub stand-in and throughput benchmarks for ArchiveForks.
+
+FakeGitHub serves the parts of the REST API that ArchiveForks uses (the
+paginated repos listing with Link headers, single-repo GET, PATCH and
+DELETE) from a thread on localhost, with optional per-request latency and a
+fixed-window rate limit. Each repo is backed by a bare git repository on
+disk and advertises a file:// clone URL, so the whole fetch/process/delete
+cycle runs offline.
+
+Run the benchmarks with:
+
+    python -m hildie.hildie_archive_git_forks.testing --repos 50 --concurrency 1,4,8
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from .archiver import ArchiveForks
+from .scheduler import RequestScheduler
+
+
+def _git(*args: str, cwd: Path | None = None):
+    subprocess.run(
+        ["git", "-c", "user.name=hildie", "-c", "user.email=hildie@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def make_template_repo(path: Path, files: int = 20, file_size: int = 4096) -> Path:
+    """Create a git repo whose single commit holds `files` deterministic text files."""
+    path.mkdir(parents=True, exist_ok=True)
+    _git("init", "-q", "-b", "main", str(path))
+    for i in range(files):
+        line = f"hildie fixture file {i}\n"
+        (path / f"file_{i:04d}.txt").write_text(line * (file_size // len(line) + 1))
+    _git("add", "-A", cwd=path)
+    _git("commit", "-q", "-m", "Initial commit", cwd=path)
+    return path
+
+
+class FakeGitHub:
+    """A local HTTP server that behaves like the GitHub REST API for one user."""
+
+    def __init__(
+        self,
+        root: Path,
+        username: str = "hildie",
+        latency: float = 0.0,
+        rate_limit: int | None = None,
+        rate_window: float = 60.0,
+    ):
+        self.root = Path(root)
+        self.username = username
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.repos: dict[str, dict] = {}
+        self.requests = 0
+        self.rate_limited = 0
+        self._template: Path | None = None
+        self._deleted: set[str] = set()
+        self._window_start = time.time()
+        self._window_count = 0
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    @property
+    def url(self) -> str:
+        """Base API URL to pass to ArchiveForks."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_repo(self, name: str, fork: bool = True) -> dict:
+        """Add a repo backed by a bare clone of a shared template repo."""
+        if self._template is None:
+            self._template = make_template_repo(self.root / "_template")
+
+        bare = self.root / f"{name}.git"
+        _git("clone", "-q", "--bare", str(self._template), str(bare))
+
+        # Newer repos first: each added repo is older than the last
+        updated = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(2_000_000_000 - len(self.repos)))
+        repo = {
+            "name": name,
+            "fork": fork,
+            "private": False,
+            "archived": False,
+            "clone_url": bare.resolve().as_uri(),
+            "updated_at": updated,
+        }
+        self.repos[name] = repo
+        return repo
+
+    def add_repos(self, count: int, prefix: str = "fork") -> list[dict]:
+        """Add count forked repos named <prefix>-0000 onwards."""
+        return [self.add_repo(f"{prefix}-{i:04d}") for i in range(count)]
+
+    def reset(self):
+        """Restore deleted repos and make every repo public again."""
+        with self._lock:
+            self._deleted.clear()
+            for repo in self.repos.values():
+                repo["private"] = False
+            self.requests = 0
+            self.rate_limited = 0
+
+    def live_repos(self) -> list[dict]:
+        """Return repos that have not been deleted, newest first."""
+        with self._lock:
+            live = [r for r in self.repos.values() if r["name"] not in self._deleted]
+        return sorted(live, key=lambda r: r["updated_at"], reverse=True)
+
+    def _rate_headers(self) -> tuple[bool, dict]:
+        """Count a request against the window. Returns (allowed, headers)."""
+        with self._lock:
+            self.requests += 1
+            if self.rate_limit is None:
+                return True, {}
+
+            now = time.time()
+            if now - self._window_start >= self.rate_window:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+
+            allowed = self._window_count <= self.rate_limit
+            if not allowed:
+                self.rate_limited += 1
+            headers = {
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": str(max(self.rate_limit - self._window_count, 0)),
+                "X-RateLimit-Reset": str(int(self._window_start + self.rate_window + 1)),
+            }
+            return allowed, headers
+
+    def start(self) -> "FakeGitHub":
+        """Start serving on an ephemeral localhost port."""
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body=None, headers: dict | None = None):
+                payload = b"" if body is None else json.dumps(body).encode()
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                if payload:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _handle(self, method: str):
+                if fake.latency:
+                    time.sleep(fake.latency)
+
+                allowed, headers = fake._rate_headers()
+                if not allowed:
+                    self._send(403, {"message": "API rate limit exceeded"}, headers)
+                    return
+
+                url = urlsplit(self.path)
+                parts = url.path.strip("/").split("/")
+
+                if method == "GET" and parts == ["users", fake.username, "repos"]:
+                    self._list(parse_qs(url.query), headers)
+                    return
+
+                if len(parts) == 3 and parts[:2] == ["repos", fake.username]:
+                    self._repo(method, parts[2], headers)
+                    return
+
+                self._send(404, {"message": "Not Found"}, headers)
+
+            def _list(self, query: dict, headers: dict):
+                per_page = int(query.get("per_page", ["30"])[0])
+                page = int(query.get("page", ["1"])[0])
+                live = fake.live_repos()
+                last = max((len(live) + per_page - 1) // per_page, 1)
+
+                links = []
+                base = f"{fake.url}/users/{fake.username}/repos?per_page={per_page}"
+                if page < last:
+                    links.append(f'<{base}&page={page + 1}>; rel="next"')
+                links.append(f'<{base}&page={last}>; rel="last"')
+                headers = {**headers, "Link": ", ".join(links)}
+
+                self._send(200, live[(page - 1) * per_page : page * per_page], headers)
+
+            def _repo(self, method: str, name: str, headers: dict):
+                update = {}
+                if method == "PATCH":
+                    length = int(self.headers.get("Content-Length", 0))
+                    update = json.loads(self.rfile.read(length) or b"{}")
+
+                with fake._lock:
+                    repo = fake.repos.get(name)
+                    if repo is None or name in fake._deleted:
+                        repo = None
+                    elif method == "DELETE":
+                        fake._deleted.add(name)
+                    elif method == "PATCH":
+                        repo.update(update)
+
+                if repo is None:
+                    self._send(404, {"message": "Not Found"}, headers)
+                elif method == "DELETE":
+                    self._send(204, None, headers)
+                else:
+                    self._send(200, repo, headers)
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_PATCH(self):
+                self._handle("PATCH")
+
+            def do_DELETE(self):
+                self._handle("DELETE")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        """Shut the server down."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeGitHub":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def _rate(count: int, seconds: float) -> float:
+    return count / max(seconds, 1e-9) * 60
+
+
+def run_benchmarks(
+    repo_count: int = 20,
+    concurrency: tuple[int, ...] = (1, 4),
+    latency: float = 0.01,
+) -> list[dict]:
+    """Time fetch, process and delete against a FakeGitHub.
+
+    Returns one row per operation and concurrency level with the number of
+    repos, elapsed seconds and repos per minute. The request scheduler is
+    left unthrottled so the numbers reflect the archiver, not the pacing.
+    """
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        with FakeGitHub(tmp / "remote", latency=latency) as fake:
+            fake.add_repos(repo_count)
+
+            def manager(name: str) -> ArchiveForks:
+                work = tmp / name
+                forks = ArchiveForks(
+                    fake.username,
+                    "token",
+                    work / "work",
+                    work / "archive",
+                    api_url=fake.url,
+                )
+                forks.scheduler = RequestScheduler(
+                    forks.session, rate=1e6, burst=1e6, max_rate=1e6, per_host=64
+                )
+                forks.setup_directories()
+                return forks
+
+            forks = manager("fetch")
+            t0 = time.perf_counter()
+            repos = list(forks.fetch_forked_repos())
+            elapsed = time.perf_counter() - t0
+            rows.append(_row("fetch", 1, len(repos), elapsed))
+
+            for level in concurrency:
+                fake.reset()
+                forks = manager(f"process-{level}")
+                t0 = time.perf_counter()
+                results = forks.process_repos(
+                    repos, clone_workers=level, archive_workers=level, api_workers=level
+                )
+                elapsed = time.perf_counter() - t0
+                rows.append(_row("process", level, len(results["successful"]), elapsed))
+
+            for level in concurrency:
+                fake.reset()
+                forks = manager(f"delete-{level}")
+                t0 = time.perf_counter()
+                results = forks.delete_repos(repos, workers=level)
+                elapsed = time.perf_counter() - t0
+                rows.append(_row("delete", level, len(results["deleted"]), elapsed))
+
+    return rows
+
+
+def _row(operation: str, level: int, count: int, seconds: float) -> dict:
+    return {
+        "operation": operation,
+        "concurrency": level,
+        "repos": count,
+        "seconds": seconds,
+        "repos_per_minute": _rate(count, seconds),
+    }
+
+
+def format_benchmarks(rows: list[dict]) -> str:
+    """Render benchmark rows as a text table."""
+    lines = [f"{'operation':10} {'concurrency':>11} {'repos':>6} {'seconds':>8} {'repos/min':>10}"]
+    for row in rows:
+        lines.append(
+            f"{row['operation']:10} {row['concurrency']:>11} {row['repos']:>6} "
+            f"{row['seconds']:>8.2f} {row['repos_per_minute']:>10.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ArchiveForks against FakeGitHub")
+    parser.add_argument("--repos", type=int, default=20, help="Number of forks to serve")
+    parser.add_argument("--concurrency", default="1,4", help="Comma-separated worker counts")
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds per API request")
+    args = parser.parse_args()
+
+    if shutil.which("git") is None:
+        parser.error("git is required to build the fixture repos")
+
+    levels = tuple(int(level) for level in args.concurrency.split(","))
+    print(format_benchmarks(run_benchmarks(args.repos, levels, args.latency)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Check archives against the git tree they were made from."""
+
+import contextlib
+import hashlib
+import json
+import os
+import subprocess
+import time
+import zipfile
+import zlib
+from pathlib import Path
+
+from .store import CHUNK_SIZE, BlobStore
+
+# git ls-tree modes for regular and executable files, and for symlinks.
+# Submodules (160000) have no content in the parent repo to compare.
+FILE_MODES = {"100644", "100755"}
+LINK_MODE = "120000"
+
+
+def git_tree(clone_path: Path) -> tuple[str, dict[str, tuple[str, str]]]:
+    """Return HEAD and {path: (mode, blob sha1)} for every entry in its tree."""
+    head = subprocess.run(
+        ["git", "-C", str(clone_path), "rev-parse", "HEAD"],
+        capture_output=True,
+        text=True,
+    )
+    if head.returncode != 0:
+        raise RuntimeError(f"Not a git clone: {clone_path}")
+
+    listing = subprocess.run(
+        ["git", "-C", str(clone_path), "ls-tree", "-r", "-z", "--full-tree", "HEAD"],
+        capture_output=True,
+        check=True,
+    )
+    entries = {}
+    for record in listing.stdout.split(b"\0"):
+        if not record:
+            continue
+        meta, path = record.split(b"\t", 1)
+        mode, _, sha = meta.decode().split()
+        entries[os.fsdecode(path)] = (mode, sha)
+    return head.stdout.strip(), entries
+
+
+def _git_blob_sha(chunks, size: int) -> str:
+    digest = hashlib.sha1(f"blob {size}\0".encode())
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _zip_chunks(archive: zipfile.ZipFile, info: zipfile.ZipInfo):
+    with archive.open(info) as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+def verify_archive(archive_path: str, clone_path: str) -> dict:
+    """Compare every file in clone_path's HEAD tree against archive_path.
+
+    archive_path is either a zip or a blob store manifest. Archived content is
+    decompressed as a stream and hashed the way git hashes blobs, so nothing
+    is extracted to disk. Runs in a worker process, so it takes and returns
+    plain picklable values.
+    """
+    archive_path = Path(archive_path)
+    name = archive_path.stem
+    result = {
+        "name": name,
+        "ok": False,
+        "head": None,
+        "checked": 0,
+        "bytes": 0,
+        "missing": [],
+        "mismatched": [],
+        "error": None,
+    }
+
+    try:
+        result["head"], expected = git_tree(Path(clone_path))
+
+        with contextlib.ExitStack() as stack:
+            if archive_path.suffix == ".zip":
+                archive = stack.enter_context(zipfile.ZipFile(archive_path))
+                members = {info.filename: info for info in archive.infolist()}
+                # make_archive follows symlinks, so a zip holds the target's
+                # content rather than the link and there is nothing to compare
+                check_links = False
+
+                def content(path):
+                    info = members[path]
+                    return _zip_chunks(archive, info), info.file_size
+
+            else:
+                store = BlobStore(archive_path.parent.parent)
+                with open(archive_path) as f:
+                    members = {entry["path"]: entry for entry in json.load(f)["files"]}
+                check_links = True
+
+                def content(path):
+                    entry = members[path]
+                    if "link" in entry:
+                        target = os.fsencode(entry["link"])
+                        return iter([target]), len(target)
+                    return store.read_blob(entry["blob"]), entry["size"]
+
+            for path, (mode, sha) in sorted(expected.items()):
+                if mode not in FILE_MODES and not (check_links and mode == LINK_MODE):
+                    continue
+                if path not in members:
+                    result["missing"].append(path)
+                    continue
+
+                chunks, size = content(path)
+                if _git_blob_sha(chunks, size) != sha:
+                    result["mismatched"].append(path)
+                result["checked"] += 1
+                result["bytes"] += size
+
+        result["ok"] = not result["missing"] and not result["mismatched"]
+    except (
+        OSError,
+        RuntimeError,
+        ValueError,
+        KeyError,
+        zipfile.BadZipFile,
+        zlib.error,
+        subprocess.SubprocessError,
+    ) as e:
+        result["error"] = str(e)
+
+    return result
+
+
+def find_archives(archive_dir: Path) -> dict[str, Path]:
+    """Return {repo name: archive path} for zips and manifests in archive_dir."""
+    archives = {path.stem: path for path in sorted(archive_dir.glob("*.zip"))}
+    store = BlobStore(archive_dir)
+    for path in sorted(store.manifest_dir.glob("*.json")):
+        archives[path.stem] = path
+    return archives
+
+
+def verify_archives(
+    archive_dir: Path,
+    work_dir: Path,
+    repo_names: list[str] | None = None,
+    workers: int | None = None,
+) -> dict:
+    """Verify archives across a process pool and report throughput.
+
+    Checks every archive in archive_dir (or just repo_names) against the
+    clone of the same name in work_dir. Repos with no archive are reported
+    as failures.
+    """
+    archives = find_archives(Path(archive_dir))
+    names = sorted(archives) if repo_names is None else list(repo_names)
+
+    results = []
+    archive_paths = []
+    clone_paths = []
+    for name in names:
+        if name in archives:
+            archive_paths.append(str(archives[name]))
+            clone_paths.append(str(Path(work_dir) / name))
+        else:
+            results.append(
+                {
+                    "name": name,
+                    "ok": False,
+                    "head": None,
+                    "checked": 0,
+                    "bytes": 0,
+                    "missing": [],
+                    "mismatched": [],
+                    "error": "no archive found",
+                }
+            )
+
+    start = time.perf_counter()
+    if archive_paths:
+        # Deferred: multiprocessing costs ~10ms to import, and only verify needs it
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results.extend(pool.map(verify_archive, archive_paths, clone_paths))
+    elapsed = time.perf_counter() - start
+
+    total = sum(r["bytes"] for r in results)
+    return {
+        "results": sorted(results, key=lambda r: r["name"]),
+        "elapsed": elapsed,
+        "bytes": total,
+        "archives_per_second": len(archive_paths) / max(elapsed, 1e-9),
+        "mb_per_second": total / 1e6 / max(elapsed, 1e-9),
+    }
@@ -2,7 +2,8 @@
 
 import click
 
-from hildie.hildie_library import add, multiply
+from hildie.hildie_app.readers import FORMATS, iter_chunks
+from hildie.hildie_library import ProductAccumulator, add, add_many, multiply, multiply_many
 
 
 @click.group()
@@ -10,6 +11,39 @@ def cli():
     """A CLI tool for mathematical operations."""
 
 
+def number_chunks(numbers, input_file, fmt):
+    """Return chunks of numbers from the arguments or from --input."""
+    if numbers and input_file:
+        raise click.UsageError("Pass numbers as arguments or with --input, not both")
+    if input_file:
+        return iter_chunks(input_file, fmt)
+    if numbers:
+        return [numbers]
+    raise click.UsageError("Pass numbers as arguments or with --input")
+
+
+def input_options(func):
+    """Add the --input and --format options shared by the reduction commands."""
+    func = click.option(
+        "--format",
+        "fmt",
+        type=click.Choice(FORMATS),
+        default="text",
+        show_default=True,
+        help=(
+            "text: whitespace-separated integers; int64: raw little-endian int64; "
+            "npy: NumPy .npy file of little-endian int64"
+        ),
+    )(func)
+    return click.option(
+        "--input",
+        "input_file",
+        type=click.File("rb"),
+        default=None,
+        help="Read numbers from FILE, or - for stdin, in constant memory",
+    )(func)
+
+
 @cli.command()
 @click.argument("a", type=int)
 @click.argument("b", type=int)
@@ -29,23 +63,31 @@ def multiply_numbers(a, b):
 
 
 @cli.command()
-@click.argument("numbers", type=int, nargs=-1, required=True)
-def sum_all(numbers):
+@click.argument("numbers", type=int, nargs=-1)
+@input_options
+def sum_all(numbers, input_file, fmt):
     """Sum all provided numbers."""
     result = 0
-    for num in numbers:
-        result = add(result, num)
+    try:
+        for chunk in number_chunks(numbers, input_file, fmt):
+            result += add_many(chunk)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
     click.echo(f"Sum: {result}")
 
 
 @cli.command()
-@click.argument("numbers", type=int, nargs=-1, required=True)
-def multiply_all(numbers):
+@click.argument("numbers", type=int, nargs=-1)
+@input_options
+def multiply_all(numbers, input_file, fmt):
     """Multiply all provided numbers together."""
-    result = 1
-    for num in numbers:
-        result = multiply(result, num)
-    click.echo(f"Product: {result}")
+    products = ProductAccumulator()
+    try:
+        for chunk in number_chunks(numbers, input_file, fmt):
+            products.push(multiply_many(chunk))
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+    click.echo(f"Product: {products.result()}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,20 @@
 """A reusable library in the Python monorepo."""
 
+import functools
+import itertools
+import math
+import operator
+from collections.abc import Iterable, Sequence
+
 from hildie._version import __version__ as __version__
 
+# Largest magnitude a NumPy int64 reduction can reach without wrapping
+_INT64_MAX = 2**63 - 1
+
+# Numbers multiplied left to right with math.prod before partial products
+# are combined pairwise; products of this many small ints are still small
+LEAF_SIZE = 64
+
 
 def add(a: int, b: int) -> int:
     """Add two numbers together.
@@ -27,3 +40,179 @@ def multiply(a: int, b: int) -> int:
         The product of a and b
     """
     return a * b
+
+
+@functools.cache
+def _numpy():
+    """Return the numpy module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _as_ndarray(values):
+    """Return values as a NumPy array without copying, or None.
+
+    Only NumPy arrays and buffer-protocol objects (array.array, memoryview,
+    bytes) are converted; lists and other iterables of Python ints are summed
+    faster by the builtins than by converting them first.
+    """
+    # Check the buffer protocol first, so plain lists never import NumPy
+    try:
+        memoryview(values)
+    except TypeError:
+        return None
+    np = _numpy()
+    if np is None:
+        return None
+    return np.asarray(values)
+
+
+class ProductAccumulator:
+    """Accumulate a product with a balanced multiplication tree.
+
+    Multiplying a running product by one small number at a time makes each
+    step cost as much as the product is long, so n steps are quadratic.
+    Instead, leaves of LEAF_SIZE numbers are multiplied with math.prod, and
+    partial products are merged like a binary counter: two partials built
+    from the same number of leaves are multiplied into one. Operands stay
+    similar in size, so CPython's Karatsuba multiplication applies, and only
+    O(log n) partials are held at once.
+    """
+
+    def __init__(self):
+        self._stack: list[tuple[int, int]] = []  # (rank, partial product)
+
+    def push(self, factor: int):
+        """Multiply in one factor, typically the product of a leaf or chunk."""
+        rank = 0
+        while self._stack and self._stack[-1][0] == rank:
+            factor *= self._stack.pop()[1]
+            rank += 1
+        self._stack.append((rank, factor))
+
+    def update(self, values: Iterable[int]):
+        """Multiply in every number from values."""
+        if isinstance(values, Sequence):
+            for start in range(0, len(values), LEAF_SIZE):
+                self.push(math.prod(values[start : start + LEAF_SIZE]))
+            return
+
+        iterator = iter(values)
+        while leaf := list(itertools.islice(iterator, LEAF_SIZE)):
+            self.push(math.prod(leaf))
+
+    def result(self) -> int:
+        """Return the product of everything pushed so far (1 if nothing)."""
+        product = 1
+        # Smallest partials are on top; combine them first
+        for _, partial in reversed(self._stack):
+            product *= partial
+        return product
+
+
+def tree_product(values: Iterable[int]) -> int:
+    """Multiply values exactly with a balanced multiplication tree.
+
+    Args:
+        values: Numbers to multiply
+
+    Returns:
+        The product of values (1 if empty)
+    """
+    accumulator = ProductAccumulator()
+    accumulator.update(values)
+    return accumulator.result()
+
+
+def add_many(values: Iterable[int]) -> int:
+    """Sum a sequence of numbers in one C-level reduction.
+
+    Accepts lists, generators, array.array, memoryview or NumPy arrays.
+    Buffers and arrays are reduced with NumPy when it is installed; integer
+    results stay exact, falling back to the builtin sum when an int64
+    reduction could overflow.
+
+    Args:
+        values: Numbers to add
+
+    Returns:
+        The sum of values (0 if empty)
+    """
+    arr = _as_ndarray(values)
+    if arr is None or arr.size == 0:
+        return sum(values)
+
+    if arr.dtype.kind in "iub":
+        bound = max(abs(int(arr.min())), abs(int(arr.max())))
+        if bound * arr.size > _INT64_MAX:
+            return sum(arr.tolist())
+        return int(arr.sum(dtype="int64"))
+    if arr.dtype.kind == "f":
+        return float(arr.sum())
+    return sum(arr.tolist())
+
+
+def multiply_many(values: Iterable[int]) -> int:
+    """Multiply a sequence of numbers in one C-level reduction.
+
+    Accepts the same inputs as add_many. Integer products are exact: NumPy is
+    only used when the product provably fits in an int64; otherwise the
+    product is computed with Python integers using tree_product, which stays
+    fast for huge products.
+
+    Args:
+        values: Numbers to multiply
+
+    Returns:
+        The product of values (1 if empty)
+    """
+    arr = _as_ndarray(values)
+    if arr is None or arr.size == 0:
+        return tree_product(values)
+
+    if arr.dtype.kind in "iub":
+        if not arr.all():
+            return 0
+        bits = _numpy().log2(abs(arr.astype("float64"))).sum()
+        if bits >= 62:
+            return tree_product(arr.tolist())
+        return int(arr.prod(dtype="int64"))
+    if arr.dtype.kind == "f":
+        return float(arr.prod())
+    return tree_product(arr.tolist())
+
+
+def add_arrays(a: Sequence[int], b: Sequence[int]):
+    """Add two equal-length sequences elementwise.
+
+    If either input is a NumPy array the result is a NumPy array computed in
+    one vectorised operation. Integer sums stay exact: they are int64 when
+    every sum provably fits, and an object array of Python ints otherwise.
+    Without NumPy input the result is a list of exact Python ints.
+
+    Args:
+        a: First sequence
+        b: Second sequence
+
+    Returns:
+        The elementwise sums
+
+    Raises:
+        ValueError: If a and b differ in length
+    """
+    if len(a) != len(b):
+        raise ValueError(f"Length mismatch: {len(a)} != {len(b)}")
+
+    np = _numpy()
+    if np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray)):
+        a, b = np.asarray(a), np.asarray(b)
+        if a.size and a.dtype.kind in "iub" and b.dtype.kind in "iub":
+            bound = max(abs(int(x)) for x in (a.min(), a.max(), b.min(), b.max()))
+            if 2 * bound > _INT64_MAX:
+                return np.add(a.astype(object), b.astype(object))
+            return np.add(a, b, dtype="int64")
+        return np.add(a, b)
+    return list(map(operator.add, a, b))
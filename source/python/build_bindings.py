@@ -85,7 +85,7 @@ class BindingsBuilder:
         lib_path = self.go_dir / lib_file
 
         if not self.run(
-            ["go", "build", "-o", lib_file, "-buildmode=c-shared", "./..."],
+            ["go", "build", "-o", lib_file, "-buildmode=c-shared", "./capi"],
             cwd=self.go_dir,
             description=f"Build Go shared library ({lib_file})",
         ):